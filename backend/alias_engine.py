@@ -0,0 +1,127 @@
+import logging
+
+
+# Key used inside a trie node to hold the resolved target of the phrase ending there
+_TERMINAL = None
+
+
+class AliasEngine:
+    """
+    Alias phrases compiled into a token trie, with every alias already
+    resolved to the end of its chain.
+
+    An alias may point at another alias ("oops" -> "object-oriented
+    programming" -> "object oriented programming"); chains are followed once,
+    when the engine is built, so a rewrite never needs a second pass. A
+    document is rewritten in one left-to-right scan that replaces the longest
+    alias phrase starting at each position, so its cost depends on the
+    document length and the longest phrase, not on how many aliases there are.
+    """
+
+    def __init__(self, aliases, tokenize):
+        """
+        Args:
+            aliases (dict): Mapping of alias phrase to the skill (or alias) it stands for.
+            tokenize (callable): Function turning a phrase into a list of tokens.
+        """
+        self.tokenize = tokenize
+        self.root = {}
+        # Tokens in the longest phrase; a replacement never spans more than this
+        self.max_phrase_tokens = 0
+
+        # Phrases are compared as token tuples, the way they appear in documents
+        steps = {}
+        for phrase, target in aliases.items():
+            key = tuple(tokenize(phrase))
+            if key:
+                steps[key] = target
+
+        # Alias phrase -> the skill at the end of its chain
+        self.targets = {}
+        resolved = {}
+        for phrase in aliases:
+            key = tuple(tokenize(phrase))
+            if key:
+                self.targets[phrase] = resolved[key] = self._resolve(key, steps, resolved)
+
+        for key, target in resolved.items():
+            node = self.root
+            for token in key:
+                node = node.setdefault(token, {})
+            node[_TERMINAL] = target
+            self.max_phrase_tokens = max(self.max_phrase_tokens, len(key))
+
+        logging.debug("AliasEngine: compiled %s alias phrases", len(resolved))
+
+    def _resolve(self, key, steps, resolved):
+        # Follows key's chain until the target is not an alias itself (or only
+        # respells it, like "nodejs" -> "node.js"). A cycle stops at the last
+        # target before it repeats.
+        visited = {key}
+        target = steps[key]
+        while True:
+            next_key = tuple(self.tokenize(target))
+            if next_key not in steps or next_key == key:
+                return target
+            if next_key in resolved:
+                return resolved[next_key]
+            if next_key in visited:
+                logging.warning(f"AliasEngine: Alias cycle through '{target}'. Stopping there.")
+                return target
+            visited.add(next_key)
+            key = next_key
+            target = steps[key]
+
+    def resolve(self, phrase):
+        """
+        Returns the skill an alias phrase stands for, or the phrase itself if
+        it is not an alias.
+        """
+        node = self.root
+        for token in self.tokenize(phrase):
+            node = node.get(token)
+            if node is None:
+                return phrase
+        return node.get(_TERMINAL, phrase)
+
+    def rewrite(self, tokens):
+        """
+        Replaces every alias phrase in a token list with the skill it stands
+        for, in one pass. Where phrases overlap, the longest one starting
+        first wins.
+
+        Args:
+            tokens (list): The document tokens.
+
+        Returns:
+            list: The tokens, each replaced phrase turned into one item holding
+                  the skill name.
+        """
+        root = self.root
+        rewritten = []
+        n = len(tokens)
+        i = 0
+        while i < n:
+            node = root.get(tokens[i])
+            if node is None:
+                rewritten.append(tokens[i])
+                i += 1
+                continue
+            target = node.get(_TERMINAL)
+            end = i + 1
+            j = i + 1
+            while j < n:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if _TERMINAL in node:
+                    target = node[_TERMINAL]
+                    end = j
+            if target is None:
+                rewritten.append(tokens[i])
+                i += 1
+            else:
+                rewritten.append(target)
+                i = end
+        return rewritten
@@ -0,0 +1,108 @@
+class AlternativeGroupIndex:
+    """
+    Precomputed lookup from skill to the alternative groups containing it.
+
+    resolve() only visits the groups that the job description actually
+    mentions, instead of intersecting every group on every request.
+
+    Members of a group are fully interchangeable by default. Partial
+    equivalence is expressed with weights keyed by (required, offered) skill
+    pairs, e.g. {("java", "kotlin"): 0.8} means Kotlin counts as 0.8 of Java.
+    Weights only apply between members of the same group.
+
+    Only pairs with an explicit weight earn partial credit in scores (see
+    credits); an unweighted substitute satisfies its group without adding to
+    the matched-skill count.
+    """
+
+    def __init__(self, groups, weights=None):
+        """
+        Args:
+            groups (iterable): Sets of interchangeable skills.
+            weights (dict): (required, offered) -> credit between 0 and 1.
+        """
+        self.groups = tuple(frozenset(group) for group in groups)
+        self.weights = dict(weights or {})
+        self.skill_groups = {}
+        for group_id, group in enumerate(self.groups):
+            for skill in group:
+                self.skill_groups.setdefault(skill, []).append(group_id)
+
+    def weight(self, required, offered):
+        """
+        Returns how much of `required` a candidate with `offered` is credited with.
+        """
+        if required == offered:
+            return 1.0
+        return self.weights.get((required, offered), 1.0)
+
+    def credits(self, offered_skills):
+        """
+        Returns the partial credit a candidate earns for skills they lack.
+
+        Args:
+            offered_skills (set): The candidate's skills.
+
+        Returns:
+            dict: Required skill -> the best explicit weight of an offered
+                  member of a shared group, for every required skill that is
+                  not offered itself and has such a weight.
+        """
+        credits = {}
+        for offered in offered_skills:
+            for group_id in self.skill_groups.get(offered, ()):
+                for required in self.groups[group_id]:
+                    weight = self.weights.get((required, offered))
+                    if weight and required not in offered_skills and weight > credits.get(required, 0):
+                        credits[required] = weight
+        return credits
+
+    def groups_of(self, skills):
+        """
+        Returns the IDs of every group containing one of the skills, in group order.
+        """
+        found = set()
+        for skill in skills:
+            found.update(self.skill_groups.get(skill, ()))
+        return sorted(found)
+
+    def resolve(self, job_skills_set, resume_skills_set):
+        """
+        Resolves the groups mentioned by the job description against the candidate.
+
+        For each such group, the candidate's best-credited member is reported as
+        matched; if the candidate has none, one required member is reported as
+        missing. Groups are handled in order and a skill consumed by an earlier
+        group is not reused by a later one.
+
+        Args:
+            job_skills_set (set): Skills from the job description.
+            resume_skills_set (set): Skills from the candidate.
+
+        Returns:
+            tuple: (matched skills, missing skills, alternative matches), where
+                   alternative matches lists a dict with 'required', 'matchedWith'
+                   and 'weight' for every group satisfied by a different skill.
+        """
+        remaining = set(job_skills_set)
+        matched = set()
+        missing = set()
+        alternatives = []
+        for group_id in self.groups_of(job_skills_set):
+            group = self.groups[group_id]
+            group_in_jd = group & remaining
+            if not group_in_jd:
+                continue
+            offered = group & resume_skills_set
+            if offered:
+                # Best credit first, then prefer the exact skill the JD asked for
+                weight, _, required, skill = max(
+                    (self.weight(r, o), r == o, r, o) for r in group_in_jd for o in offered
+                )
+                matched.add(skill)
+                if required != skill:
+                    alternatives.append({"required": required, "matchedWith": skill, "weight": weight})
+            else:
+                missing.add(min(group_in_jd))
+            remaining -= group_in_jd
+        return matched, missing, alternatives
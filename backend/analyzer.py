@@ -1,7 +1,12 @@
-from skills_extractor import extract_skills,alternative_technical_skills_groups
-from skill_matcher import match_skills, get_match_level, resolve_alternative_groups
+from skills_extractor import current_snapshot, extract_skill_ids, extract_skill_ids_stream
+from skill_matcher import get_match_level
+from skill_registry import iter_bits, to_bits
+from skill_store import SKILL_CATEGORIES
 import logging
 
+import text_similarity
+from metrics import stage
+
 
 def analyze_match(job_description, resume_text, cv_text, weights):
     """
@@ -18,74 +23,408 @@ def analyze_match(job_description, resume_text, cv_text, weights):
               match percentage, match level, and missing keywords.
     """
     try:
-        job_skills = extract_skills(job_description)
-        logging.debug(f"analyze_match: job_skills---------------------------------------------------->>>>>>>>>>>>>>>>>>>>>: {job_skills}")
-        resume_skills = extract_skills(resume_text)
-        logging.debug(f"analyze_match: resume_skills------------------------------------------------->>>>>>>>>>>>>>>>>>>>>: {resume_skills}")
-        cv_skills = extract_skills(cv_text)
-        # Combine resume and CV skills
-        candidate_skills = {}
-        for category in resume_skills:
-            candidate_skills[category] = resume_skills[category] + [skill for skill in cv_skills.get(category, []) if skill not in resume_skills[category]]
-
-
-        match_result = match_skills(job_skills, candidate_skills, weights)
-
-        # Extract relevant information from match_result
-        matched_keywords = set()
-        missing_keywords = set()
+        snapshot = current_snapshot()
+        job_ids = extract_skill_ids(job_description, snapshot)
+        logging.debug("analyze_match: job_skills---------------------------------------------------->>>>>>>>>>>>>>>>>>>>>: %s", job_ids)
+        job_vector = _job_vector(job_description)
+        return _score_candidate(skill_bits(job_ids), resume_text, cv_text, weights, snapshot, job_vector)
+    except Exception as e:
+        return _error_result(e)
+
+
+def _error_result(e):
+    error_message = f"Error in analyze_match: {str(e)}"
+    logging.exception(error_message)
+    return {
+        "matchedKeywords": [],
+        "matchPercentage": 0,
+        "matchLevel": "Error",
+        "missingKeywords": [],
+        "error": error_message
+    }
+
+
+def extract_candidate_skills(resume_text, cv_text, snapshot=None):
+    """
+    Extracts skills from a resume and a CV and merges them per category.
+
+    Args:
+        resume_text (str): The resume text.
+        cv_text (str): The CV text.
+        snapshot (SkillSnapshot): Dictionaries to use (the current ones by default).
+
+    Returns:
+        dict: The combined, categorized candidate skills.
+    """
+    snapshot = snapshot or current_snapshot()
+    resume_ids = extract_skill_ids(resume_text, snapshot)
+    cv_ids = extract_skill_ids(cv_text, snapshot)
+    # Combine resume and CV skills
+    return snapshot.registry.decode_skills(merge_skills(resume_ids, cv_ids))
+
+
+def alternative_credits(candidate_skills, snapshot=None):
+    """
+    Returns the partial credit a candidate earns for skills they lack through
+    an explicitly weighted alternative (see AlternativeGroupIndex.credits), so
+    the posting index and bulk scoring credit substitutes as analyze_match does.
+
+    Args:
+        candidate_skills (dict): Categorized candidate skills.
+        snapshot (SkillSnapshot): Dictionaries to use (the current ones by default).
+
+    Returns:
+        dict: Skill name -> credit between 0 and 1.
+    """
+    snapshot = snapshot or current_snapshot()
+    registry = snapshot.registry
+    offered = set()
+    for found in registry.encode_skills(candidate_skills).values():
+        offered.update(found)
+    names = registry.names
+    return {names[required]: credit for required, credit in snapshot.alternative_index.credits(offered).items()}
+
+
+def _score_candidate(job_bits, resume_text, cv_text, weights, snapshot, job_vector=None):
+    """
+    Scores one candidate against already extracted job description skills.
+
+    Args:
+        job_bits (dict): Category -> bitset of the job description's skill IDs.
+        resume_text (str): The resume text.
+        cv_text (str): The CV text.
+        weights (dict):  A dictionary of weights for each skill category.
+        snapshot (SkillSnapshot): The dictionaries the job skills came from.
+        job_vector (dict): The job description's TF-IDF vector, if results
+                           should carry a similarity score (see _job_vector).
+
+    Returns:
+        dict: The same result fields as analyze_match.
+    """
+    resume_ids = extract_skill_ids(resume_text, snapshot)
+    logging.debug("analyze_match: resume_skills------------------------------------------------->>>>>>>>>>>>>>>>>>>>>: %s", resume_ids)
+    cv_ids = extract_skill_ids(cv_text, snapshot)
+    result = score_skill_bits(job_bits, skill_bits(resume_ids, cv_ids), snapshot)
+    if job_vector is not None:
+        with stage("similarity"):
+            text_similarity.blend(result, text_similarity.cosine(job_vector, text_similarity.text_vector(resume_text, cv_text)))
+    return result
+
+
+def _job_vector(job_description):
+    # The job description's TF-IDF vector, or None when similarity scoring is off
+    if not text_similarity.enabled():
+        return None
+    with stage("similarity"):
+        return text_similarity.text_vector(job_description)
+
+
+def add_similarity(result, job_description, resume_text, cv_text):
+    """
+    Adds the text similarity fields ('similarityPercentage' and
+    'blendedPercentage', see text_similarity.blend) to an analysis result
+    when SIMILARITY_WEIGHT is set. Results with an error are left alone.
+
+    Returns:
+        dict: The result.
+    """
+    if text_similarity.enabled() and "error" not in result:
+        with stage("similarity"):
+            similarity = text_similarity.cosine(
+                text_similarity.text_vector(job_description), text_similarity.text_vector(resume_text, cv_text)
+            )
+            text_similarity.blend(result, similarity)
+    return result
+
+
+def analyze_extracted(job_skills, resume_skills, cv_skills, weights, snapshot=None):
+    """
+    Like analyze_match, for skills that were already extracted (e.g. by the
+    ASGI server, which extracts each document separately so identical
+    documents can share one extraction). Skills unknown to the snapshot's
+    registry are ignored.
+
+    Args:
+        job_skills (dict): Categorized skills from the job description.
+        resume_skills (dict): Categorized skills from the resume.
+        cv_skills (dict): Categorized skills from the CV.
+        weights (dict):  A dictionary of weights for each skill category.
+        snapshot (SkillSnapshot): The dictionaries the skills came from.
+
+    Returns:
+        dict: The same result fields as analyze_match.
+    """
+    try:
+        snapshot = snapshot or current_snapshot()
+        registry = snapshot.registry
+        return score_skill_bits(
+            skill_bits(registry.encode_skills(job_skills)),
+            skill_bits(registry.encode_skills(resume_skills), registry.encode_skills(cv_skills)),
+            snapshot,
+        )
+    except Exception as e:
+        return _error_result(e)
+
+
+def merge_skills(resume_skills, cv_skills):
+    """
+    Combines resume and CV skills per category, resume skills first. Works on
+    lists of names and on arrays of skill IDs alike.
+    """
+    candidate_skills = {}
+    for category in resume_skills:
+        merged = resume_skills[category][:]
+        merged.extend([skill for skill in cv_skills.get(category, []) if skill not in resume_skills[category]])
+        candidate_skills[category] = merged
+    return candidate_skills
+
+
+def skill_bits(*skill_ids):
+    """
+    Combines the skill IDs of one or more documents ({category: array}, as
+    extract_skill_ids returns) into one bitset per category.
+    """
+    bits = {}
+    for document in skill_ids:
+        for category, found in document.items():
+            bits[category] = bits.get(category, 0) | to_bits(found)
+    return bits
+
+
+def score_skill_bits(job_bits, candidate_bits, snapshot):
+    """
+    Scores a candidate against a job description, both given as per-category
+    bitsets of skill IDs (see skill_bits).
+
+    Args:
+        job_bits (dict): Category -> bitset of the job description's skills.
+        candidate_bits (dict): Category -> bitset of the candidate's skills.
+        snapshot (SkillSnapshot): The dictionaries the IDs come from.
+
+    Returns:
+        dict: The same result fields as analyze_match.
+    """
+    registry = snapshot.registry
+    with stage("match_skills"):
+        matched_keywords = 0
+        missing_keywords = 0
         total_job_skills = 0
-        total_matched_skills = 0 
-        
-        logging.debug(f"analyze_match: job_skills: {job_skills}")
-        logging.debug(f"analyze_match: candidate_skills: {candidate_skills}")
-
-        for category, result in match_result.items():
-            if category != "overall_score" and category != "matchLevel":
-                job_skills_in_category = set(job_skills.get(category, []))
-                candidate_skills_in_category = set(candidate_skills.get(category, []))
-
-                matched_keywords.update(job_skills_in_category.intersection(candidate_skills_in_category))
-                missing_keywords.update(job_skills_in_category - candidate_skills_in_category)
-
-                total_job_skills += len(job_skills_in_category)
-                total_matched_skills += len(job_skills_in_category.intersection(candidate_skills_in_category))
-        
-        # Flattened sets for alt-group matching
-        job_flat = set(skill.lower() for cat in job_skills.values() for skill in cat)
-        resume_flat = set(skill.lower() for cat in candidate_skills.values() for skill in cat)
-        
-        matched_from_alternatives, missing_from_alternatives = resolve_alternative_groups(
-            job_flat, resume_flat, alternative_technical_skills_groups
+        total_matched_skills = 0
+        job_flat = 0
+        for category in SKILL_CATEGORIES:
+            job = job_bits.get(category, 0)
+            candidate = candidate_bits.get(category, 0)
+            common = job & candidate
+            matched_keywords |= common
+            missing_keywords |= job & ~candidate
+            total_job_skills += job.bit_count()
+            total_matched_skills += common.bit_count()
+            job_flat |= job
+
+    logging.debug("analyze_match: job_skills: %s", job_bits)
+    logging.debug("analyze_match: candidate_skills: %s", candidate_bits)
+
+    # Flattened sets for alt-group matching
+    resume_flat = 0
+    for bits in candidate_bits.values():
+        resume_flat |= bits
+
+    with stage("alternative_groups"):
+        alternative_index = snapshot.alternative_index
+        matched_from_alternatives, missing_from_alternatives, alternative_matches = alternative_index.resolve(
+            set(iter_bits(job_flat)), set(iter_bits(resume_flat))
         )
-        
-        
+
         # Update matched and missing keywords with alternative group results
-        matched_keywords.update(matched_from_alternatives)
-        missing_keywords.update(missing_from_alternatives)
-        
+        matched_keywords |= to_bits(matched_from_alternatives)
+        missing_keywords |= to_bits(missing_from_alternatives)
+
+        # An explicitly weighted substitute (e.g. Kotlin 0.8 of Java) earns its
+        # weight in every category the job lists the required skill under;
+        # unweighted group members add nothing, as before
+        for required, credit in alternative_index.credits(set(iter_bits(resume_flat))).items():
+            required = 1 << required
+            if job_flat & required:
+                listed = sum(1 for category in SKILL_CATEGORIES if job_bits.get(category, 0) & required)
+                total_matched_skills += credit * listed
+
         # Now remove all group members from regular missing
-        for group in alternative_technical_skills_groups:
-            if matched_from_alternatives & group:
-                missing_keywords -= group
-        
-        # Calculate match percentage
-        match_percentage = (total_matched_skills / total_job_skills) * 100 if total_job_skills else 0
-        match_level = get_match_level(match_percentage)
-
-        return {
-            "matchedKeywords": sorted(list(matched_keywords)),
-            "matchPercentage": round(match_percentage),
-            "matchLevel": match_level,
-            "missingKeywords": sorted(list(missing_keywords)),
-        }
+        for group_id in alternative_index.groups_of(matched_from_alternatives):
+            missing_keywords &= ~to_bits(alternative_index.groups[group_id])
+
+    # Calculate match percentage
+    match_percentage = (total_matched_skills / total_job_skills) * 100 if total_job_skills else 0
+    match_level = get_match_level(match_percentage)
+
+    # Skill names are only looked up here; IDs sort like the names
+    names = registry.names
+    alternative_matches.sort(key=lambda m: m["required"])
+    return {
+        "matchedKeywords": registry.decode_bits(matched_keywords),
+        "matchPercentage": round(match_percentage),
+        "matchLevel": match_level,
+        "missingKeywords": registry.decode_bits(missing_keywords),
+        "alternativeMatches": [
+            {"required": names[m["required"]], "matchedWith": names[m["matchedWith"]], "weight": m["weight"]}
+            for m in alternative_matches
+        ],
+    }
+
+
+# Candidates scored per task when analyze_many spreads a batch over workers
+BATCH_CHUNK_SIZE = 32
+
+
+def score_candidates(job_skills, candidates, weights, fingerprint, first_index=0, job_vector=None):
+    """
+    Scores a slice of a batch against job description skills that were
+    already extracted, e.g. in a worker process (see analyze_many).
+
+    Args:
+        job_skills (dict): Categorized skills of the job description.
+        candidates (list): Dicts with optional 'id', 'resumeText' and 'cvText' keys.
+        weights (dict):  A dictionary of weights for each skill category.
+        fingerprint (str): Fingerprint of the dictionaries job_skills came from.
+        first_index (int): Position of the first candidate in the whole batch,
+                           the default 'id'.
+        job_vector (dict): The job description's TF-IDF vector, if results
+                           should carry a similarity score.
+
+    Returns:
+        list: One analyze_match result with 'id' per candidate, or None if this
+              process has other dictionaries than the caller.
+    """
+    snapshot = current_snapshot()
+    if snapshot.fingerprint != fingerprint:
+        return None
+    job_bits = skill_bits(snapshot.registry.encode_skills(job_skills))
+    return _score_batch(job_bits, candidates, weights, snapshot, job_vector, first_index)
+
+
+def _score_batch(job_bits, candidates, weights, snapshot, job_vector, first_index=0):
+    scored = []
+    for index, candidate in enumerate(candidates, start=first_index):
+        try:
+            result = _score_candidate(
+                job_bits, candidate.get('resumeText', ''), candidate.get('cvText', ''), weights, snapshot, job_vector
+            )
+        except Exception as e:
+            result = _error_result(e)
+        result["id"] = candidate.get('id', index)
+        scored.append(result)
+    return scored
+
+
+def analyze_many(job_description, candidates, weights, top_k=None, offset=0, run_chunks=None,
+                 chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Scores many candidates against one job description and ranks them.
+
+    The job description is extracted once and reused for every candidate.
+    With run_chunks, candidates are scored in chunks of chunk_size, which it
+    may spread over processes (see worker_pool.map_in_pool); the results are
+    merged and ranked here.
+
+    Args:
+        job_description (str): The job description text.
+        candidates (list): Dicts with optional 'id', 'resumeText' and 'cvText' keys.
+        weights (dict):  A dictionary of weights for each skill category.
+        top_k (int): Maximum number of ranked results to return (all if None).
+        offset (int): Number of ranked results to skip, for pagination.
+        run_chunks (callable): Called as run_chunks(score_candidates, argument
+                               tuples); returns the results in order.
+        chunk_size (int): Candidates per call of score_candidates.
+
+    Returns:
+        dict: 'total' candidates scored, the 'offset' used and the ranked 'results'.
+              Each result carries the analyze_match fields plus 'id' and 'rank'.
+    """
+    try:
+        snapshot = current_snapshot()
+        job_ids = extract_skill_ids(job_description, snapshot)
+        job_bits = skill_bits(job_ids)
+        job_vector = _job_vector(job_description)
+    except Exception as e:
+        error = _error_result(e)
+        return {"total": 0, "offset": offset, "results": [], "error": error["error"]}
+
+    if run_chunks is None:
+        scored = _score_batch(job_bits, candidates, weights, snapshot, job_vector)
+    else:
+        job_skills = snapshot.registry.decode_skills(job_ids)
+        starts = range(0, len(candidates), chunk_size)
+        chunks = run_chunks(score_candidates, [
+            (job_skills, candidates[start:start + chunk_size], weights, snapshot.fingerprint, start, job_vector)
+            for start in starts
+        ])
+        scored = []
+        for start, chunk in zip(starts, chunks):
+            if chunk is None:
+                # The worker had other dictionaries; score this chunk here instead
+                chunk = _score_batch(job_bits, candidates[start:start + chunk_size], weights, snapshot, job_vector, start)
+            scored.extend(chunk)
+
+    # Stable sort keeps submission order among equal scores
+    scored.sort(key=lambda r: r.get("blendedPercentage", r["matchPercentage"]), reverse=True)
+    for rank, result in enumerate(scored, start=1):
+        result["rank"] = rank
+
+    end = None if top_k is None else offset + top_k
+    return {"total": len(scored), "offset": offset, "results": scored[offset:end]}
+
+
+def rank_postings(resume_text, cv_text, job_index, weights, top_k=10):
+    """
+    Finds the indexed job postings that best fit a candidate.
+
+    Args:
+        resume_text (str): The resume text.
+        cv_text (str): The CV text.
+        job_index (JobIndex): The posting index to search.
+        weights (dict):  A dictionary of weights for each skill category.
+        top_k (int): Number of postings to return.
+
+    Returns:
+        list: The best postings, as returned by JobIndex.query.
+    """
+    snapshot = current_snapshot()
+    candidate_skills = extract_candidate_skills(resume_text, cv_text, snapshot)
+    credits = alternative_credits(candidate_skills, snapshot)
+    return job_index.query(candidate_skills, weights, top_k=top_k, credits=credits)
+
+
+def analyze_match_stream(job_description, resume_chunks, cv_chunks, weights, fuzzy=None):
+    """
+    Like analyze_match, but reads the resume and CV as streams of text pieces
+    so arbitrarily large documents are never held in memory at once.
+
+    Args:
+        job_description (str): The job description text.
+        resume_chunks (iterable): Pieces of the resume text (may be empty).
+        cv_chunks (iterable): Pieces of the CV text (may be empty).
+        weights (dict):  A dictionary of weights for each skill category.
+        fuzzy (bool): Also match variants of skills in every document
+                      (SKILL_MATCH_MODE by default).
+
+    Returns:
+        dict: The same result fields as analyze_match.
+    """
+    try:
+        snapshot = current_snapshot()
+        job_bits = skill_bits(extract_skill_ids(job_description, snapshot, fuzzy))
+        job_vector = _job_vector(job_description)
+        if job_vector is not None:
+            # Count the candidate's terms as the pieces go by
+            counter = text_similarity.TermCounter(text_similarity.get_idf_table().dimension)
+            resume_chunks, cv_chunks = counter.tap(resume_chunks), counter.tap(cv_chunks)
+        candidate_bits = skill_bits(
+            extract_skill_ids_stream(resume_chunks, snapshot, fuzzy),
+            extract_skill_ids_stream(cv_chunks, snapshot, fuzzy),
+        )
+        result = score_skill_bits(job_bits, candidate_bits, snapshot)
+        if job_vector is not None:
+            with stage("similarity"):
+                text_similarity.blend(result, text_similarity.cosine(job_vector, counter.vector()))
+        return result
     except Exception as e:
-        error_message = f"Error in analyze_match: {str(e)}"
-        logging.exception(error_message)
-        return {
-            "matchedKeywords": [],
-            "matchPercentage": 0,
-            "matchLevel": "Error",
-            "missingKeywords": [],
-            "error": error_message
-        }
+        return _error_result(e)
@@ -1,27 +1,68 @@
 # This is a Flask application that analyzes job descriptions and resumes/CVs to match skills.
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g, Response
 from flask_cors import CORS
+import json
 import logging
+import os
+import time
 
-from analyzer import analyze_match
-from skills_extractor import programming_skills, technical_skills, soft_skills, management_skills, alternative_technical_skills_groups, skill_aliases
+import metrics
 
+from analyzer import alternative_credits, analyze_match, analyze_many, analyze_match_stream, extract_candidate_skills
+from document_reader import UnsupportedDocument, iter_document_text
+from document_session import SESSION_DOCUMENTS, session_store
+from job_index import JobIndex
+from skill_store import SKILL_WEIGHTS
+from skills_extractor import extract_skills, skill_cache, skill_store
+from worker_pool import get_pool, map_in_pool, num_workers, restart_pool, run_in_pool
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG,  # Set to DEBUG for detailed logging
+
+# Configure logging (set LOG_LEVEL=DEBUG for detailed logging)
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=['X-Analyzer-Trace'])
+
+# Clients send this header (any value) to get per-stage timings back in the same header
+TRACE_HEADER = 'X-Analyzer-Trace'
+
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    if TRACE_HEADER in request.headers:
+        g.trace_token = metrics.start_trace()
+
+
+@app.after_request
+def record_request_time(response):
+    metrics.request_seconds.observe(request.url_rule.rule if request.url_rule else 'unknown',
+                                    time.perf_counter() - g.request_start)
+    token = g.pop('trace_token', None)
+    if token is not None:
+        response.headers[TRACE_HEADER] = json.dumps(metrics.finish_trace(token), separators=(',', ':'))
+    return response
+
 
+@app.teardown_request
+def discard_trace(exc):
+    # after_request is skipped on unhandled errors; don't leak the trace into this thread's next request
+    token = g.pop('trace_token', None)
+    if token is not None:
+        metrics.finish_trace(token)
 
-# Define skill category weights (can be adjusted)
-SKILL_WEIGHTS = {
-    "programming_skills": 0.3,
-    "technical_skills": 0.3,
-    "soft_skills": 0.2,
-    "management_skills": 0.2,
-}
+
+# Inverted index of stored job postings, opened on first use
+JOB_INDEX_PATH = os.environ.get('JOB_INDEX_PATH', 'job_index.sqlite3')
+_job_index = None
+
+
+def get_job_index():
+    global _job_index
+    if _job_index is None:
+        _job_index = JobIndex(JOB_INDEX_PATH)
+    return _job_index
 
 @app.route('/analyze', methods=['POST'])
 def analyze():
@@ -44,13 +85,266 @@ def analyze():
         if not job_description or not (resume_text or cv_text):
             return jsonify({'error': 'Both job description and either resume or CV are required.'}), 400
 
-        analysis_result = analyze_match(job_description, resume_text, cv_text, SKILL_WEIGHTS)
+        analysis_result = run_in_pool(analyze_match, job_description, resume_text, cv_text, SKILL_WEIGHTS)
         return jsonify(analysis_result), 200
     except Exception as e:
         error_message = f"Error in /analyze: {str(e)}"
         logging.exception(error_message)
         return jsonify({'error': error_message}), 500
     
+@app.route('/analyze/upload', methods=['POST'])
+def analyze_upload():
+    """
+    Endpoint to analyze an uploaded resume and/or CV (multipart/form-data).
+    Expects a 'jobDescription' form field and 'resume' and/or 'cv' files
+    (.txt, .docx or .pdf). The files are read in chunks, so large documents
+    are never held in memory at once. An optional 'matchMode' field ('exact'
+    or 'fuzzy') overrides SKILL_MATCH_MODE for this request.
+    """
+    try:
+        job_description = request.form.get('jobDescription', '')
+        resume_file = request.files.get('resume')
+        cv_file = request.files.get('cv')
+        match_mode = request.form.get('matchMode', '').strip().lower()
+        if not job_description or not (resume_file or cv_file):
+            return jsonify({'error': 'Both job description and either a resume or CV file are required.'}), 400
+        if match_mode not in ('', 'exact', 'fuzzy'):
+            return jsonify({'error': "matchMode must be 'exact' or 'fuzzy'."}), 400
+
+        try:
+            resume_chunks = iter_document_text(resume_file.filename, resume_file.stream) if resume_file else []
+            cv_chunks = iter_document_text(cv_file.filename, cv_file.stream) if cv_file else []
+        except UnsupportedDocument as e:
+            return jsonify({'error': str(e)}), 400
+
+        # Streams cannot be sent to worker processes, so this runs in the request thread
+        fuzzy = match_mode == 'fuzzy' if match_mode else None
+        analysis_result = analyze_match_stream(job_description, resume_chunks, cv_chunks, SKILL_WEIGHTS, fuzzy)
+        return jsonify(analysis_result), 200
+    except Exception as e:
+        error_message = f"Error in /analyze/upload: {str(e)}"
+        logging.exception(error_message)
+        return jsonify({'error': error_message}), 500
+
+@app.route('/analyze/batch', methods=['POST'])
+def analyze_batch():
+    """
+    Endpoint to rank many resumes/CVs against one job description.
+    Expects 'jobDescription' and a 'candidates' list of {id, resumeText, cvText},
+    with optional 'topK' and 'offset' for pagination.
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'Invalid request: Expected JSON data.'}), 400
+
+        job_description = data.get('jobDescription', '')
+        candidates = data.get('candidates', [])
+        if not job_description or not isinstance(candidates, list) or not candidates:
+            return jsonify({'error': 'A job description and a non-empty candidates list are required.'}), 400
+        if not all(isinstance(c, dict) for c in candidates):
+            return jsonify({'error': 'Each candidate must be an object.'}), 400
+
+        try:
+            top_k = data.get('topK')
+            top_k = int(top_k) if top_k is not None else None
+            offset = int(data.get('offset', 0))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'topK and offset must be integers.'}), 400
+        if offset < 0 or (top_k is not None and top_k < 0):
+            return jsonify({'error': 'topK and offset must not be negative.'}), 400
+
+        # The job description is extracted here once; with a worker pool the
+        # candidates are scored in chunks across it and ranked here
+        batch_result = analyze_many(
+            job_description, candidates, SKILL_WEIGHTS, top_k=top_k, offset=offset,
+            run_chunks=map_in_pool if num_workers > 0 else None,
+        )
+        return jsonify(batch_result), 200
+    except Exception as e:
+        error_message = f"Error in /analyze/batch: {str(e)}"
+        logging.exception(error_message)
+        return jsonify({'error': error_message}), 500
+
+@app.route('/postings', methods=['POST'])
+def add_posting():
+    """
+    Endpoint to add (or replace) a job posting in the index.
+    Expects 'id' and 'jobDescription', with an optional 'title'.
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'Invalid request: Expected JSON data.'}), 400
+
+        posting_id = data.get('id')
+        job_description = data.get('jobDescription', '')
+        if posting_id is None or posting_id == '' or not job_description:
+            return jsonify({'error': 'Both posting id and job description are required.'}), 400
+
+        job_skills = run_in_pool(extract_skills, job_description)
+        get_job_index().add_skills(posting_id, job_skills, data.get('title'))
+        return jsonify({'id': str(posting_id), 'skills': job_skills}), 200
+    except Exception as e:
+        error_message = f"Error in /postings: {str(e)}"
+        logging.exception(error_message)
+        return jsonify({'error': error_message}), 500
+
+@app.route('/postings/<posting_id>', methods=['DELETE'])
+def remove_posting(posting_id):
+    """
+    Endpoint to remove a job posting from the index.
+    """
+    try:
+        if not get_job_index().remove_posting(posting_id):
+            return jsonify({'error': 'Posting not found.'}), 404
+        return jsonify({'message': 'Posting removed.'}), 200
+    except Exception as e:
+        error_message = f"Error in /postings: {str(e)}"
+        logging.exception(error_message)
+        return jsonify({'error': error_message}), 500
+
+@app.route('/postings/match', methods=['POST'])
+def match_postings():
+    """
+    Endpoint to find the indexed job postings that best fit a resume/CV.
+    Expects 'resumeText' and/or 'cvText', with an optional 'topK'.
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'Invalid request: Expected JSON data.'}), 400
+
+        resume_text = data.get('resumeText', '')
+        cv_text = data.get('cvText', '')
+        if not (resume_text or cv_text):
+            return jsonify({'error': 'Either resume or CV is required.'}), 400
+        try:
+            top_k = int(data.get('topK', 10))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'topK must be an integer.'}), 400
+
+        candidate_skills = run_in_pool(extract_candidate_skills, resume_text, cv_text)
+        credits = alternative_credits(candidate_skills)
+        results = get_job_index().query(candidate_skills, SKILL_WEIGHTS, top_k=top_k, credits=credits)
+        return jsonify({'results': results}), 200
+    except Exception as e:
+        error_message = f"Error in /postings/match: {str(e)}"
+        logging.exception(error_message)
+        return jsonify({'error': error_message}), 500
+
+@app.route('/sessions', methods=['POST'])
+def create_session():
+    """
+    Endpoint to start an incremental analysis session, for clients that
+    re-analyze while the candidate edits. Expects 'jobDescription' and
+    optional 'resumeText' and 'cvText'. Returns the analysis with a 'sessionId'.
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'Invalid request: Expected JSON data.'}), 400
+
+        job_description = data.get('jobDescription', '')
+        if not job_description:
+            return jsonify({'error': 'A job description is required.'}), 400
+        documents = {name: data.get(field, '') for name, field in SESSION_DOCUMENTS.items()}
+        if not all(isinstance(text, str) for text in documents.values()):
+            return jsonify({'error': 'resumeText and cvText must be strings.'}), 400
+
+        session = session_store.create(job_description, documents, SKILL_WEIGHTS)
+        with session.lock:
+            return jsonify(session.result()), 200
+    except Exception as e:
+        error_message = f"Error in /sessions: {str(e)}"
+        logging.exception(error_message)
+        return jsonify({'error': error_message}), 500
+
+@app.route('/sessions/<session_id>', methods=['PATCH'])
+def edit_session(session_id):
+    """
+    Endpoint to apply edits to a session document and get the updated analysis.
+    Expects 'document' ('resume' or 'cv') and 'edits', a list of
+    {start, end, text} replacing characters start to end of the current text,
+    applied in order. An optional 'version' is checked against the session's
+    current version (409 if another edit came first).
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'Invalid request: Expected JSON data.'}), 400
+
+        session = session_store.get(session_id)
+        if session is None:
+            return jsonify({'error': 'Session not found.'}), 404
+        edits = data.get('edits')
+        if not isinstance(edits, list):
+            return jsonify({'error': 'edits must be a list of {start, end, text}.'}), 400
+
+        with session.lock:
+            if 'version' in data and data['version'] != session.version:
+                return jsonify({'error': 'Session was modified by another request.', 'version': session.version}), 409
+            try:
+                session.edit(data.get('document'), edits)
+            except ValueError as e:
+                return jsonify({'error': str(e), 'version': session.version}), 400
+            return jsonify(session.result()), 200
+    except Exception as e:
+        error_message = f"Error in /sessions: {str(e)}"
+        logging.exception(error_message)
+        return jsonify({'error': error_message}), 500
+
+@app.route('/sessions/<session_id>', methods=['GET'])
+def get_session(session_id):
+    """
+    Endpoint returning the current analysis of a session.
+    """
+    session = session_store.get(session_id)
+    if session is None:
+        return jsonify({'error': 'Session not found.'}), 404
+    with session.lock:
+        return jsonify(session.result()), 200
+
+@app.route('/sessions/<session_id>', methods=['DELETE'])
+def delete_session(session_id):
+    """
+    Endpoint to end a session.
+    """
+    if not session_store.delete(session_id):
+        return jsonify({'error': 'Session not found.'}), 404
+    return jsonify({'message': 'Session removed.'}), 200
+
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """
+    Endpoint exposing the skill cache counters of this process, for sizing it.
+    """
+    return jsonify(skill_cache.stats()), 200
+
+@app.route('/skills/version', methods=['GET'])
+def skills_version():
+    """
+    Endpoint exposing the current skill dictionary version.
+    """
+    snapshot = skill_store.snapshot()
+    return jsonify({'version': snapshot.version, 'fingerprint': snapshot.fingerprint}), 200
+
+@app.route('/metrics', methods=['GET'])
+def metrics_page():
+    """
+    Endpoint exposing stage latencies, request latencies, document sizes and
+    cache counters in the Prometheus text format.
+    """
+    cache = skill_cache.stats()
+    extra = [
+        ('analyzer_skill_cache_hits_total', 'counter', 'Skill cache hits in memory.', cache['hits']),
+        ('analyzer_skill_cache_disk_hits_total', 'counter', 'Skill cache hits on disk.', cache['diskHits']),
+        ('analyzer_skill_cache_misses_total', 'counter', 'Skill cache misses.', cache['misses']),
+        ('analyzer_skill_cache_evictions_total', 'counter', 'Skill cache LRU evictions.', cache['evictions']),
+        ('analyzer_skill_dictionary_version', 'gauge', 'Current skill dictionary version.', skill_store.version),
+    ]
+    return Response(metrics.render(extra), mimetype='text/plain; version=0.0.4')
+
 @app.route('/feedback', methods=['POST'])
 def feedback():
     try:
@@ -60,38 +354,26 @@ def feedback():
 
         category = data.get('category')
         skill = data.get('skill', '').lower()
+        original = data.get('original', '').lower()
 
-        if category == 'programming_skills':
-            programming_skills.add(skill)
-        elif category == 'technical_skills':
-            technical_skills.add(skill)
-        elif category == 'soft_skills':
-            soft_skills.add(skill)
-        elif category == 'management_skills':
-            management_skills.add(skill)
-        elif category == 'alternative_technical_skills_groups':
-            found = False
-            for group in alternative_technical_skills_groups:
-                if skill in group:
-                    found = True
-                    break
-            if not found:
-                alternative_technical_skills_groups.append({skill})
-        elif category == 'skill_aliases':
-            original = data.get('original', '').lower()
-            if original:
-                skill_aliases[original] = skill
-        else:
+        try:
+            version = skill_store.apply_feedback(category, skill, original)
+        except ValueError:
             return jsonify({'error': 'Invalid skill category.'}), 400
 
-        return jsonify({'message': 'Feedback received and skills updated.'}), 200
+        if not skill_store.persistent:
+            # Workers only see in-memory changes if they are forked again
+            restart_pool()
+        return jsonify({'message': 'Feedback received and skills updated.', 'version': version}), 200
 
     except Exception as e:
         logging.exception("Error in /feedback")
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
-    app.run(host="0.0.0.0", port=5000, debug=False)
+    # Start the worker processes (if ANALYZER_WORKERS is set) before serving
+    get_pool()
+    app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
     # Set debug=True for development; set to False in production
     # Use a production server like Gunicorn or uWSGI for deployment
     # set debug=False in production for security reasons
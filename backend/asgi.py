@@ -0,0 +1,349 @@
+# ASGI entry point serving the same routes as the Flask app in app.py. Run it with
+#   uvicorn asgi:app --host 0.0.0.0 --port 5000
+# or `python asgi.py`. /analyze and /postings/match are handled on the event loop:
+# extraction runs in an executor (the worker pool when ANALYZER_WORKERS is set) and
+# concurrent requests for the same text share one extraction. Every other route is
+# passed to the Flask app in a thread.
+import asyncio
+import functools
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import metrics
+import text_similarity
+
+from analyzer import add_similarity, alternative_credits, analyze_extracted, merge_skills
+from app import SKILL_WEIGHTS, TRACE_HEADER, app as flask_app, get_job_index
+from skill_cache import SkillCache
+from skills_extractor import current_snapshot, extract_skills, extract_skills_for
+from worker_pool import get_pool, submit
+
+
+# Requests admitted at once (running or waiting for the executor); more get a 429
+MAX_PENDING = int(os.environ.get('ASGI_MAX_PENDING', '512'))
+# Seconds a request may take before it is answered with a 504
+REQUEST_TIMEOUT = float(os.environ.get('ASGI_REQUEST_TIMEOUT', '30'))
+# Threads for extraction (without a worker pool), index queries and Flask routes
+THREADS = int(os.environ.get('ASGI_THREADS', str(min(32, (os.cpu_count() or 1) + 4))))
+# Request bodies passed to Flask are kept in memory up to this size, then spooled to disk
+SPOOL_SIZE = 1024 * 1024
+
+
+class ExtractionCoalescer:
+    """
+    Runs extract_skills in an executor, sharing one run between all concurrent
+    requests for the same text under the same dictionaries. Results always come
+    from the request's snapshot, even when a worker process has not caught up
+    with (or is ahead of) it.
+    """
+
+    def __init__(self, executor):
+        self.executor = executor
+        self._inflight = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def extract(self, text, snapshot):
+        """
+        Returns the categorized skills of text, as extract_skills would.
+        """
+        if not isinstance(text, str):
+            # extract_skills logs it and returns no skills, as the Flask routes do
+            return extract_skills(text, snapshot)
+        key = SkillCache.key(text, snapshot.fingerprint)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._extract(text, snapshot))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._done, key))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        # A waiter that hits its deadline must not cancel the run others are waiting on
+        return await asyncio.shield(task)
+
+    def _done(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Marks the exception as retrieved even if every waiter has gone
+            task.exception()
+
+    async def _extract(self, text, snapshot):
+        loop = asyncio.get_running_loop()
+        # Snapshots cannot be pickled; workers check their own copy has the same fingerprint
+        future = submit(metrics.collect, extract_skills_for, text, snapshot.fingerprint)
+        if future is not None:
+            result, samples = await asyncio.wrap_future(future)
+            metrics.replay(samples)
+            if result is not None:
+                return result
+            # The worker has other dictionaries (a /feedback change one of them
+            # has not seen yet, or this request's snapshot predates it)
+        result, samples = await loop.run_in_executor(self.executor, metrics.collect, extract_skills, text, snapshot)
+        metrics.replay(samples)
+        return result
+
+
+def _wsgi_environ(scope, body, length):
+    server = scope.get('server') or ('localhost', 80)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', ''),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': str(server[0]),
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': body,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    if scope.get('client'):
+        environ['REMOTE_ADDR'], environ['REMOTE_PORT'] = scope['client'][0], str(scope['client'][1])
+    for name, value in scope['headers']:
+        name = name.decode('latin-1')
+        value = value.decode('latin-1')
+        if name == 'content-type':
+            key = 'CONTENT_TYPE'
+        elif name == 'content-length':
+            continue
+        else:
+            key = 'HTTP_' + name.upper().replace('-', '_')
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    # The body has been read in full, so its real length replaces any chunked encoding
+    environ['CONTENT_LENGTH'] = str(length)
+    return environ
+
+
+def _run_wsgi(wsgi_app, environ):
+    chunks = []
+    response = {}
+
+    def start_response(status, headers, exc_info=None):
+        response['status'] = int(status.split(' ', 1)[0])
+        response['headers'] = headers
+        return chunks.append
+
+    result = wsgi_app(environ, start_response)
+    try:
+        chunks.extend(result)
+    finally:
+        if hasattr(result, 'close'):
+            result.close()
+    return response['status'], response['headers'], b''.join(chunks)
+
+
+class AnalyzerASGI:
+    """
+    ASGI application with the routes of the Flask app, adding request
+    coalescing, admission control (429 once MAX_PENDING requests are in
+    flight) and a per-request deadline (504).
+    """
+
+    def __init__(self, wsgi_app, max_pending=MAX_PENDING, timeout=REQUEST_TIMEOUT, threads=THREADS):
+        self.wsgi_app = wsgi_app
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='asgi')
+        self.coalescer = ExtractionCoalescer(self.executor)
+        self.pending = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.routes = {
+            ('POST', '/analyze'): self.analyze,
+            ('POST', '/postings/match'): self.match_postings,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            await _send_json(send, 429, {'error': 'Server busy, please retry.'}, [(b'retry-after', b'1')])
+            return
+        self.pending += 1
+        started = []
+
+        async def tracked_send(message):
+            if message['type'] == 'http.response.start':
+                started.append(True)
+            await send(message)
+
+        try:
+            await asyncio.wait_for(self._dispatch(scope, receive, tracked_send), self.timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            logging.warning(f"asgi: {scope['method']} {scope['path']} exceeded the {self.timeout}s deadline")
+            if not started:
+                await _send_json(send, 504, {'error': 'Request deadline exceeded.'})
+        finally:
+            self.pending -= 1
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                # Fork the worker processes (if ANALYZER_WORKERS is set) before serving
+                get_pool()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _dispatch(self, scope, receive, send):
+        handler = self.routes.get((scope['method'], scope['path']))
+        if handler is None:
+            await self._call_flask(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        headers = dict(scope['headers'])
+        trace_token = metrics.start_trace() if TRACE_HEADER.lower().encode() in headers else None
+        try:
+            try:
+                data = json.loads(await _read_body(receive) or b'null')
+            except ValueError:
+                data = None
+            status, payload = await handler(data)
+        except Exception as e:
+            error_message = f"Error in {scope['path']}: {str(e)}"
+            logging.exception(error_message)
+            status, payload = 500, {'error': error_message}
+        finally:
+            trace = metrics.finish_trace(trace_token) if trace_token is not None else None
+
+        extra = []
+        if trace is not None:
+            extra.append((TRACE_HEADER.encode(), json.dumps(trace, separators=(',', ':')).encode()))
+        if b'origin' in headers:
+            # Same headers Flask-CORS adds to the other routes
+            extra.append((b'access-control-allow-origin', headers[b'origin']))
+            extra.append((b'access-control-expose-headers', TRACE_HEADER.encode()))
+            extra.append((b'vary', b'Origin'))
+        await _send_json(send, status, payload, extra)
+        metrics.request_seconds.observe(scope['path'], time.perf_counter() - start)
+
+    async def _call_flask(self, scope, receive, send):
+        body = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+        try:
+            length = 0
+            while True:
+                message = await receive()
+                if message['type'] == 'http.disconnect':
+                    return
+                chunk = message.get('body', b'')
+                body.write(chunk)
+                length += len(chunk)
+                if not message.get('more_body'):
+                    break
+            body.seek(0)
+            environ = _wsgi_environ(scope, body, length)
+            loop = asyncio.get_running_loop()
+            status, headers, content = await loop.run_in_executor(self.executor, _run_wsgi, self.wsgi_app, environ)
+        finally:
+            body.close()
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers],
+        })
+        await send({'type': 'http.response.body', 'body': content})
+
+    async def analyze(self, data):
+        """
+        Same as POST /analyze in app.py.
+        """
+        if not data:
+            logging.error("/analyze:  data is None or empty. Returning error")
+            return 400, {'error': 'Invalid request: Expected JSON data.'}
+
+        job_description = data.get('jobDescription', '')
+        resume_text = data.get('resumeText', '')
+        cv_text = data.get('cvText', '')
+        if not job_description or not (resume_text or cv_text):
+            return 400, {'error': 'Both job description and either resume or CV are required.'}
+
+        snapshot = current_snapshot()
+        job_skills, resume_skills, cv_skills = await asyncio.gather(
+            self.coalescer.extract(job_description, snapshot),
+            self.coalescer.extract(resume_text, snapshot),
+            self.coalescer.extract(cv_text, snapshot),
+        )
+        result = analyze_extracted(job_skills, resume_skills, cv_skills, SKILL_WEIGHTS, snapshot)
+        if text_similarity.enabled():
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, add_similarity, result, job_description, resume_text, cv_text)
+        return 200, result
+
+    async def match_postings(self, data):
+        """
+        Same as POST /postings/match in app.py.
+        """
+        if not data:
+            return 400, {'error': 'Invalid request: Expected JSON data.'}
+
+        resume_text = data.get('resumeText', '')
+        cv_text = data.get('cvText', '')
+        if not (resume_text or cv_text):
+            return 400, {'error': 'Either resume or CV is required.'}
+        try:
+            top_k = int(data.get('topK', 10))
+        except (TypeError, ValueError):
+            return 400, {'error': 'topK must be an integer.'}
+
+        snapshot = current_snapshot()
+        resume_skills, cv_skills = await asyncio.gather(
+            self.coalescer.extract(resume_text, snapshot),
+            self.coalescer.extract(cv_text, snapshot),
+        )
+        candidate_skills = merge_skills(resume_skills, cv_skills)
+        credits = alternative_credits(candidate_skills, snapshot)
+        loop = asyncio.get_running_loop()
+        query = functools.partial(get_job_index().query, candidate_skills, SKILL_WEIGHTS, top_k=top_k, credits=credits)
+        return 200, {'results': await loop.run_in_executor(self.executor, query)}
+
+
+async def _read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            break
+    return b''.join(chunks)
+
+
+async def _send_json(send, status, payload, headers=()):
+    body = json.dumps(payload).encode()
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode()), *headers],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+app = AnalyzerASGI(flask_app)
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=5000)
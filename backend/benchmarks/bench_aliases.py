@@ -0,0 +1,66 @@
+# Compares the compiled AliasEngine (alias_engine.py) with the alias scan
+# preprocess_text used before it, as the number of aliases grows.
+# Run from the backend folder:  python benchmarks/bench_aliases.py
+import os
+import sys
+import time
+
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+os.environ['SKILL_CACHE_SIZE'] = '0'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import Corpus, build_dictionary
+
+from alias_engine import AliasEngine
+from tokenizer import tokenize
+
+
+def legacy_aliases(tokens, aliases):
+    """The original preprocess_text alias step: one substring scan per alias, then a token lookup."""
+    tokens = list(tokens)
+    joined_text = " ".join(tokens)
+    for phrase, alias in aliases.items():
+        if phrase in joined_text:
+            tokens.append(alias)
+    return [aliases.get(tok, tok) for tok in tokens]
+
+
+def alias_phrase(index):
+    return " ".join([f"zqa{index:05d}"] + ["dev", "stack"][:index % 3])
+
+
+def with_aliases(dictionary, count):
+    # Synthetic aliases of one to three words, a tenth of them chained to the previous alias
+    aliases = dict(dictionary["aliases"])
+    skills = sorted(set().union(*dictionary["categories"].values()))
+    for index in range(count - len(aliases)):
+        aliases[alias_phrase(index)] = alias_phrase(index - 1) if index % 10 == 9 else skills[index % len(skills)]
+    return aliases
+
+
+def timeit(fn, documents):
+    start = time.perf_counter()
+    for tokens in documents:
+        fn(tokens)
+    return (time.perf_counter() - start) / len(documents) * 1000
+
+
+def main():
+    dictionary = build_dictionary()
+    corpus = Corpus(dictionary, length=500, skill_density=0.1, alias_rate=0.4)
+    documents = [tokenize(text) for text in corpus.documents(50)]
+
+    print(f"{'aliases':>8} {'build ms':>9} {'scan ms/doc':>12} {'engine ms/doc':>14} {'speedup':>8}")
+    for count in (10, 100, 1000, 10000):
+        aliases = with_aliases(dictionary, count)
+        start = time.perf_counter()
+        engine = AliasEngine(aliases, tokenize)
+        build = (time.perf_counter() - start) * 1000
+        scan = timeit(lambda tokens: legacy_aliases(tokens, aliases), documents)
+        compiled = timeit(engine.rewrite, documents)
+        print(f"{len(aliases):>8} {build:>9.1f} {scan:>12.3f} {compiled:>14.3f} {scan / compiled:>7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# Compares resolving alternative groups with a scan over every group (the previous
+# resolve_alternative_groups) against the precomputed AlternativeGroupIndex.
+# It first checks how substitutes are credited in scores.
+# Run from the backend folder:  python benchmarks/bench_alternative_groups.py [num_groups]
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+os.environ['SKILL_CACHE_SIZE'] = '0'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alternative_index import AlternativeGroupIndex
+from analyzer import alternative_credits, analyze_match, extract_candidate_skills
+from job_index import JobIndex
+from skill_store import SKILL_CATEGORIES
+
+# (job description, resume) -> matchPercentage. Only pairs with an explicit
+# weight (Kotlin = 0.8 of Java) earn credit; other group members satisfy the
+# group without adding to the matched count.
+CREDIT_CASES = {
+    ("AWS", "Azure"): 0,
+    ("React", "Angular"): 0,
+    ("MySQL and Docker", "MongoDB and Docker"): 50,
+    ("Java and Docker", "Kotlin and Docker"): 90,
+    ("Java and Docker", "Java, Kotlin and Docker"): 100,
+}
+
+
+def legacy_resolve(job_skills_set, resume_skills_set, alternative_groups):
+    matched_keywords = set()
+    skipped_keywords = set()
+    for group in alternative_groups:
+        group_in_jd = group & job_skills_set
+        if not group_in_jd:
+            continue
+        if group & resume_skills_set:
+            matched_keywords.add(next(iter(group & resume_skills_set)))
+        else:
+            skipped_keywords.add(next(iter(group_in_jd)))
+        job_skills_set -= group_in_jd
+    # analyze_match then walked every group again to clean up missing keywords
+    for group in alternative_groups:
+        if matched_keywords & group:
+            skipped_keywords -= group
+    return matched_keywords, skipped_keywords
+
+
+def check_credit_scoring():
+    """
+    Asserts the CREDIT_CASES scores, and that /postings/match credits the
+    same substitutes: only the weighted pair changes a posting's score.
+    """
+    weights = {category: 1 for category in SKILL_CATEGORIES}
+    for (job_description, resume), expected in CREDIT_CASES.items():
+        score = analyze_match(job_description, resume, "", weights)["matchPercentage"]
+        assert score == expected, f"{job_description!r} vs {resume!r}: {score}, expected {expected}"
+
+        index = JobIndex(':memory:')
+        index.add_posting("job", job_description)
+        candidate = extract_candidate_skills(resume, "")
+        credits = alternative_credits(candidate)
+        plain = index.query(candidate, weights)
+        credited = index.query(candidate, weights, credits=credits)
+        if credits:
+            # Kotlin for Java: 0.8 of the posting's one programming skill
+            assert credits == {"java": 0.8}, credits
+            assert credited[0]["scores"]["programming_skills"] == 80.0, credited
+        else:
+            assert credited == plain, f"{job_description!r} vs {resume!r}: {credited} != {plain}"
+        index.close()
+    print(f"credit scoring: {len(CREDIT_CASES)} cases ok")
+
+
+def main():
+    check_credit_scoring()
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rng = random.Random(9)
+    groups = [{f"skill{g}_{m}" for m in range(rng.randint(1, 5))} for g in range(count)]
+    vocabulary = sorted(s for group in groups for s in group)
+    weights = {(f"skill{g}_0", f"skill{g}_1"): 0.8 for g in range(0, count, 10)}
+
+    start = time.perf_counter()
+    index = AlternativeGroupIndex(groups, weights)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    pairs = [(set(rng.sample(vocabulary, 30)), set(rng.sample(vocabulary, 40))) for _ in range(200)]
+
+    start = time.perf_counter()
+    for job, resume in pairs:
+        legacy_resolve(set(job), resume, groups)
+    legacy_us = (time.perf_counter() - start) / len(pairs) * 1e6
+
+    start = time.perf_counter()
+    for job, resume in pairs:
+        index.resolve(job, resume)
+    index_us = (time.perf_counter() - start) / len(pairs) * 1e6
+
+    print(f"groups: {count:,}  index build: {build_ms:.1f} ms")
+    print(f"scan all groups: {legacy_us:10.1f} us per pair")
+    print(f"indexed:         {index_us:10.1f} us per pair  ({legacy_us / index_us:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# Measures analyze_many throughput in resumes/second against calling analyze_match per resume.
+# Run from the backend folder:  python benchmarks/bench_batch.py [num_resumes]
+import os
+import sys
+import time
+
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import Corpus, build_dictionary
+
+from analyzer import analyze_match, analyze_many
+from skill_store import SKILL_WEIGHTS as WEIGHTS
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    dictionary = build_dictionary()
+    job_description = Corpus(dictionary, length=800, skill_density=0.03).document(0, "jd")
+    resumes = Corpus(dictionary, length=400, skill_density=0.04).documents(count)
+    candidates = [{"id": i, "resumeText": text, "cvText": ""} for i, text in enumerate(resumes)]
+
+    start = time.perf_counter()
+    for candidate in candidates:
+        analyze_match(job_description, candidate["resumeText"], candidate["cvText"], WEIGHTS)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ranked = analyze_many(job_description, candidates, WEIGHTS, top_k=10)
+    batch = time.perf_counter() - start
+
+    print(f"resumes: {count}")
+    print(f"analyze_match loop: {count / single:,.0f} resumes/s")
+    print(f"analyze_many:       {count / batch:,.0f} resumes/s")
+    print(f"top 3: {[(r['id'], r['matchPercentage']) for r in ranked['results'][:3]]}")
+
+
+if __name__ == "__main__":
+    main()
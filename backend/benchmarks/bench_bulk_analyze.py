@@ -0,0 +1,65 @@
+# Runs bulk_analyze on synthetic job descriptions and resumes (corpus.py), which
+# reports docs/s and pairs/s, then asserts that a random sample of the result
+# rows equals analyze_match on the same texts.
+# Run from the backend folder:  python benchmarks/bench_bulk_analyze.py [jobs] [candidates] [workers]
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+os.environ['SKILL_CACHE_SIZE'] = '0'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import Corpus, build_dictionary
+
+from analyzer import analyze_match
+from bulk_analyze import run
+from skill_store import SKILL_WEIGHTS as WEIGHTS
+
+# Result rows compared with analyze_match
+SAMPLE_PAIRS = 300
+
+
+def write_jsonl(path, field, texts):
+    with open(path, 'w', encoding='utf-8') as f:
+        for index, text in enumerate(texts):
+            f.write(json.dumps({"id": str(index), field: text}) + "\n")
+
+
+def check_sample(results, job_descriptions, resumes):
+    """Asserts that SAMPLE_PAIRS random result rows equal analyze_match."""
+    with open(results, encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == len(job_descriptions) * len(resumes), f"{len(rows)} result rows"
+    for row in random.Random(19).sample(rows, min(SAMPLE_PAIRS, len(rows))):
+        expected = analyze_match(job_descriptions[int(row["job_id"])], resumes[int(row["candidate_id"])], "", WEIGHTS)
+        actual = (int(row["match_percentage"]), row["match_level"], row["matched_keywords"], row["missing_keywords"])
+        wanted = (expected["matchPercentage"], expected["matchLevel"],
+                  ";".join(expected["matchedKeywords"]), ";".join(expected["missingKeywords"]))
+        assert actual == wanted, f"job {row['job_id']}, candidate {row['candidate_id']}: {actual} != {wanted}"
+    print(f"{min(SAMPLE_PAIRS, len(rows))} sampled pairs match analyze_match")
+
+
+def main():
+    n_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    n_candidates = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    corpus = Corpus(build_dictionary(), length=400, skill_density=0.05, alias_rate=0.1, alternative_rate=0.2)
+    job_descriptions = corpus.documents(n_jobs, "jd")
+    resumes = corpus.documents(n_candidates)
+
+    with tempfile.TemporaryDirectory() as directory:
+        jobs_path = os.path.join(directory, "jobs.jsonl")
+        candidates_path = os.path.join(directory, "candidates.jsonl")
+        write_jsonl(jobs_path, "jobDescription", job_descriptions)
+        write_jsonl(candidates_path, "resumeText", resumes)
+        results = run(jobs_path, candidates_path, os.path.join(directory, "out"), workers)
+        check_sample(results, job_descriptions, resumes)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+# Compares fuzzy skill matching (fuzzy_matcher.py) with the exact matcher.
+# Part 1 plants the shipped skills in synthetic documents, written as is or as a
+# variant (punctuation, separators, typos, truncations, numeronyms), and reports
+# precision and recall of both modes; it fails if fuzzy matching costs precision
+# on unmodified text or drops below MIN_FUZZY_PRECISION, or if streaming the same
+# documents in random chunks finds different skills. Part 2 measures the per-term
+# typo lookup and whole-document throughput with dictionaries of up to 50k skills.
+# Run from the backend folder:  python benchmarks/bench_fuzzy_matching.py
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+os.environ['SKILL_CACHE_SIZE'] = '0'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import FILLER, Corpus, build_dictionary, snapshot_of
+
+from fuzzy_matcher import canonical_key
+from skills_extractor import extract_skill_ids, extract_skill_ids_stream
+from tokenizer import split_terms
+
+# Real words a step away from a skill word, to count false positives
+NEAR_MISSES = ("scale trusted angles reacted expressed docked rusty swifter planing leaders "
+               "sprint docket string thanking planting express rabbit material").split() + ["type script"]
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+# Lowest fuzzy precision accepted for any variant
+MIN_FUZZY_PRECISION = 0.9
+
+
+def separators(skill, rng):
+    if skill.endswith("js") and len(skill) > 4 and skill[-3] not in ".-":
+        return skill[:-2] + ".js"
+    if " " in skill:
+        return skill.replace(" ", rng.choice(["-", ""]))
+    if "-" in skill:
+        return skill.replace("-", " ")
+    return None
+
+
+def misspell(word, rng):
+    """Applies one random edit (not to the first letter) to a word."""
+    position = rng.randrange(1, len(word) - 1)
+    edit = rng.choice(["substitute", "delete", "insert", "swap"])
+    if edit == "substitute":
+        return word[:position] + rng.choice(LETTERS.replace(word[position], "")) + word[position + 1:]
+    if edit == "delete":
+        return word[:position] + word[position + 1:]
+    if edit == "insert":
+        return word[:position] + rng.choice(LETTERS) + word[position:]
+    return word[:position] + word[position + 1] + word[position] + word[position + 2:]
+
+
+def typo(skill, rng):
+    words = skill.split()
+    candidates = [i for i, word in enumerate(words) if len(word) >= 6 and word.isalpha()]
+    if not candidates:
+        return None
+    index = rng.choice(candidates)
+    words[index] = misspell(words[index], rng)
+    return " ".join(words)
+
+
+def truncation(skill, rng):
+    if " " in skill or len(skill) < 8 or not skill.isalpha():
+        return None
+    return skill[:int(len(skill) * 0.8)]
+
+
+def numeronym(skill, rng):
+    if " " in skill or len(skill) < 8 or not skill.isalpha():
+        return None
+    return f"{skill[0]}{len(skill) - 2}{skill[-1]}"
+
+
+def punctuation(skill, rng):
+    return skill.title() + rng.choice([",", ".", ";", ")"])
+
+
+VARIANTS = {
+    "as_is": lambda skill, rng: skill,
+    "punctuation": punctuation,
+    "separators": separators,
+    "typo": typo,
+    "truncation": truncation,
+    "numeronym": numeronym,
+}
+
+
+def planted_documents(skills, variant, count, rng):
+    """
+    Documents of filler words, two near misses and some skills written as `variant`.
+
+    Returns:
+        list: (text, set of canonical keys of the planted skills) pairs.
+    """
+    documents = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(60)] + rng.sample(NEAR_MISSES, 2)
+        rng.shuffle(words)
+        planted = set()
+        for _ in range(4):
+            skill = rng.choice(skills)
+            written = VARIANTS[variant](skill, rng)
+            if written is None or written == skill and variant != "as_is":
+                continue
+            words.insert(rng.randrange(len(words) + 1), written)
+            planted.add(canonical_key(skill))
+        documents.append((" ".join(words), planted))
+    return documents
+
+
+def score(documents, snapshot, fuzzy):
+    true_positives = false_positives = false_negatives = 0
+    for text, planted in documents:
+        found = snapshot.registry.decode_skills(extract_skill_ids(text, snapshot, fuzzy))
+        # Skills that differ only in punctuation ("object-oriented programming") count once
+        keys = {canonical_key(skill) for skills in found.values() for skill in skills}
+        true_positives += len(keys & planted)
+        false_positives += len(keys - planted)
+        false_negatives += len(planted - keys)
+    precision = true_positives / ((true_positives + false_positives) or 1)
+    recall = true_positives / ((true_positives + false_negatives) or 1)
+    return precision, recall
+
+
+def random_chunks(text, rng):
+    chunks = []
+    while text:
+        size = rng.randint(1, 20)
+        chunks.append(text[:size])
+        text = text[size:]
+    return chunks
+
+
+def check_stream_parity(documents, snapshot, rng):
+    """Asserts that fuzzy extraction finds the same skills whole and in chunks."""
+    for text, _ in documents:
+        whole = snapshot.registry.decode_skills(extract_skill_ids(text, snapshot, True))
+        streamed = snapshot.registry.decode_skills(extract_skill_ids_stream(random_chunks(text, rng), snapshot, True))
+        assert streamed == whole, f"streamed fuzzy extraction differs on {text!r}"
+
+
+def accuracy():
+    dictionary = build_dictionary()
+    snapshot = snapshot_of(dictionary)
+    skills = sorted(set().union(*dictionary["categories"].values()))
+    rng = random.Random(7)
+    chunk_rng = random.Random(11)
+    count = 200
+    print(f"{'variant':<12} {'exact P':>8} {'exact R':>8} {'fuzzy P':>8} {'fuzzy R':>8}")
+    for variant in VARIANTS:
+        documents = planted_documents(skills, variant, count, rng)
+        exact_precision, exact_recall = score(documents, snapshot, False)
+        fuzzy_precision, fuzzy_recall = score(documents, snapshot, True)
+        print(f"{variant:<12} {exact_precision:>8.3f} {exact_recall:>8.3f} {fuzzy_precision:>8.3f} {fuzzy_recall:>8.3f}")
+        if variant in ("as_is", "punctuation"):
+            # Text exact matching reads correctly must not gain false positives
+            assert fuzzy_precision >= exact_precision, f"{variant}: fuzzy precision {fuzzy_precision:.3f}"
+        assert fuzzy_precision >= MIN_FUZZY_PRECISION, f"{variant}: fuzzy precision {fuzzy_precision:.3f}"
+        check_stream_parity(documents, snapshot, chunk_rng)
+    print(f"streamed fuzzy extraction matches whole-text extraction on {count * len(VARIANTS)} documents")
+
+
+def speed():
+    print(f"\n{'skills':>8} {'build s':>8} {'typo p50 us':>12} {'typo p99 us':>12} "
+          f"{'exact ms/doc':>13} {'fuzzy ms/doc':>13}")
+    for size in (None, 10000, 50000):
+        dictionary = build_dictionary(size)
+        snapshot = snapshot_of(dictionary)
+        snapshot.matcher
+        start = time.perf_counter()
+        matcher = snapshot.fuzzy_matcher
+        build = time.perf_counter() - start
+
+        # Misspelled dictionary words, each looked up once (uncached)
+        rng = random.Random(3)
+        words = sorted({word for skill in snapshot.registry.names for word in split_terms(skill) if len(word) >= 6})
+        queries = {misspell(rng.choice(words), rng) for _ in range(3000)} - set(words)
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            matcher.correct(query)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+
+        documents = Corpus(dictionary, length=500, skill_density=0.05).documents(100)
+        timings = {}
+        for fuzzy in (False, True):
+            start = time.perf_counter()
+            for text in documents:
+                extract_skill_ids(text, snapshot, fuzzy)
+            timings[fuzzy] = (time.perf_counter() - start) / len(documents) * 1000
+        print(f"{len(snapshot.registry):>8} {build:>8.2f} {statistics.median(latencies) * 1e6:>12.1f} "
+              f"{latencies[int(len(latencies) * 0.99)] * 1e6:>12.1f} {timings[False]:>13.3f} {timings[True]:>13.3f}")
+
+
+def main():
+    accuracy()
+    speed()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+# Builds a JobIndex of synthetic postings and times candidate queries against it.
+# Run from the backend folder:  python benchmarks/bench_job_index.py [num_postings]
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import default_dictionary
+
+from job_index import JobIndex
+from skill_store import SKILL_WEIGHTS as WEIGHTS
+
+DICTIONARIES = default_dictionary()["categories"]
+
+
+def random_skills(rng, per_category):
+    return {category: rng.sample(sorted(skills), min(per_category, len(skills))) for category, skills in DICTIONARIES.items()}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(3)
+    index = JobIndex(":memory:")
+
+    start = time.perf_counter()
+    for posting_id in range(count):
+        index.add_skills(posting_id, random_skills(rng, rng.randint(1, 4)))
+    build = time.perf_counter() - start
+
+    queries = [random_skills(rng, 3) for _ in range(20)]
+    start = time.perf_counter()
+    for candidate in queries:
+        index.query(candidate, WEIGHTS, top_k=10)
+    query_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+    start = time.perf_counter()
+    index.remove_posting(0)
+    index.add_skills(0, random_skills(rng, 2))
+    update_ms = (time.perf_counter() - start) * 1000
+
+    print(f"postings: {count:,}  build: {build:.1f}s ({count / build:,.0f} postings/s)")
+    print(f"query: {query_ms:.1f} ms  incremental remove+add: {update_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Compares re-analyzing an edited resume from scratch (analyze_match) with an
+# incremental session (document_session), for growing resume sizes. First it
+# asserts that sessions equal analyze_match over thousands of random edit
+# sequences, including edits that split or join multi-word skills across lines.
+# Run from the backend folder:  python benchmarks/bench_sessions.py
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+os.environ['SKILL_CACHE_SIZE'] = '0'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import FILLER, Corpus, build_dictionary
+
+from analyzer import analyze_match
+from document_session import session_store
+from skill_store import SKILL_WEIGHTS as WEIGHTS
+
+# Random edit sequences checked against analyze_match, and edits per sequence
+PARITY_SEQUENCES = 1000
+PARITY_EDITS = 10
+
+
+def random_text(rng, words, count):
+    # Multi-word skills are sometimes broken across lines, which a session must still find
+    pieces = [rng.choice(words).replace(" ", rng.choice((" ", "\n"))) for _ in range(count)]
+    return rng.choice((" ", "\n", "")).join(pieces)
+
+
+def check_edit_parity():
+    """
+    Applies random edit sequences to sessions and asserts that every result
+    equals analyze_match on the edited texts.
+    """
+    dictionary = build_dictionary()
+    skills = set().union(*dictionary["categories"].values(), dictionary["aliases"])
+    words = sorted(skills) + FILLER + ["\n", "\n\n"]
+    rng = random.Random(15)
+    for _ in range(PARITY_SEQUENCES):
+        job_description = random_text(rng, words, 40)
+        texts = {"resume": random_text(rng, words, rng.randint(0, 60)), "cv": random_text(rng, words, rng.randint(0, 10))}
+        session = session_store.create(job_description, dict(texts), WEIGHTS)
+        for _ in range(PARITY_EDITS):
+            document = rng.choice(("resume", "cv"))
+            text = texts[document]
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, min(len(text), start + rng.choice((0, 1, 5, 40))))
+            new_text = random_text(rng, words, rng.randint(0, 4))
+            session.edit(document, [{"start": start, "end": end, "text": new_text}])
+            texts[document] = text[:start] + new_text + text[end:]
+
+            result = session.result()
+            for key in ("sessionId", "version", "lengths"):
+                result.pop(key)
+            expected = analyze_match(job_description, texts["resume"], texts["cv"], WEIGHTS)
+            assert result == expected, f"session and analyze_match disagree after editing {texts[document]!r}"
+        session_store.delete(session.id)
+    print(f"edit parity: {PARITY_SEQUENCES} sequences of {PARITY_EDITS} edits match analyze_match")
+
+
+def main():
+    check_edit_parity()
+    corpus = Corpus(build_dictionary(), length=12, skill_density=0.1)
+    job_description = Corpus(build_dictionary(), length=300, skill_density=0.1).document(0, "jd")
+
+    print(f"{'lines':>8} {'KB':>8} {'full ms':>9} {'edit ms':>9} {'speedup':>8}")
+    for lines in (100, 1000, 10000, 50000):
+        resume = "\n".join(corpus.documents(lines))
+        session = session_store.create(job_description, {"resume": resume}, WEIGHTS)
+        full, incremental = [], []
+        for step in range(20):
+            # Type one word in the middle of the document
+            position = len(resume) // 2 + step
+            start = time.perf_counter()
+            session.edit("resume", [{"start": position, "end": position, "text": " docker "}])
+            session.result()
+            incremental.append(time.perf_counter() - start)
+
+            resume = resume[:position] + " docker " + resume[position:]
+            start = time.perf_counter()
+            expected = analyze_match(job_description, resume, "", WEIGHTS)
+            full.append(time.perf_counter() - start)
+        result = session.result()
+        assert result["matchedKeywords"] == expected["matchedKeywords"], "session and analyze_match disagree"
+        session_store.delete(session.id)
+
+        full_ms = statistics.median(full) * 1000
+        edit_ms = statistics.median(incremental) * 1000
+        print(f"{lines:>8} {len(resume) / 1024:>8.0f} {full_ms:>9.2f} {edit_ms:>9.3f} {full_ms / edit_ms:>7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
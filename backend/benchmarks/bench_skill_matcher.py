@@ -0,0 +1,94 @@
+# Compares the compiled SkillMatcher against the per-skill loop extract_skills used before it.
+# Run from the backend folder:  python benchmarks/bench_skill_matcher.py
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_trie import SkillMatcher
+from skills_extractor import extract_skills, tokenize_text
+
+# Texts whose skills must come out exactly like this; symbols that are part of
+# a skill ("c#") must not reduce it to a stray letter
+WORD_BOUNDARY_CASES = {
+    "Vitamin C and iron": [],
+    "Plan A, B and C are options": [],
+    "C# and C++ daily": ["c#", "c++"],
+    "object-oriented programming": ["object oriented programming"],
+}
+
+
+def legacy_extract(tokens, categories):
+    """The original extract_skills loop: one set lookup or substring scan per skill."""
+    text_tokens_set = set(tokens)
+    joined_text = " ".join(tokens)
+    result = {}
+    for category, skills in categories.items():
+        extracted = []
+        for skill in skills:
+            if skill in text_tokens_set:
+                extracted.append(skill)
+            elif " " in skill and skill in joined_text:
+                extracted.append(skill)
+        result[category] = extracted
+    return result
+
+
+def make_dictionary(size, rng):
+    words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))) for _ in range(size)]
+    skills = set()
+    while len(skills) < size:
+        skills.add(" ".join(rng.sample(words, rng.choice([1, 1, 2, 3]))))
+    skills = sorted(skills)
+    names = ["programming_skills", "technical_skills", "soft_skills", "management_skills"]
+    return {name: set(skills[i::4]) for i, name in enumerate(names)}, words
+
+
+def make_document(words, skills, length, rng):
+    tokens = []
+    while len(tokens) < length:
+        if rng.random() < 0.05:
+            tokens.extend(rng.choice(skills).split())
+        else:
+            tokens.append(rng.choice(words))
+    return " ".join(tokens)
+
+
+def timeit(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def check_word_boundaries():
+    for text, expected in WORD_BOUNDARY_CASES.items():
+        found = sorted(skill for skills in extract_skills(text).values() for skill in skills)
+        assert found == sorted(expected), f"{text!r}: expected {expected}, got {found}"
+
+
+def main():
+    check_word_boundaries()
+    rng = random.Random(42)
+    print(f"{'skills':>8} {'build ms':>10} {'loop ms/doc':>12} {'trie ms/doc':>12} {'speedup':>8}")
+    for size in (100, 1000, 10000, 50000):
+        categories, words = make_dictionary(size, rng)
+        all_skills = sorted(s for skills in categories.values() for s in skills)
+        tokens = tokenize_text(make_document(words, all_skills, 2000, rng))
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(categories, {}, str.split)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        repeat = max(3, 2000 // max(1, size // 100))
+        loop_ms = timeit(lambda: legacy_extract(tokens, categories), repeat)
+        trie_ms = timeit(lambda: matcher.match(tokens), repeat)
+        print(f"{size:>8} {build_ms:>10.1f} {loop_ms:>12.3f} {trie_ms:>12.3f} {loop_ms / trie_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
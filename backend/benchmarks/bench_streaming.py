@@ -0,0 +1,64 @@
+# Peak memory of extracting skills from a large file, read whole vs streamed in chunks.
+# Run from the backend folder:  python benchmarks/bench_streaming.py [size_mb]
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from document_reader import iter_text_file
+from skills_extractor import extract_skills, extract_skills_stream
+
+WORDS = ("experience delivering scalable backend services python docker kubernetes machine learning "
+         "led cross-functional teams project management communication sql aws node.js c++").split()
+
+
+def write_corpus(path, size_mb):
+    rng = random.Random(1)
+    line = " ".join(rng.choice(WORDS) for _ in range(2000)) + "\n"
+    with open(path, "w") as f:
+        for _ in range(size_mb * 1024 * 1024 // len(line)):
+            f.write(line)
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "resume.txt")
+        write_corpus(path, size_mb)
+        print(f"input: {os.path.getsize(path) / 2**20:.1f} MB")
+
+        def whole():
+            with open(path, encoding="utf-8") as f:
+                return extract_skills(f.read())
+
+        def streamed():
+            with open(path, "rb") as f:
+                return extract_skills_stream(iter_text_file(f))
+
+        whole_result, whole_time, whole_peak = measure(whole)
+        stream_result, stream_time, stream_peak = measure(streamed)
+
+    print(f"{'whole':>9}: peak {whole_peak / 2**20:8.1f} MB  {whole_time:6.2f} s")
+    print(f"{'streamed':>9}: peak {stream_peak / 2**20:8.1f} MB  {stream_time:6.2f} s")
+    same = {k: set(v) for k, v in whole_result.items()} == {k: set(v) for k, v in stream_result.items()}
+    print(f"same skills: {same}")
+
+
+if __name__ == "__main__":
+    main()
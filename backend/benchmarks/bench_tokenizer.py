@@ -0,0 +1,75 @@
+# Compares the builtin tokenizer with NLTK's word_tokenize: cold import time of
+# skills_extractor, per-document tokenization time, and how many documents get
+# different tokens and different skills. The modes are not equivalent: NLTK
+# splits words such as "cannot" and runs of '-' differently.
+# Run from the backend folder:  python benchmarks/bench_tokenizer.py
+import os
+import random
+import subprocess
+import sys
+import time
+
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+os.environ['SKILL_CACHE_SIZE'] = '0'
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+
+import tokenizer
+from skills_extractor import extract_skills, programming_skills, technical_skills, soft_skills, management_skills
+from tokenizer import tokenize
+
+FILLER = ("Led the migration of legacy services, cannot stress enough: 24/7 on-call, "
+          "e-mail & Slack (C++/C#), node.js; CI/CD - 99.9% uptime!").split()
+
+
+def cold_start(mode):
+    """Seconds for a fresh interpreter to import skills_extractor and extract once."""
+    code = "import skills_extractor as s; s.extract_skills('python and docker')"
+    env = dict(os.environ, SKILLS_TOKENIZER=mode)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=BACKEND, env=env, check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def make_document(rng, length):
+    skills = sorted(programming_skills | technical_skills | soft_skills | management_skills)
+    return " ".join(rng.choice(skills) if rng.random() < 0.1 else rng.choice(FILLER) for _ in range(length))
+
+
+def main():
+    rng = random.Random(5)
+    documents = [make_document(rng, 2000) for _ in range(50)]
+
+    try:
+        tokenize("warm up", use_nltk=True)
+        modes = ["builtin", "nltk"]
+    except (ImportError, LookupError) as e:
+        print(f"NLTK path unavailable ({type(e).__name__}); timing the builtin tokenizer only")
+        modes = ["builtin"]
+
+    for mode in modes:
+        print(f"{mode:>8} cold start: {cold_start(mode) * 1000:.0f} ms")
+
+    for mode in modes:
+        use_nltk = mode == "nltk"
+        start = time.perf_counter()
+        for document in documents:
+            tokenize(document, use_nltk=use_nltk)
+        per_doc = (time.perf_counter() - start) / len(documents) * 1000
+        print(f"{mode:>8} tokenize: {per_doc:.3f} ms per 2000-word document")
+
+    if "nltk" in modes:
+        mismatches = sum(tokenize(d) != tokenize(d, use_nltk=True) for d in documents)
+        print(f"documents with different tokens: {mismatches} of {len(documents)}")
+        skill_mismatches = 0
+        for document in documents:
+            tokenizer.TOKENIZER = "builtin"
+            builtin_skills = extract_skills(document)
+            tokenizer.TOKENIZER = "nltk"
+            skill_mismatches += builtin_skills != extract_skills(document)
+        print(f"documents with different skills: {skill_mismatches} of {len(documents)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Scores many candidates against many job descriptions with vector_scoring and compares
+# per-pair cost with the scalar match_skills. Needs numpy and scipy
+# (requirements-optional.txt). Defaults to 100,000 candidates x 1,000 jobs.
+# Run from the backend folder:  python benchmarks/bench_vector_scoring.py [candidates] [jobs]
+import os
+import random
+import sys
+import time
+
+# One core: keep any BLAS threads out of the measurement
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("SKILL_STORE_PATH", ":memory:")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_matcher import match_skills
+from skill_store import SKILL_WEIGHTS as WEIGHTS
+from vector_scoring import top_candidates
+
+VOCABULARY_SIZES = {"programming_skills": 400, "technical_skills": 2000, "soft_skills": 150, "management_skills": 150}
+
+
+def random_profile(rng, per_category):
+    return {
+        category: [f"{category[:4]}{i}" for i in rng.sample(range(size), rng.randint(0, per_category))]
+        for category, size in VOCABULARY_SIZES.items()
+    }
+
+
+def main():
+    n_candidates = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    n_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    rng = random.Random(4)
+    candidates = [random_profile(rng, 8) for _ in range(n_candidates)]
+    jobs = [random_profile(rng, 6) for _ in range(n_jobs)]
+
+    sample = [(rng.choice(jobs), rng.choice(candidates)) for _ in range(20000)]
+    start = time.perf_counter()
+    for job, candidate in sample:
+        match_skills(job, candidate, WEIGHTS)
+    scalar_us = (time.perf_counter() - start) / len(sample) * 1e6
+
+    start = time.perf_counter()
+    top_candidates(jobs, candidates, WEIGHTS, k=10)
+    elapsed = time.perf_counter() - start
+    pairs = n_candidates * n_jobs
+
+    print(f"{n_candidates:,} candidates x {n_jobs:,} jobs = {pairs:,} pairs")
+    print(f"scalar match_skills: {scalar_us:.2f} us/pair  (~{pairs * scalar_us / 1e6 / 3600:.1f} h for all pairs)")
+    print(f"vectorized:          {elapsed / pairs * 1e6:.4f} us/pair  ({elapsed:.1f} s total)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# Deterministic synthetic job descriptions and resumes for the benchmarks.
+# The same arguments always produce the same documents and dictionaries, so runs
+# on different commits (or machines) measure exactly the same work. Import it
+# from a benchmark, or print a sample from the backend folder:
+#   python benchmarks/corpus.py [--length 200] [--dictionary-size 1000]
+import argparse
+import os
+import random
+import sys
+
+# The benchmarks measure the shipped dictionaries, never a feedback store on disk
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+
+import skills_extractor
+from skill_store import SKILL_CATEGORIES, SkillStore
+
+# Words that are in no dictionary and survive tokenization
+FILLER = ("designed built maintained delivered services customers closely product platform reliable "
+          "scalable migrated reduced latency improved onboarding owned roadmap partnered stakeholders "
+          "shipped features across several regions during years").split()
+# Synthetic skills are added round-robin over the categories; every third one is two words
+SYNTHETIC_SUFFIXES = ("studio", "engine", "suite")
+
+
+def default_dictionary():
+    """
+    Returns the dictionaries shipped in skills_extractor, as plain copies.
+
+    Returns:
+        dict: 'categories', 'alternative_groups', 'aliases' and 'alternative_weights'.
+    """
+    return {
+        "categories": {
+            "programming_skills": set(skills_extractor.programming_skills),
+            "technical_skills": set(skills_extractor.technical_skills),
+            "soft_skills": set(skills_extractor.soft_skills),
+            "management_skills": set(skills_extractor.management_skills),
+        },
+        "alternative_groups": [set(group) for group in skills_extractor.alternative_technical_skills_groups],
+        "aliases": dict(skills_extractor.skill_aliases),
+        "alternative_weights": dict(skills_extractor.alternative_skill_weights),
+    }
+
+
+def build_dictionary(size=None):
+    """
+    Extends the default dictionaries with synthetic skills up to `size` skills
+    in total. One synthetic skill in ten also gets an alias, and synthetic
+    skills are grouped in threes as alternatives.
+
+    Args:
+        size (int): Total number of skills, or None for the defaults only.
+
+    Returns:
+        dict: Same layout as default_dictionary().
+    """
+    dictionary = default_dictionary()
+    categories = dictionary["categories"]
+    existing = sum(len(skills) for skills in categories.values())
+    group = []
+    for index in range(max(0, (size or 0) - existing)):
+        skill = f"zq{index:05d}"
+        if index % 3 == 2:
+            skill += " " + SYNTHETIC_SUFFIXES[index % len(SYNTHETIC_SUFFIXES)]
+        categories[SKILL_CATEGORIES[index % len(SKILL_CATEGORIES)]].add(skill)
+        if index % 10 == 0:
+            dictionary["aliases"][f"zqa{index:05d}"] = skill
+        group.append(skill)
+        if len(group) == 3:
+            dictionary["alternative_groups"].append(set(group))
+            group = []
+    return dictionary
+
+
+def snapshot_of(dictionary):
+    """
+    Compiles a dictionary into an in-memory SkillSnapshot, to pass to
+    extract_skills and analyze_extracted.
+    """
+    store = SkillStore(
+        dictionary["categories"],
+        dictionary["alternative_groups"],
+        dictionary["aliases"],
+        alternative_weights=dictionary["alternative_weights"],
+    )
+    return store.snapshot()
+
+
+class Corpus:
+    """
+    Synthetic documents drawn from one dictionary.
+
+    Every word is either filler or, with probability skill_density, a skill
+    phrase. A skill phrase is an alias with probability alias_rate, a member of
+    an alternative group with probability alternative_rate, and otherwise any
+    skill of the dictionary.
+    """
+
+    def __init__(self, dictionary, length=500, skill_density=0.05, alias_rate=0.1, alternative_rate=0.1, seed=0):
+        """
+        Args:
+            dictionary (dict): As returned by build_dictionary().
+            length (int): Words per document.
+            skill_density (float): Share of words that are skill phrases.
+            alias_rate (float): Share of skill phrases that are aliases.
+            alternative_rate (float): Share of skill phrases taken from
+                                      alternative groups.
+            seed (int): Seed of the random generator.
+        """
+        self.dictionary = dictionary
+        self.length = length
+        self.skill_density = skill_density
+        self.alias_rate = alias_rate
+        self.alternative_rate = alternative_rate
+        self.seed = seed
+        # Sorted so the draws do not depend on set iteration order
+        self._skills = sorted(set().union(*dictionary["categories"].values()))
+        self._aliases = sorted(dictionary["aliases"])
+        self._alternatives = sorted(set().union(*dictionary["alternative_groups"]))
+
+    def _phrase(self, rng):
+        draw = rng.random()
+        if draw < self.alias_rate and self._aliases:
+            return rng.choice(self._aliases)
+        if draw < self.alias_rate + self.alternative_rate and self._alternatives:
+            return rng.choice(self._alternatives)
+        return rng.choice(self._skills)
+
+    def document(self, index, kind="resume"):
+        """
+        Returns document number `index` of the given kind ('jd' or 'resume').
+        The same index and kind always give the same text.
+        """
+        rng = random.Random(f"{self.seed}:{kind}:{index}")
+        words = [
+            self._phrase(rng) if rng.random() < self.skill_density else rng.choice(FILLER)
+            for _ in range(self.length)
+        ]
+        return " ".join(words)
+
+    def documents(self, count, kind="resume"):
+        """
+        Returns the first `count` documents of the given kind.
+        """
+        return [self.document(index, kind) for index in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prints a synthetic job description and resume.")
+    parser.add_argument('--length', type=int, default=60)
+    parser.add_argument('--density', type=float, default=0.1)
+    parser.add_argument('--dictionary-size', type=int, default=None)
+    parser.add_argument('--alias-rate', type=float, default=0.1)
+    parser.add_argument('--alternative-rate', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = Corpus(build_dictionary(args.dictionary_size), args.length, args.density,
+                    args.alias_rate, args.alternative_rate, args.seed)
+    print("JD:    ", corpus.document(0, "jd"))
+    print("Resume:", corpus.document(0, "resume"))
+
+
+if __name__ == '__main__':
+    main()
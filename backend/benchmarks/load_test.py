@@ -0,0 +1,100 @@
+# Load test for a running backend: reports throughput and p50/p99 latency of /analyze
+# at several concurrency levels. Start the server first, e.g.
+#   ANALYZER_WORKERS=auto python app.py
+# (or the ASGI server: uvicorn asgi:app --port 5000) then run from the backend folder:
+#   python benchmarks/load_test.py [--url URL] [--requests N] [--concurrency 1 4 16]
+# Rejected (429) and timed out (504) requests are counted apart from other errors.
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+
+# The documents come from the shipped dictionaries; this process analyzes nothing itself
+os.environ.setdefault('SKILL_STORE_PATH', ':memory:')
+
+from corpus import Corpus, build_dictionary
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_level(url, payloads, concurrency):
+    latencies = []
+    errors = 0
+    rejected = 0
+    lock = threading.Lock()
+    queue = list(payloads)
+
+    def client():
+        nonlocal errors, rejected
+        while True:
+            with lock:
+                if not queue:
+                    return
+                body = queue.pop()
+            request = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'})
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=120) as response:
+                    response.read()
+            except urllib.error.HTTPError as e:
+                with lock:
+                    if e.code in (429, 504):
+                        rejected += 1
+                    else:
+                        errors += 1
+                continue
+            except Exception:
+                with lock:
+                    errors += 1
+                continue
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    return latencies, errors, rejected, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', default='http://127.0.0.1:5000/analyze')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--words', type=int, default=5000, help='approximate words per resume')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    args = parser.parse_args()
+
+    dictionary = build_dictionary()
+    job_description = Corpus(dictionary, length=600, skill_density=0.02).document(0, "jd")
+    resumes = Corpus(dictionary, length=args.words, skill_density=0.01).documents(args.requests)
+    payloads = [
+        json.dumps({'jobDescription': job_description, 'resumeText': resume}).encode()
+        for resume in resumes
+    ]
+
+    print(f"{'clients':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7} {'429/504':>8}")
+    for concurrency in args.concurrency:
+        latencies, errors, rejected, wall = run_level(args.url, payloads, concurrency)
+        if not latencies:
+            print(f"{concurrency:>8} {'-':>8} {'-':>8} {'-':>8} {errors:>7} {rejected:>8}")
+            continue
+        print(f"{concurrency:>8} {len(latencies) / wall:>8.1f} "
+              f"{statistics.median(latencies) * 1000:>8.1f} {percentile(latencies, 99) * 1000:>8.1f} "
+              f"{errors:>7} {rejected:>8}")
+
+
+if __name__ == '__main__':
+    main()
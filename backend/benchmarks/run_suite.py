@@ -0,0 +1,218 @@
+# Benchmark suite for the analysis pipeline on the synthetic corpus (corpus.py).
+# For each scenario it measures per-stage throughput (preprocess_text, normalize,
+# split_tokens, trie match, extract_skills, scoring), end-to-end /analyze latency
+# through the Flask test client and peak traced memory, and writes the results as
+# JSON. Run from the backend folder:
+#   python benchmarks/run_suite.py [--quick] [--output results.json]
+# Save a baseline once, then compare later runs against it; the run exits with
+# status 1 if any metric is worse than the baseline by more than --threshold:
+#   python benchmarks/run_suite.py --output baseline.json
+#   python benchmarks/run_suite.py --baseline baseline.json --threshold 0.2
+# Baselines are only comparable on the same machine.
+import os
+
+# Measure the pipeline itself: no cached results, no feedback store on disk, in-process analysis
+os.environ['SKILL_CACHE_SIZE'] = '0'
+os.environ.pop('SKILL_CACHE_PATH', None)
+os.environ['SKILL_STORE_PATH'] = ':memory:'
+os.environ['ANALYZER_WORKERS'] = '0'
+
+import argparse
+import datetime
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from corpus import Corpus, build_dictionary, snapshot_of
+
+from analyzer import analyze_extracted
+from app import app
+from skill_store import SKILL_WEIGHTS as WEIGHTS
+from skills_extractor import extract_skill_ids, preprocess_text
+from tokenizer import normalize, split_tokens
+
+# name -> Corpus arguments (besides the dictionary)
+SCENARIOS = {
+    "default": {"length": 500, "skill_density": 0.05},
+    "long_documents": {"length": 5000, "skill_density": 0.05},
+    "dense_skills": {"length": 500, "skill_density": 0.25},
+    "aliases_and_alternatives": {"length": 500, "skill_density": 0.1, "alias_rate": 0.4, "alternative_rate": 0.4},
+    "dictionary_10k": {"length": 500, "skill_density": 0.05, "dictionary_size": 10000},
+}
+
+
+def best_of(rounds, fn):
+    """Seconds taken by the fastest of several runs of fn."""
+    best = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(fn):
+    """Peak memory traced while running fn, in KB."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_scenario(name, settings, documents, rounds):
+    settings = dict(settings)
+    dictionary = build_dictionary(settings.pop("dictionary_size", None))
+    corpus = Corpus(dictionary, **settings)
+    snapshot = snapshot_of(dictionary)
+    matcher = snapshot.matcher
+
+    resumes = corpus.documents(documents)
+    job_descriptions = corpus.documents(documents, "jd")
+    megabytes = sum(len(text) for text in resumes) / 1e6
+    normalized = [normalize(text) for text in resumes]
+    tokens = [split_tokens(text) for text in normalized]
+    job_ids = [extract_skill_ids(text, snapshot) for text in job_descriptions]
+    resume_ids = [extract_skill_ids(text, snapshot) for text in resumes]
+    job_skills = [snapshot.registry.decode_skills(ids) for ids in job_ids]
+    resume_skills = [snapshot.registry.decode_skills(ids) for ids in resume_ids]
+    no_cv = {category: [] for category in WEIGHTS}
+
+    def score_all():
+        for job, resume in zip(job_skills, resume_skills):
+            analyze_extracted(job, resume, no_cv, WEIGHTS, snapshot)
+
+    timings = {
+        "preprocess_text": best_of(rounds, lambda: [preprocess_text(text) for text in resumes]),
+        "normalize": best_of(rounds, lambda: [normalize(text) for text in resumes]),
+        "split_tokens": best_of(rounds, lambda: [split_tokens(text) for text in normalized]),
+        "skill_match": best_of(rounds, lambda: [matcher.match_ids(found) for found in tokens]),
+        "extract_skills": best_of(rounds, lambda: [extract_skill_ids(text, snapshot) for text in resumes]),
+    }
+    metrics = {}
+    for stage, seconds in timings.items():
+        metrics[f"{name}.{stage}.mb_per_s"] = {"value": megabytes / seconds, "unit": "MB/s", "better": "higher"}
+    metrics[f"{name}.score.pairs_per_s"] = {
+        "value": documents / best_of(rounds, score_all), "unit": "pairs/s", "better": "higher",
+    }
+    metrics[f"{name}.extract_skills.peak_kb"] = {
+        "value": peak_memory(lambda: extract_skill_ids(resumes[0], snapshot)), "unit": "KB", "better": "lower",
+    }
+    skills_found = sum(len(found) for ids in resume_ids for found in ids.values())
+    info = {"documents": documents, "megabytes": round(megabytes, 3), "dictionarySize": len(snapshot.registry),
+            "skillsPerDocument": round(skills_found / documents, 1)}
+    return metrics, info
+
+
+def run_endpoint(requests, rounds):
+    # The shipped dictionaries, through the whole Flask stack
+    corpus = Corpus(build_dictionary(), length=500, skill_density=0.05, alias_rate=0.1, alternative_rate=0.1)
+    client = app.test_client()
+    payloads = [
+        {"jobDescription": corpus.document(index % 10, "jd"), "resumeText": corpus.document(index)}
+        for index in range(requests)
+    ]
+    best = None
+    for _ in range(rounds):
+        latencies = []
+        for payload in payloads:
+            start = time.perf_counter()
+            response = client.post('/analyze', json=payload)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                raise RuntimeError(f"/analyze returned {response.status_code}: {response.get_data(as_text=True)}")
+        if best is None or statistics.median(latencies) < statistics.median(best):
+            best = latencies
+    metrics = {
+        "analyze_endpoint.p50_ms": {"value": statistics.median(best) * 1000, "unit": "ms", "better": "lower"},
+        "analyze_endpoint.p99_ms": {"value": percentile(best, 99) * 1000, "unit": "ms", "better": "lower"},
+        "analyze_endpoint.peak_kb": {
+            "value": peak_memory(lambda: client.post('/analyze', json=payloads[0])), "unit": "KB", "better": "lower",
+        },
+    }
+    return metrics
+
+
+def compare(results, baseline, threshold):
+    """
+    Lists the metrics that are worse than the baseline by more than threshold
+    (a fraction, e.g. 0.2 for 20%).
+
+    Returns:
+        list: (name, baseline value, new value, relative change) tuples.
+    """
+    regressions = []
+    for name, metric in results["metrics"].items():
+        previous = baseline["metrics"].get(name)
+        if previous is None or not previous["value"]:
+            continue
+        change = (metric["value"] - previous["value"]) / previous["value"]
+        worse = -change if metric["better"] == "higher" else change
+        if worse > threshold:
+            regressions.append((name, previous["value"], metric["value"], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the analysis pipeline on a synthetic corpus.")
+    parser.add_argument('--quick', action='store_true', help='fewer documents and rounds (smoke test)')
+    parser.add_argument('--scenario', nargs='+', choices=sorted(SCENARIOS), help='only run these scenarios')
+    parser.add_argument('--output', default='benchmark_results.json', help='where to write the JSON results')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative slowdown (default 0.2)')
+    args = parser.parse_args()
+
+    documents, rounds, requests = (20, 2, 50) if args.quick else (200, 5, 300)
+    results = {
+        "meta": {
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "scenarios": {},
+        "metrics": {},
+    }
+    for name in args.scenario or SCENARIOS:
+        metrics, info = run_scenario(name, SCENARIOS[name], documents, rounds)
+        results["scenarios"][name] = info
+        results["metrics"].update(metrics)
+        print(f"{name}: {info}", file=sys.stderr)
+    results["metrics"].update(run_endpoint(requests, rounds))
+
+    print(f"{'metric':<52} {'value':>12}  unit")
+    for name, metric in results["metrics"].items():
+        print(f"{name:<52} {metric['value']:>12.2f}  {metric['unit']}")
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nwrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("quick") != args.quick:
+            print("warning: baseline and this run differ in --quick", file=sys.stderr)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}:")
+            for name, previous, value, change in regressions:
+                print(f"  {name:<50} {previous:>12.2f} -> {value:>12.2f}  ({change:+.0%})")
+            sys.exit(1)
+        print(f"\nno regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
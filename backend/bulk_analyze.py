@@ -0,0 +1,433 @@
+# Offline batch mode: scores every candidate against every job description on
+# one machine, without the HTTP server. Run from the backend folder:
+#   python bulk_analyze.py --jobs JOBS --candidates CANDIDATES --output OUT_DIR
+# JOBS and CANDIDATES are directories (every .txt, .md, .docx or .pdf file is
+# one document, named by its path) or JSONL files with an 'id' and the text:
+# 'jobDescription' for jobs, 'resumeText' and/or 'cvText' for candidates
+# ('text' works for both).
+#
+# The job runs in two phases, both spread over a process pool (one worker per
+# core by default):
+#   1. Extraction: each document's skills are written to OUT_DIR/skills/<kind>/,
+#      one JSON file per document. A file is reused as long as the document and
+#      the skill dictionaries are unchanged, so re-runs only extract new or
+#      edited documents.
+#   2. Scoring: one task per job description scores it against all candidates
+#      and writes a part under OUT_DIR/parts/, named after the job and its
+#      content. Parts left by an interrupted run are kept when the job, the
+#      candidates, the dictionaries and --top-k are the same (OUT_DIR/checkpoint.json).
+# The parts are then combined into OUT_DIR/results.csv (or results.parquet with
+# --format parquet, which needs the optional pyarrow package).
+# Skills come from the server's dictionaries and feedback (SKILL_STORE_PATH, by
+# default skill_store.sqlite3 in the backend folder); set SKILL_STORE_PATH=:memory:
+# to score with the shipped dictionaries only.
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from analyzer import merge_skills, score_skill_bits, skill_bits
+from document_reader import UnsupportedDocument, iter_document_text
+from skills_extractor import current_snapshot, extract_skills, extract_skills_stream
+from worker_pool import create_pool
+
+DOCUMENT_EXTENSIONS = ('.txt', '.md', '.docx', '.pdf')
+# JSONL fields holding the text of each kind of document, in order
+TEXT_FIELDS = {"jobs": ("jobDescription", "text"), "candidates": ("resumeText", "cvText", "text")}
+RESULT_COLUMNS = (
+    "job_id", "candidate_id", "match_percentage", "match_level",
+    "matched_count", "missing_count", "matched_keywords", "missing_keywords",
+)
+# Documents handed to a worker at once; larger batches mean less inter-process traffic
+BATCH_SIZE = 32
+# Seconds between progress lines
+PROGRESS_INTERVAL = 5.0
+
+
+def _file_name(document_id):
+    # IDs may be paths or contain any character, so files are named by a hash
+    return hashlib.sha1(document_id.encode()).hexdigest() + ".json"
+
+
+def _part_name(job_id, digest):
+    # Named by the job's content too, so an edited job description is scored again
+    return hashlib.sha1(f"{job_id}\0{digest}".encode()).hexdigest() + ".csv"
+
+
+def _write_atomic(path, write):
+    temporary = f"{path}.tmp"
+    with open(temporary, 'w', encoding='utf-8', newline='') as f:
+        write(f)
+    os.replace(temporary, path)
+
+
+def iter_sources(path, kind):
+    """
+    Lists the documents of one kind under a directory or in a JSONL file.
+
+    Args:
+        path (str): Directory or .jsonl file.
+        kind (str): 'jobs' or 'candidates'.
+
+    Yields:
+        tuple: (document ID, source, digest). The source is ('file', path) or
+               ('text', [texts]); the digest changes whenever the document does.
+    """
+    if os.path.isdir(path):
+        for folder, _, names in sorted(os.walk(path)):
+            for name in sorted(names):
+                if os.path.splitext(name)[1].lower() not in DOCUMENT_EXTENSIONS:
+                    continue
+                file_path = os.path.join(folder, name)
+                stat = os.stat(file_path)
+                yield os.path.relpath(file_path, path), ('file', file_path), f"{stat.st_size}:{stat.st_mtime_ns}"
+        return
+
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            document_id = str(record.get('id', f"{os.path.basename(path)}:{line_number}"))
+            texts = [record[field] for field in TEXT_FIELDS[kind] if isinstance(record.get(field), str)]
+            digest = hashlib.sha1("\0".join(texts).encode()).hexdigest()
+            yield document_id, ('text', texts), digest
+
+
+def _extract(source, snapshot):
+    kind, value = source
+    if kind == 'file':
+        with open(value, 'rb') as f:
+            return extract_skills_stream(iter_document_text(value, f), snapshot)
+    skills = {}
+    for text in value:
+        found = extract_skills(text, snapshot)
+        skills = merge_skills(skills, found) if skills else found
+    return skills
+
+
+def _extract_batch(directory, documents):
+    """
+    Worker task: extracts the skills of some documents and writes one skills
+    file for each.
+
+    Returns:
+        int: The number of documents that could not be read.
+    """
+    snapshot = current_snapshot()
+    failed = 0
+    for document_id, source, digest in documents:
+        try:
+            skills = _extract(source, snapshot)
+        except (OSError, UnsupportedDocument) as e:
+            logging.error(f"bulk_analyze: Skipping {document_id}: {e}")
+            skills = {}
+            failed += 1
+        record = {"id": document_id, "digest": digest, "fingerprint": snapshot.fingerprint, "skills": skills}
+        _write_atomic(os.path.join(directory, _file_name(document_id)), lambda f: json.dump(record, f))
+    return failed
+
+
+def _load_skills(directory, document_id, digest, fingerprint):
+    # The stored skills of a document, or None if missing or stale
+    try:
+        with open(os.path.join(directory, _file_name(document_id)), encoding='utf-8') as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if record.get("id") != document_id or record.get("digest") != digest or record.get("fingerprint") != fingerprint:
+        return None
+    return record["skills"]
+
+
+class _Progress:
+    def __init__(self, label, total, unit="docs"):
+        self.label = label
+        self.total = total
+        self.unit = unit
+        self.done = 0
+        self.start = time.perf_counter()
+        self._reported = self.start
+
+    def rate(self):
+        return self.done / ((time.perf_counter() - self.start) or 1e-9)
+
+    def advance(self, count, force=False):
+        self.done += count
+        now = time.perf_counter()
+        if force or now - self._reported >= PROGRESS_INTERVAL:
+            self._reported = now
+            print(f"{self.label}: {self.done}/{self.total} ({self.rate():.0f} {self.unit}/s)", flush=True)
+
+
+def _run_tasks(pool, tasks, on_done, window):
+    # Submits tasks (fn, args, weight) keeping at most `window` in flight, so
+    # every worker stays busy without queueing the whole job in memory
+    pending = {}
+    tasks = iter(tasks)
+    while True:
+        while len(pending) < window:
+            task = next(tasks, None)
+            if task is None:
+                break
+            fn, args, weight = task
+            pending[pool.submit(fn, *args)] = weight
+        if not pending:
+            return
+        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in finished:
+            on_done(future.result(), pending.pop(future))
+
+
+def extract_all(pool, workers, sources, directory, fingerprint, batch_size=BATCH_SIZE):
+    """
+    Phase 1: makes sure every document has an up-to-date skills file.
+
+    Args:
+        pool (ProcessPoolExecutor): The workers.
+        workers (int): Number of workers.
+        sources (list): (document ID, source, digest) of every document.
+        directory (str): Where the skills files go.
+        fingerprint (str): Fingerprint of the current dictionaries.
+
+    Returns:
+        tuple: (document ID -> categorized skills, number of documents extracted).
+    """
+    os.makedirs(directory, exist_ok=True)
+    skills = {}
+    missing = []
+    for document_id, source, digest in sources:
+        stored = _load_skills(directory, document_id, digest, fingerprint)
+        if stored is None:
+            missing.append((document_id, source, digest))
+        else:
+            skills[document_id] = stored
+    print(f"{directory}: {len(skills)} documents up to date, {len(missing)} to extract", flush=True)
+
+    progress = _Progress(f"extracting {os.path.basename(directory)}", len(missing))
+    failed = []
+    tasks = (
+        (_extract_batch, (directory, missing[i:i + batch_size]), len(missing[i:i + batch_size]))
+        for i in range(0, len(missing), batch_size)
+    )
+    _run_tasks(pool, tasks, lambda result, count: (failed.append(result), progress.advance(count)), 4 * workers)
+    if missing:
+        progress.advance(0, force=True)
+    if sum(failed):
+        logging.error(f"bulk_analyze: {sum(failed)} documents could not be read and count as having no skills")
+
+    for document_id, _, digest in missing:
+        skills[document_id] = _load_skills(directory, document_id, digest, fingerprint) or {}
+    return skills, len(missing)
+
+
+_candidates = None
+
+
+def _init_scoring(candidates):
+    """
+    Worker initializer for phase 2: keeps every candidate's skills as bitsets.
+    """
+    global _candidates
+    registry = current_snapshot().registry
+    _candidates = [(candidate_id, skill_bits(registry.encode_skills(skills))) for candidate_id, skills in candidates]
+
+
+def _score_job(job_id, job_skills, top_k, part_path):
+    """
+    Worker task: scores one job description against every candidate and
+    writes the rows (the top_k best if set) to part_path.
+
+    Returns:
+        int: The number of pairs scored.
+    """
+    snapshot = current_snapshot()
+    job_bits = skill_bits(snapshot.registry.encode_skills(job_skills))
+    rows = []
+    for candidate_id, candidate_bits in _candidates:
+        result = score_skill_bits(job_bits, candidate_bits, snapshot)
+        rows.append((
+            job_id, candidate_id, result["matchPercentage"], result["matchLevel"],
+            len(result["matchedKeywords"]), len(result["missingKeywords"]),
+            ";".join(result["matchedKeywords"]), ";".join(result["missingKeywords"]),
+        ))
+    # Stable sort keeps input order among equal scores
+    rows.sort(key=lambda row: row[2], reverse=True)
+    if top_k:
+        rows = rows[:top_k]
+
+    def write(f):
+        writer = csv.writer(f)
+        writer.writerow(RESULT_COLUMNS)
+        writer.writerows(rows)
+
+    _write_atomic(part_path, write)
+    return len(_candidates)
+
+
+def _checkpoint(output, settings):
+    # Parts of a previous run are only valid for the same candidates, dictionaries and top_k
+    path = os.path.join(output, "checkpoint.json")
+    parts = os.path.join(output, "parts")
+    try:
+        with open(path, encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = None
+    if previous != settings and os.path.isdir(parts):
+        for name in os.listdir(parts):
+            os.remove(os.path.join(parts, name))
+    os.makedirs(parts, exist_ok=True)
+    _write_atomic(path, lambda f: json.dump(settings, f))
+    return parts
+
+
+def _iter_rows(part_paths):
+    for part_path in part_paths:
+        with open(part_path, encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            yield from reader
+
+
+def write_results(part_paths, path, output_format):
+    """
+    Combines the per-job parts into one CSV or Parquet file.
+
+    Returns:
+        int: The number of rows written.
+    """
+    count = 0
+    if output_format == 'csv':
+        def write(f):
+            nonlocal count
+            writer = csv.writer(f)
+            writer.writerow(RESULT_COLUMNS)
+            for row in _iter_rows(part_paths):
+                writer.writerow(row)
+                count += 1
+
+        _write_atomic(path, write)
+        return count
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("job_id", pa.string()), ("candidate_id", pa.string()), ("match_percentage", pa.int32()),
+        ("match_level", pa.string()), ("matched_count", pa.int32()), ("missing_count", pa.int32()),
+        ("matched_keywords", pa.string()), ("missing_keywords", pa.string()),
+    ])
+    integers = {2, 4, 5}
+    temporary = f"{path}.tmp"
+    with pq.ParquetWriter(temporary, schema) as writer:
+        for part_path in part_paths:
+            rows = list(_iter_rows([part_path]))
+            columns = [[int(row[i]) if i in integers else row[i] for row in rows] for i in range(len(RESULT_COLUMNS))]
+            writer.write_table(pa.table(columns, schema=schema))
+            count += len(rows)
+    os.replace(temporary, path)
+    return count
+
+
+def run(jobs_path, candidates_path, output, workers=None, top_k=0, output_format='csv'):
+    """
+    Runs both phases and writes the results.
+
+    Args:
+        jobs_path (str): Directory or JSONL file of job descriptions.
+        candidates_path (str): Directory or JSONL file of candidates.
+        output (str): Output directory (skills files, parts, checkpoint and results).
+        workers (int): Worker processes (one per CPU core by default).
+        top_k (int): Keep only the best top_k candidates per job (0 keeps all).
+        output_format (str): 'csv' or 'parquet'.
+
+    Returns:
+        str: Path of the results file.
+    """
+    if output_format not in ('csv', 'parquet'):
+        raise ValueError(f"Unsupported output format: {output_format}")
+    if output_format == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ValueError("Parquet output needs the pyarrow package.")
+    workers = workers or os.cpu_count() or 1
+    fingerprint = current_snapshot().fingerprint
+    job_sources = list(iter_sources(jobs_path, "jobs"))
+    candidate_sources = list(iter_sources(candidates_path, "candidates"))
+    os.makedirs(output, exist_ok=True)
+
+    start = time.perf_counter()
+    pool = create_pool(workers)
+    try:
+        job_skills, extracted = extract_all(pool, workers, job_sources, os.path.join(output, "skills", "jobs"), fingerprint)
+        candidate_skills, count = extract_all(
+            pool, workers, candidate_sources, os.path.join(output, "skills", "candidates"), fingerprint
+        )
+        extracted += count
+    finally:
+        pool.shutdown()
+    extraction_seconds = time.perf_counter() - start
+
+    candidates = [(document_id, candidate_skills[document_id]) for document_id, _, _ in candidate_sources]
+    settings = {
+        "fingerprint": fingerprint,
+        "top_k": top_k,
+        "candidates": hashlib.sha1(json.dumps([(d, digest) for d, _, digest in candidate_sources]).encode()).hexdigest(),
+    }
+    parts = _checkpoint(output, settings)
+    part_paths = [os.path.join(parts, _part_name(job_id, digest)) for job_id, _, digest in job_sources]
+    # Parts of jobs that were edited or removed since they were scored
+    current = {os.path.basename(part_path) for part_path in part_paths}
+    for name in os.listdir(parts):
+        if name not in current:
+            os.remove(os.path.join(parts, name))
+    remaining = [
+        (job_id, part_path) for (job_id, _, _), part_path in zip(job_sources, part_paths) if not os.path.exists(part_path)
+    ]
+    print(f"scoring: {len(job_sources) - len(remaining)} jobs done, {len(remaining)} to score "
+          f"against {len(candidates)} candidates", flush=True)
+
+    progress = _Progress("scoring", len(remaining) * len(candidates), unit="pairs")
+    pool = create_pool(workers, _init_scoring, (candidates,))
+    try:
+        tasks = ((_score_job, (job_id, job_skills[job_id], top_k, part_path), 1) for job_id, part_path in remaining)
+        _run_tasks(pool, tasks, lambda pairs, _: progress.advance(pairs), 2 * workers)
+    finally:
+        pool.shutdown()
+    if remaining:
+        progress.advance(0, force=True)
+
+    results = os.path.join(output, f"results.{output_format}")
+    rows = write_results(part_paths, results, output_format)
+    print(f"wrote {results}: {rows} rows. Extracted {extracted} documents "
+          f"({extracted / (extraction_seconds or 1e-9):.0f} docs/s), scored {progress.done} pairs "
+          f"({progress.rate():.0f} pairs/s) with {workers} workers", flush=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scores every candidate against every job description.")
+    parser.add_argument('--jobs', required=True, help='directory or JSONL file of job descriptions')
+    parser.add_argument('--candidates', required=True, help='directory or JSONL file of resumes/CVs')
+    parser.add_argument('--output', required=True, help='output directory')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: one per core)')
+    parser.add_argument('--top-k', type=int, default=0, help='best candidates kept per job (default: all)')
+    parser.add_argument('--format', choices=('csv', 'parquet'), default='csv', help='results file format')
+    args = parser.parse_args()
+
+    try:
+        run(args.jobs, args.candidates, args.output, args.workers, args.top_k, args.format)
+    except (OSError, ValueError) as e:
+        print(f"bulk_analyze: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
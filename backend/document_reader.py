@@ -0,0 +1,134 @@
+import codecs
+import logging
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+
+
+# Size of the pieces documents are read and handed to the tokenizer in
+CHUNK_SIZE = 64 * 1024
+
+_WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+class UnsupportedDocument(ValueError):
+    """Raised when an uploaded document cannot be read."""
+
+
+def iter_text_file(fileobj, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """
+    Reads a binary text file in chunks, decoding across chunk boundaries.
+
+    Yields:
+        str: Consecutive pieces of the text.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='ignore')
+    while True:
+        data = fileobj.read(chunk_size)
+        if not data:
+            break
+        text = decoder.decode(data)
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def _batched(pieces, size):
+    # Join the many tiny strings a parser produces into chunks of about `size`
+    buffer = []
+    length = 0
+    for piece in pieces:
+        buffer.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield ''.join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def _iter_docx_pieces(archive, document):
+    with archive, document:
+        # Parse incrementally and drop each paragraph once its text is out
+        for event, elem in ET.iterparse(document, events=('end',)):
+            if elem.tag == _WORD_NAMESPACE + 't':
+                if elem.text:
+                    yield elem.text
+            elif elem.tag == _WORD_NAMESPACE + 'tab':
+                yield ' '
+            elif elem.tag in (_WORD_NAMESPACE + 'p', _WORD_NAMESPACE + 'br'):
+                yield '\n'
+                if elem.tag == _WORD_NAMESPACE + 'p':
+                    elem.clear()
+
+
+def iter_docx_text(fileobj, chunk_size=CHUNK_SIZE):
+    """
+    Streams the body text of a DOCX file without loading the whole document.
+
+    Raises:
+        UnsupportedDocument: If the file is not a DOCX archive.
+
+    Returns:
+        iterator: Consecutive pieces of the text (str).
+    """
+    try:
+        archive = zipfile.ZipFile(fileobj)
+        document = archive.open('word/document.xml')
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise UnsupportedDocument(f"Not a valid DOCX file: {e}")
+    return _batched(_iter_docx_pieces(archive, document), chunk_size)
+
+
+def _iter_pdf_pages(reader):
+    for page in reader.pages:
+        yield (page.extract_text() or '') + '\n'
+
+
+def iter_pdf_text(fileobj):
+    """
+    Streams the text of a PDF one page at a time. Needs the optional pypdf package.
+
+    Raises:
+        UnsupportedDocument: If pypdf is missing or the file is not a PDF.
+
+    Returns:
+        iterator: The text of each page (str).
+    """
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise UnsupportedDocument("PDF uploads require the optional 'pypdf' package.")
+    try:
+        reader = PdfReader(fileobj)
+    except Exception as e:
+        logging.error(f"iter_pdf_text: Could not read PDF: {e}")
+        raise UnsupportedDocument(f"Could not read PDF: {e}")
+    return _iter_pdf_pages(reader)
+
+
+def iter_document_text(filename, fileobj):
+    """
+    Streams the text of an uploaded document, picking the reader from its extension.
+
+    Args:
+        filename (str): Original file name, used for the extension.
+        fileobj (file): Binary, seekable file object.
+
+    Raises:
+        UnsupportedDocument: If the file type is not supported or unreadable.
+
+    Returns:
+        iterator: Consecutive pieces of the text (str).
+    """
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension == '.pdf':
+        return iter_pdf_text(fileobj)
+    if extension == '.docx':
+        return iter_docx_text(fileobj)
+    if extension in ('', '.txt', '.md', '.text'):
+        return iter_text_file(fileobj)
+    raise UnsupportedDocument(f"Unsupported file type: {extension}")
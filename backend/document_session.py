@@ -0,0 +1,389 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+
+from analyzer import score_skill_bits, skill_bits
+from metrics import stage
+from skills_extractor import current_snapshot, extract_skill_ids, get_skill_matcher
+
+
+# Documents a session holds, by name, and the request field each starts from
+SESSION_DOCUMENTS = {"resume": "resumeText", "cv": "cvText"}
+
+
+def _split_paragraphs(text):
+    # Every paragraph but the last ends with its newline, so joining them gives the text back
+    parts = text.split('\n')
+    return [part + '\n' for part in parts[:-1]] + [parts[-1]]
+
+
+class _Paragraph:
+    __slots__ = ("text", "pairs", "head", "tail", "count", "boundary")
+
+
+class _ParagraphOffsets:
+    # Paragraph lengths in blocks with per-block sums, so finding the paragraph
+    # at a character offset (or splicing paragraphs) walks the block sums and a
+    # single block instead of every paragraph before it
+    BLOCK_SIZE = 128
+
+    def __init__(self):
+        self.blocks = [[0]]
+        self.sums = [0]
+
+    def locate(self, offset):
+        """
+        Returns (index, start offset) of the last paragraph starting at or
+        before offset.
+        """
+        index = 0
+        start = 0
+        last_block = len(self.blocks) - 1
+        for block_index, total in enumerate(self.sums):
+            block = self.blocks[block_index]
+            if offset < start + total or block_index == last_block:
+                for length in block[:-1]:
+                    if offset < start + length:
+                        break
+                    start += length
+                    index += 1
+                return index, start
+            start += total
+            index += len(block)
+
+    def replace(self, first, last, lengths):
+        """
+        Replaces the lengths of paragraphs first to last (inclusive).
+        """
+        index = 0
+        block_first = 0
+        while index + len(self.blocks[block_first]) <= first:
+            index += len(self.blocks[block_first])
+            block_first += 1
+        offset_in_block = first - index
+        block_last = block_first
+        while index + len(self.blocks[block_last]) <= last:
+            index += len(self.blocks[block_last])
+            block_last += 1
+        merged = [length for block in self.blocks[block_first:block_last + 1] for length in block]
+        merged[offset_in_block:offset_in_block + last - first + 1] = lengths
+        size = self.BLOCK_SIZE
+        blocks = [merged[i:i + size] for i in range(0, len(merged), size)] or [[]]
+        self.blocks[block_first:block_last + 1] = blocks
+        self.sums[block_first:block_last + 1] = [sum(block) for block in blocks]
+        if len(self.blocks) > 1 and not self.blocks[block_first]:
+            del self.blocks[block_first]
+            del self.sums[block_first]
+
+
+class IncrementalDocument:
+    """
+    A document kept as paragraphs (lines) together with the skills found in
+    each one, so an edit only re-extracts the paragraphs it touches.
+
+    A skill phrase can also span a line break, so for every paragraph the
+    matches around its start (the last tokens before it and its first tokens,
+    as many as the longest phrase needs) are kept too and recomputed whenever
+    a neighbouring paragraph changes. The document's skills are the union of
+    all of these, maintained with reference counts.
+    """
+
+    def __init__(self, matcher, text=""):
+        """
+        Args:
+            matcher (SkillMatcher or FuzzySkillMatcher): The compiled dictionaries.
+            text (str): The initial document text.
+        """
+        self.matcher = matcher
+        self.window = max(0, matcher.max_phrase_tokens - 1)
+        self.length = 0
+        self._paragraphs = [self._paragraph("")]
+        self._counts = Counter()
+        self._bits = [0] * len(matcher.categories)
+        self._offsets = _ParagraphOffsets()
+        self.apply_edit(0, 0, text)
+
+    @property
+    def text(self):
+        return "".join(paragraph.text for paragraph in self._paragraphs)
+
+    def skill_bits(self):
+        """
+        Returns:
+            dict: Category -> bitset of the skill IDs in the document.
+        """
+        return dict(zip(self.matcher.categories, self._bits))
+
+    def _paragraph(self, text):
+        paragraph = _Paragraph()
+        tokens = self.matcher.tokenize(text)
+        paragraph.text = text
+        paragraph.pairs = self._match(tokens)
+        paragraph.head = tokens[:self.window]
+        paragraph.tail = tokens[max(0, len(tokens) - self.window):] if self.window else []
+        paragraph.count = len(tokens)
+        paragraph.boundary = ()
+        return paragraph
+
+    def _match(self, tokens):
+        if not tokens:
+            return ()
+        found = self.matcher.match_ids(tokens)
+        return tuple(
+            (category_index, skill_id)
+            for category_index, category in enumerate(self.matcher.categories)
+            for skill_id in found[category]
+        )
+
+    def _count(self, pairs, delta):
+        counts = self._counts
+        bits = self._bits
+        for pair in pairs:
+            counts[pair] += delta
+            category_index, skill_id = pair
+            if counts[pair] <= 0:
+                del counts[pair]
+                bits[category_index] &= ~(1 << skill_id)
+            elif delta > 0 and counts[pair] == 1:
+                bits[category_index] |= 1 << skill_id
+
+    def _boundary_window(self, index):
+        # Up to `window` tokens on each side of the start of paragraph `index`
+        paragraphs = self._paragraphs
+        left = []
+        j = index - 1
+        while j >= 0 and len(left) < self.window:
+            left = paragraphs[j].tail + left
+            j -= 1
+        right = []
+        j = index
+        while j < len(paragraphs) and len(right) < self.window:
+            right = right + paragraphs[j].head
+            j += 1
+        return left[max(0, len(left) - self.window):] + right[:self.window]
+
+    def _refresh_boundary(self, index):
+        paragraph = self._paragraphs[index]
+        self._count(paragraph.boundary, -1)
+        paragraph.boundary = self._match(self._boundary_window(index)) if index > 0 else ()
+        self._count(paragraph.boundary, 1)
+
+    def apply_edit(self, start, end, text):
+        """
+        Replaces the characters from start to end (offsets in the current text)
+        with text, re-extracting only the paragraphs involved.
+
+        Raises:
+            ValueError: If the span is not within the document.
+        """
+        if not isinstance(text, str):
+            raise ValueError("Edit text must be a string.")
+        if not (isinstance(start, int) and isinstance(end, int)) or isinstance(start, bool) or isinstance(end, bool):
+            raise ValueError("Edit start and end must be integers.")
+        if not 0 <= start <= end <= self.length:
+            raise ValueError(f"Edit span {start}-{end} is outside the document (length {self.length}).")
+
+        paragraphs = self._paragraphs
+        first, first_start = self._offsets.locate(start)
+        last, last_start = self._offsets.locate(end)
+        replaced = (
+            paragraphs[first].text[:start - first_start]
+            + text
+            + paragraphs[last].text[end - last_start:]
+        )
+        if last + 1 < len(paragraphs) and not replaced.endswith('\n'):
+            # The edit removed a line break, so the next paragraph joins this one
+            last += 1
+            replaced += paragraphs[last].text
+        texts = _split_paragraphs(replaced)
+        if last + 1 < len(paragraphs):
+            # Only the document's last paragraph may lack a newline (or be empty)
+            texts.pop()
+
+        with stage("incremental_extract"):
+            for paragraph in paragraphs[first:last + 1]:
+                self._count(paragraph.pairs, -1)
+                self._count(paragraph.boundary, -1)
+            new = [self._paragraph(paragraph_text) for paragraph_text in texts]
+            paragraphs[first:last + 1] = new
+            self._offsets.replace(first, last, [len(paragraph_text) for paragraph_text in texts])
+            for paragraph in new:
+                self._count(paragraph.pairs, 1)
+            self.length += len(text) - (end - start)
+
+            if self.window:
+                for index in self._affected_boundaries(first, first + len(new)):
+                    self._refresh_boundary(index)
+
+    def _affected_boundaries(self, first, stop):
+        # Boundaries of the new paragraphs, the one right after them, and any
+        # further ones whose window reaches across short paragraphs into them
+        paragraphs = self._paragraphs
+        affected = list(range(first, min(stop + 1, len(paragraphs))))
+        tokens = 0
+        index = first - 1
+        while index >= 1:
+            tokens += paragraphs[index].count
+            if tokens >= self.window:
+                break
+            affected.append(index)
+            index -= 1
+        tokens = 0
+        index = stop + 1
+        while index < len(paragraphs):
+            tokens += paragraphs[index - 1].count
+            if tokens >= self.window:
+                break
+            affected.append(index)
+            index += 1
+        return affected
+
+
+class AnalysisSession:
+    """
+    A job description and the candidate's documents, kept between requests so
+    that edits to a document only re-extract what changed.
+    """
+
+    def __init__(self, session_id, job_description, documents, weights):
+        """
+        Args:
+            session_id (str): The session ID.
+            job_description (str): The job description text.
+            documents (dict): Document name (see SESSION_DOCUMENTS) -> text.
+            weights (dict): Weights for each skill category.
+        """
+        self.id = session_id
+        self.job_description = job_description
+        self.weights = weights
+        self.version = 0
+        self.lock = threading.Lock()
+        self._load(current_snapshot(), documents)
+
+    def _load(self, snapshot, documents):
+        self.snapshot = snapshot
+        self.job_bits = skill_bits(extract_skill_ids(self.job_description, snapshot))
+        self.documents = {
+            name: IncrementalDocument(get_skill_matcher(snapshot), documents.get(name, '')) for name in SESSION_DOCUMENTS
+        }
+
+    def _refresh_dictionaries(self):
+        # Feedback changed the dictionaries: extract everything again once
+        snapshot = current_snapshot()
+        if snapshot.fingerprint != self.snapshot.fingerprint:
+            logging.info(f"AnalysisSession: Re-extracting session {self.id} for dictionary version {snapshot.version}")
+            self._load(snapshot, {name: document.text for name, document in self.documents.items()})
+
+    def edit(self, document, edits):
+        """
+        Applies edits to one document, in order. Offsets of each edit refer to
+        the text left by the previous one.
+
+        Args:
+            document (str): 'resume' or 'cv'.
+            edits (list): Dicts with 'start', 'end' and 'text'.
+
+        Raises:
+            ValueError: If the document or an edit is invalid. Edits before
+                        the invalid one stay applied (and count as a new version).
+        """
+        if document not in SESSION_DOCUMENTS:
+            raise ValueError(f"Unknown document: {document}")
+        self._refresh_dictionaries()
+        target = self.documents[document]
+        applied = 0
+        try:
+            for edit in edits:
+                if not isinstance(edit, dict):
+                    raise ValueError("Each edit must be an object.")
+                target.apply_edit(edit.get('start'), edit.get('end'), edit.get('text', ''))
+                applied += 1
+        finally:
+            if applied:
+                self.version += 1
+
+    def result(self):
+        """
+        Returns:
+            dict: The analyze_match fields for the current documents, plus
+                  'sessionId', 'version' and the 'lengths' of the documents.
+        """
+        self._refresh_dictionaries()
+        candidate_bits = {}
+        for document in self.documents.values():
+            for category, bits in document.skill_bits().items():
+                candidate_bits[category] = candidate_bits.get(category, 0) | bits
+        result = score_skill_bits(self.job_bits, candidate_bits, self.snapshot)
+        result["sessionId"] = self.id
+        result["version"] = self.version
+        result["lengths"] = {name: document.length for name, document in self.documents.items()}
+        return result
+
+
+class SessionStore:
+    """
+    In-memory analysis sessions of this process, least recently used first.
+    Sessions idle for longer than the TTL, or beyond max_sessions, are dropped.
+    """
+
+    def __init__(self, max_sessions=1000, ttl=1800):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, job_description, documents, weights):
+        """
+        Starts a session.
+
+        Returns:
+            AnalysisSession: The new session.
+        """
+        session = AnalysisSession(uuid.uuid4().hex, job_description, documents, weights)
+        with self._lock:
+            self._sessions[session.id] = (session, time.monotonic())
+            self._expire()
+        return session
+
+    def get(self, session_id):
+        """
+        Returns the session with this ID, or None if it does not exist or expired.
+        """
+        with self._lock:
+            self._expire()
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            self._sessions[session_id] = (entry[0], time.monotonic())
+            self._sessions.move_to_end(session_id)
+            return entry[0]
+
+    def delete(self, session_id):
+        """
+        Returns:
+            bool: True if the session existed.
+        """
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+    def _expire(self):
+        # Caller holds the lock
+        deadline = time.monotonic() - self.ttl
+        while self._sessions:
+            session_id, (_, touched) = next(iter(self._sessions.items()))
+            if touched >= deadline and len(self._sessions) <= self.max_sessions:
+                break
+            del self._sessions[session_id]
+
+
+session_store = SessionStore(
+    max_sessions=int(os.environ.get('SESSION_MAX', '1000')),
+    ttl=float(os.environ.get('SESSION_TTL', '1800')),
+)
@@ -0,0 +1,413 @@
+# Common English words, with the inflected forms that appear in job descriptions
+# and resumes. Fuzzy matching never treats one of these as a misspelled skill
+# ("sprint" is not spring, "docket" is not docker), and never joins a run made
+# only of them into a skill the dictionary spells as one word ("type script").
+# Bundled as a list so no corpus has to be downloaded.
+COMMON_WORDS = frozenset("""
+a able about above abroad absence absent absolute absolutely absorb absorbed abstract
+abuse academic academy accelerate accelerated accept acceptable acceptance accepted
+accepting access accessed accessible accident accommodate accompany accomplish
+accomplished accomplishment accomplishments accord according account accountability
+accountable accounted accounting accounts accuracy accurate accurately achieve achieved
+achievement achievements achieves achieving acknowledge acquire acquired acquisition
+acquisitions across act acted acting action actions active actively activities activity
+actor actors actual actually adapt adapted adapting add added adding addition additional
+address addressed addresses addressing adequate adjust adjusted adjustment administer
+administered administration administrative admire admit adopt adopted adoption adult
+adults advance advanced advancement advances advantage adventure advertising advice
+advise advised adviser advisor advisory advocacy advocate affair affairs affect affected
+affecting afford affordable afraid after afternoon again against age aged agencies agency
+agenda agent agents ages aggressive ago agree agreed agreement agreements ahead aid aim
+aimed aiming aims air aircraft airline airport alarm album alert align aligned alignment
+alive all allocate allocated allocation allow allowed allowing allows almost alone along
+already also alter alternative although always amazing ambition ambitious amend among
+amount amounts analyse analysed analyses analysing analyst analysts analytical analyze
+analyzed analyzes analyzing ancient and anger angle angles angry animal animals announce
+announced annual another answer answered answers anticipate anxiety any anybody anyone
+anything anyway anywhere apart apartment apparent apparently appeal appear appeared
+appears apple application applications applied applies apply applying appoint appointed
+appointment appreciate approach approached approaches appropriate approval approve
+approved approximately april architect architects architecture area areas argue argued
+argument arise arm armed arms army around arrange arranged arrangement arrangements
+array arrest arrival arrive arrived arrow art article articles artist artists arts
+aside ask asked asking aspect aspects assemble assembled assembly assess assessed
+assessing assessment assessments asset assets assign assigned assignment assignments
+assist assistance assistant assisted assisting associate associated associates
+association assume assumed assurance assure at atmosphere attach attached attack
+attempt attempted attend attended attending attention attitude attorney attract
+attracted attractive audience audit audited auditing audits august author authorities
+authority authorized authors auto automate automated automatic automatically automating
+automation autumn available average avoid avoided await award awarded awards aware
+awareness away awful baby back backed background backing backup bad badly bag balance
+balanced balancing ball band bank banking banks bar barely barrier barriers base based
+basic basically basis basket battle bay beach bear beat beautiful beauty became because
+become becomes becoming bed bedroom beer before began begin beginning begins begun behalf
+behave behavior behaviour behind being beings belief beliefs believe believed belong
+below belt bench benchmark benefit benefited benefits best better between beyond bid
+big bigger biggest bill billing billion bills bind bird birds birth bit bite bitter black
+blade blame blank blind block blocked blocks blog blood blow blue board boards boat body
+bold bond bonds bonus book booked booking books boost boosted border born borrow boss
+both bother bottle bottom bought bound boundaries boundary bowl box boxes boy boys brain
+branch branches brand branding brands brave bread break breaking breaks breakfast breath
+brick bridge brief briefing briefly bright brilliant bring bringing brings broad broader
+broadly broke broken brother brothers brought brown brush budget budgeted budgets build
+builder builders building buildings builds built bulk bullet bunch burden burn burned
+bus business businesses busy but butter button buy buyer buyers buying by cabinet cable
+calculate calculated calculation calendar call called calling calls calm came camera camp
+campaign campaigns campus can cancel cancer candidate candidates cannot capabilities
+capability capable capacity capital captain capture captured car card cards care cared
+career careers careful carefully cares caring carried carries carry carrying cars case
+cases cash cast casual cat catch categories category caught cause caused causes causing
+cell cells center centers central centre century ceremony certain certainly certificate
+certification certifications certified chain chains chair chairman challenge challenged
+challenges challenging champion chance chances change changed changes changing channel
+channels chapter character characters charge charged charges charity chart charts chase
+cheap check checked checking checks cheese chemical chief child childhood children chip
+choice choices choose choosing chose chosen church circle circles circumstances cite
+cited citizen citizens city civil claim claimed claims class classes classic classical
+classroom clean cleaned cleaning clear cleared clearly clerk clever click client clients
+climate climb clinic clinical clock close closed closely closer closing cloth clothes
+clothing club clubs clue coach coached coaching coast coat code coded codes coding coffee
+cold collaborate collaborated collaborating collaboration collaborative colleague
+colleagues collect collected collecting collection collections collective college
+colleges color colour column columns combat combination combine combined come comes
+comfort comfortable coming command commercial commission commit commitment commitments
+committed committee common commonly communicate communicated communicating communities
+community companies company compare compared comparison compete competent competition
+competitive competitor competitors compile compiled complain complaint complaints
+complete completed completely completing completion complex compliance comply component
+components compose composed comprehensive compute computed computer computers concept
+concepts concern concerned concerns conclude conclusion concrete condition conditions
+conduct conducted conducting conference conferences confidence confident confidential
+confirm confirmed conflict conflicts confused connect connected connecting connection
+connections consider considerable considered considering consist consistent
+consistently constant constantly construct constructed construction consult consultant
+consultants consulted consulting consume consumer consumers consumption contact
+contacted contacts contain contained containing contains content contents context
+continue continued continues continuing continuous contract contractor contractors
+contracts contrast contribute contributed contributing contribution contributions
+control controlled controlling controls convention conversation conversations convert
+converted convince cook cooking cool cooperate cooperation coordinate coordinated
+coordinating coordination coordinator cope copies copy core corner corporate
+corporation correct corrected correctly cost costs cottage cotton could council count
+counted counter counting countries country county couple courage course courses court
+cousin cover coverage covered covering cow crash crazy cream create created creates
+creating creation creative creativity credit credits crew crime criminal crisis
+criteria critic crop cross crowd crucial cry cultural culture cup curious currency
+current currently curriculum custom customer customers customized cut cuts cutting
+cycle cycles daily damage damaged dance danger dangerous dare dark dashboard dashboards
+date dated dates daughter day days dead deadline deadlines deal dealer dealing deals
+dealt dear death debate debt decade decades december decide decided decides deciding
+decision decisions deck declare decline declined decrease decreased dedicated
+dedication deep deeply default defeat defect defects defence defend defense define
+defined defining definitely definition degree degrees delay delayed delays delegate
+delegated deliberately delight deliver deliverable deliverables delivered delivering
+delivers delivery demand demanded demanding demands demonstrate demonstrated
+demonstrates demonstrating department departments depend dependent depending depends
+deploy deployed deploying deployment deployments deposit depth deputy derive derived
+describe described describes describing description design designed designer designers
+designing designs desire desired desk despite destination destroy destroyed detail
+detailed details detect detected detection determination determine determined develop
+developed developer developers developing development developments develops device
+devices devote devoted diagram dialogue diary did die died diet differ difference
+differences different differently difficult difficulties difficulty dig digital dinner
+direct directed direction directions directly director directors dirty disabled
+disagree disappear disaster discipline discount discover discovered discovery discuss
+discussed discussing discussion discussions disease dish dismiss display displayed
+distance distinct distinguish distribute distributed distribution district diverse
+diversity divide divided division do dock docked docket dockets docking docks doctor
+doctors document documentation documented documenting documents does dog dogs doing
+dollar dollars domain domestic dominant done door doors double doubt down download
+downloads dozen draft drafted drafting drag drama dramatic draw drawing drawn dream
+dreams dress drew drink drive driven driver drivers drives driving drop dropped drove
+drug drugs dry due during dust duties duty dynamic each eager ear earlier early earn
+earned earning earnings earth ease easier easily east eastern easy eat economic
+economics economy edge edit edited editing edition editor editorial educate educated
+education educational effect effective effectively effectiveness effects efficiency
+efficient efficiently effort efforts egg eight either elderly elect elected election
+electric electrical electricity electronic electronics element elements eliminate
+eliminated else elsewhere email emails embrace emerge emergency emotion emotional
+emotions emphasis employ employed employee employees employer employers employment
+empower empty enable enabled enables enabling encounter encourage encouraged end ended
+ending ends enemy energy enforce engage engaged engagement engine engineer engineered
+engineering engineers engines enhance enhanced enhancement enhancing enjoy enjoyed
+enormous enough ensure ensured ensures ensuring enter entered enterprise enterprises
+entertainment enthusiasm enthusiastic entire entirely entitle entries entry environment
+environmental environments equal equally equip equipment equivalent error errors escape
+especially essay essential establish established establishing estate estimate estimated
+estimates evaluate evaluated evaluating evaluation evaluations even evening event events
+eventually ever every everybody everyone everything everywhere evidence evil exact
+exactly exam examination examine examined example examples exceed exceeded excellence
+excellent except exception exceptional exchange excited exciting exclusive excuse
+execute executed executing execution executive executives exercise exercises exhibit
+exhibition exist existed existing exists exit expand expanded expanding expansion expect
+expectation expectations expected expects expense expenses expensive experience
+experienced experiences experiment experiments expert expertise experts explain
+explained explaining explanation explore explored exploring export exports expose
+exposed exposure express expressed expresses expressing expression extend extended
+extending extension extensive extent external extra extract extreme extremely eye eyes
+face faced faces facilitate facilitated facilitating facilities facility facing fact
+factor factors factory facts faculty fail failed failing fails failure failures fair
+fairly faith fall fallen falling false familiar families family famous fan fancy far
+farm farmer fashion fast faster fat father fault favor favorite favour favourite fear
+feature featured features february fee feed feedback feeding feel feeling feelings feels
+fees feet fell fellow felt female few field fields fifteen fifth fifty fight fighting
+figure figures file filed files filing fill filled film films final finally finance
+financial find finding findings finds fine finger fingers finish finished fire fired
+firm firms first fiscal fish fit fitness fits five fix fixed fixes fixing flag flat
+flexibility flexible flight float floor flow flower flowers flows fly focus focused
+focuses focusing fold folder folk follow followed following follows food foot football
+for force forced forces forecast forecasting forecasts foreign forest forever forget
+forgot form formal format formats formed former forms formula forth fortune forum
+forward found foundation founded founder four fourth frame framework frameworks free
+freedom freely frequency frequent frequently fresh friday friend friendly friends from
+front fruit fuel full fully fun function functional functionality functions fund
+funded funding funds funny furniture further future gain gained gaining gains game
+games gap gaps garden gas gate gather gathered gathering gave gear general generally
+generate generated generating generation generous gentle genuine get gets getting gift
+girl girls give given gives giving glad glass global goal goals god going gold golden
+golf gone good goods got govern governance government governments grab grade grades
+gradually graduate graduated graduates grand grant granted grants graph graphic
+graphics grass grateful great greater greatest green grew grey ground grounds group
+groups grow growing grown grows growth guarantee guard guess guest guests guidance guide
+guided guidelines guides guiding guilty guitar gun guy guys habit habits had hair half
+hall hand handbook handle handled handles handling hands hang happen happened happening
+happens happily happy hard harder hardly hardware harm has hat hate have having he head
+headed heading headquarters heads health healthy hear heard hearing heart heat heavily
+heavy height held hello help helped helpful helping helps hence her here hero herself
+hidden hide high higher highest highlight highlighted highlights highly hill him
+himself hire hired hiring his historic historical history hit hold holder holding holds
+hole holiday holidays home homes honest honor hope hoped hopes horse hospital host hosted
+hosting hot hotel hour hours house household houses housing how however huge human
+humans humor hundred hundreds hung hungry hunt hurt husband idea ideal ideas identified
+identify identifying identity if ignore ignored ill illegal illness illustrate image
+images imagine immediate immediately impact impacted impacts implement implementation
+implemented implementing import importance important impose impossible impress
+impression impressive improve improved improvement improvements improves improving in
+incentive incentives inch incident incidents include included includes including income
+incoming increase increased increases increasing increasingly incredible indeed
+independent independently index indicate indicated indicator indicators individual
+individuals industrial industries industry influence influenced inform informal
+information informed infrastructure initial initially initiative initiatives injury
+inner innovate innovation innovations innovative input inputs inquiries insert inside
+insight insights inspect inspection inspire inspired install installation installed
+installing instance instead institute institution institutions instruction instructions
+instrument insurance integrate integrated integrating integration integrity intellectual
+intelligence intelligent intend intended intense intensive intent interact interaction
+interactions interactive interest interested interesting interests interface interfaces
+internal internally international internet interpret interpretation interval interview
+interviewed interviewing interviews into introduce introduced introducing introduction
+invent inventory invest invested investigate investigation investment investments
+investor investors invitation invite invited invoice invoices involve involved
+involvement involves involving iron island issue issued issues it item items its itself
+jacket job jobs join joined joining joint joke journal journey judge judgment juice july
+jump june junior jury just justice justify keen keep keeping keeps kept key keys kick kid
+kids kill killed kind kinds king kitchen knee knew knife know knowing knowledge known
+knows lab label labor laboratory labour lack lacking ladder lady laid land landed
+landing lands landscape language languages large largely larger largest last lasting
+late lately later latest latter laugh launch launched launches launching law laws lawyer
+lay layer layers layout lazy lead leader leaders leading leads leaf league lean learned
+learner learners learns learnt least leave leaves leaving lecture led left leg legacy
+legal legally legs lend length less lesson lessons let letter letters level levels
+liability liaise liaising liaison library licence license licensed licensing lie life
+lifestyle lift light like liked likely likes limit limited limits line lines link
+linked links list listed listen listening lists literally literature little live lived
+lively lives living load loaded loads loan loans local locally locate located location
+locations lock locked log logged logging logic logical login logistics logs lone lonely
+long longer look looked looking looks loop loose lose losing loss losses lost lot lots
+loud love loved lovely low lower lowest loyal loyalty luck lucky lunch machinery
+machines mad made magazine magic mail mailing main mainly maintain maintained
+maintaining maintains maintenance major majority make maker makers makes male mall man
+manage managed manager managers manages managing mandate mandatory manner manual
+manually manufacture manufacturer manufacturing many map mapped mapping maps march mark
+marked market marketing markets marriage married mass massive master masters masking
+match matched matches matching mate materials math mathematics matter matters mature
+maximize maximum may maybe mayor meal mean meaning meaningful means meant meanwhile
+measure measured measurement measures measuring meat mechanism media medical medicine
+medium meet meeting meetings meets member members membership memory men mental mention
+mentioned mentor mentored mentoring mentors menu mere merely merge merged merger mess
+message messages messaging met metal method methodology methods metric metrics middle
+might migrate migrated migration mild mile miles military milk million millions mind
+minds mine minimal minimize minimum minister ministry minor minority minute minutes
+mirror miss missed missing mission mistake mistakes mix mixed mobile mode model modeled
+modeling modelling models moderate modern modest modified modify module modules moment
+monday money monitor monitored monitoring monitors month monthly months mood moon moral
+more moreover morning mortgage most mostly mother motion motivate motivated motivation
+motor mount mountain mouse mouth move moved movement moves movie moving much multiple
+murder muscle museum music musical must mutual myself mystery name named namely names
+narrative narrow nation national nations native natural naturally nature near nearby
+nearly neat necessary necessarily neck need needed needing needs negative negotiate
+negotiated negotiating neighbor neighbour neither nerve nervous net network networks
+never nevertheless new newly news newspaper next nice night nine nobody noise none
+normal normally north northern nose not note noted notes nothing notice noticed
+notification notifications notion novel november now nowhere number numbers numerous
+nurse nursing object objective objectives objects obligation observe observed obtain
+obtained obvious obviously occasion occasionally occupation occur occurred occurs ocean
+october odd of off offer offered offering offerings offers office officer officers
+offices official officially offline often oil okay old older on onboard onboarded
+onboarding once one ones online only onto open opened opening openly openness opens
+operate operated operates operating operation operational operations operator operators
+opinion opponent opportunities opportunity oppose opposite optimal optimise optimised
+optimism optimization optimize optimized optimizing option optional options or oral
+orange order ordered ordering orders ordinary organisation organisational organisations
+organise organised organising organization organizational organizations organize
+organized organizer organizing orientation origin original originally other others
+otherwise ought our ourselves out outcome outcomes outdoor outer outline outlined output
+outputs outreach outside outstanding over overall overcome overnight overseas oversee
+overseeing oversaw oversight overtime overview owe own owned owner owners ownership owns
+pace pack package packages packaging packed page pages paid pain paint painting pair
+pan panel paper papers parent parents park parking part partial participant
+participants participate participated participating participation particular
+particularly parties partly partner partnered partnering partners partnership
+partnerships parts party pass passed passenger passing passion passionate passive past
+path paths patience patient patients pattern patterns pause pay paying payment payments
+payroll peace peak peer peers pen penalty pension people per percent percentage perfect
+perfectly perform performed performing performs perhaps period periods permanent
+permission permit person personal personality personally personnel persons perspective
+persuade phase phases phone phones photo photograph photography photos phrase physical
+physically piano pick picked picture pictures piece pieces pilot pin pink pipe pipeline
+pipelines pitch place placed placement places placing plain plan plane planet planing
+planned planner planners plans plant planted planting plants plastic plate platform
+platforms play played player players playing plays pleasant please pleased pleasure
+plenty plot plus pocket poem poet point pointed points police policies policy political
+politics poll pool poor pop popular population port portal portfolio portion portrait
+pose position positions positive positively possess possibility possible possibly post
+posted poster posting postings posts pot potato potential potentially pound pounds pour
+poverty power powered powerful powers practical practice practices practise praise pray
+precise precisely predict predicted prediction predictions prefer preferably preference
+preferred pregnant premium preparation prepare prepared preparing presence present
+presentation presentations presented presenting presents preserve president press
+pressure pretty prevent prevented prevention previous previously price prices pricing
+pride primarily primary prime prince principal principle principles print printed
+printing prior priorities prioritize prioritized prioritizing priority prison prisoner
+privacy private prize proactive proactively probably problems procedure procedures
+proceed process processed processes processing procurement produce produced producer
+produces producing product production productive productivity products profession
+professional professionally professionals professor profile profit profitability
+profitable profits program programme programmes programs progress progressed
+progression prohibit projected projects prominent promise promised promote promoted
+promoting promotion promotions prompt promptly proof proper properly properties property
+proportion proposal proposals propose proposed prospect prospects protect protected
+protecting protection protocol protocols proud prove proved proven provide provided
+provider providers provides providing province public publication publications publicly
+publish published publishing pull pulled punch purchase purchased purchases purchasing
+pure purple purpose purposes pursue pursuing push pushed put puts putting qualification
+qualifications qualified qualify qualities quality quantity quarter quarterly queen
+queries query question questions quick quickly quiet quietly quit quite quote quoted
+race racing radio rail rain raise raised raising ran random range ranges ranging rank
+ranked ranking rapid rapidly rare rarely rate rated rates rather rating ratings ratio
+raw reach reached reaches reaching react reacted reacting reaction read reader readers
+readily readiness reading reads ready real realistic reality realize realized really
+reason reasonable reasonably reasons recall receipt receive received receives receiving
+recent recently reception recipe recognise recognised recognition recognize recognized
+recommend recommendation recommendations recommended reconcile record recorded
+recording records recover recovery recruit recruited recruiter recruiters recruiting
+recruitment red redesign redesigned reduce reduced reduces reducing reduction reductions
+refer reference references referral referred reflect reflected reflection reform
+refused regard regarding regardless region regional regions register registered
+registration regret regular regularly regulation regulations regulatory reject
+rejected relate related relates relating relation relations relationship relationships
+relative relatively relax release released releases releasing relevant reliability
+reliable relief religion religious rely remain remained remaining remains remarkable
+remember remind remote remotely removal remove removed rent repair repairs repeat
+repeated replace replaced replacement reply report reported reporter reporting reports
+represent representative representatives represented representing request requested
+requests require required requirement requirements requires requiring research
+researcher researchers researching reserve reserved resident residents resign resist
+resolve resolved resolving resource resourceful resources respect respected respond
+responded responding response responses responsibilities responsibility responsible
+responsive rest restaurant restore restrict restricted restriction result resulted
+resulting results resume retail retain retained retention retire retired retirement
+retrieve return returned returning returns reveal revealed revenue reverse review
+reviewed reviewing reviews revise revised reward rewarding rewards rich rid ride right
+rights ring rise rising risks rival river road roads rock role roles roll rolled
+rolling rollout roof room rooms root roots rose rough roughly round route routes routine
+routing row royal rule rules run running runs rural rush rusty sad safe safely safety
+said salary sale sales salt same sample samples sand satisfaction satisfied satisfy
+saturday save saved saving savings saw say saying says scale scaled scaling scan
+scanned scanning scene schedule scheduled schedules scheduling scheme scholarship
+school schools scientific scientist scientists scope score scored scores scoring
+scratch screen screening screens script scripted scripts sea search searched searching
+season seat second secondary seconds secret secretary section sections sector sectors
+secure secured securing security see seed seeing seek seeking seem seemed seems seen
+segment segments select selected selecting selection self sell seller selling send
+sending senior sense sensitive sent sentence separate separately september sequence
+series serious seriously serve served serves service services serving session sessions
+set sets setting settings settle settled setup seven several severe sex shadow shake
+shall shape shaped shapes share shared shareholders shares sharing sharp she sheet
+sheets shelf shell shells shift shifts shine ship shipped shipping shirt shock shoe shoes
+shoot shop shopping shops short shortly shot should shoulder show showcase showed
+showing shown shows shut sick side sides sight sign signal signals signature signed
+significant significantly signing signs silence silent silly silver similar simple
+simply since sing singer single sir sister sit site sites sitting situation situations
+six size sizes skill skilled skin sky sleep slide slides slight slightly slip slow
+slowly small smaller smart smell smile smoke smooth smoothly snow so social society
+soft software soil sold soldier sole solid solution solutions solve solved solves some
+somebody somehow someone something sometimes somewhat somewhere son song songs soon
+sophisticated sorry sort sorted sorting sought soul sound sounds source sourced sources
+sourcing south southern space spaces speak speaker speakers speaking special specialist
+specialists specialize specialized specific specifically specification specifications
+specified speech speed spend spending spent spirit split spoke spoken sponsor sponsored
+sport sports spot spread spreadsheet spreadsheets springs sprint sprints squad square
+stability stable staff staffed staffing stage stages stake stakeholder stakeholders
+stand standard standards standing stands star stars start started starting starts
+state stated statement statements states station stations statistical statistics status
+stay stayed steady steal steel step steps stick still stock stocks stone stood stop
+stopped storage store stored stores stories storm story straight strain strange
+strategies strategy stream streamline streamlined streamlining streams street strength
+strengths stress stressed stretch strict strike string strings strong stronger strongly
+structure structured structures struggle student students studied studies studio study
+studying stuff style subject subjects submission submit submitted subscription
+subsequent subsequently substantial succeed success successes successful successfully
+such sudden suddenly suffer sufficient sugar suggest suggested suggestion suggestions
+suit suitable suite sum summaries summarize summary summer sun sunday super superior
+supervise supervised supervising supervision supervisor supervisors supplier suppliers
+supplies supply support supported supporting supportive supports suppose sure surface
+surgery surprise surprised surprising surround surrounding survey surveys survive
+suspect sustain sustainable sustained swifter swim switch switched symbol sympathy
+system systematic systems table tables tackle tactical tactics tag take taken takes
+taking talent talented talk talked talking talks tall target targeted targets task
+tasked tasks taste tax taxes tea teach teacher teachers teaching teams tear technical
+technician technique techniques technologies technology teenager telephone television
+tell telling template templates temporary ten tend tender tennis tension term terms
+terrible territory test tested testing tests text than thank thanking thanks that the
+theatre their them theme themselves then theory therapy there thereby therefore these
+they thick thin thing things think thinks third thirty this thorough thoroughly those
+though thought thoughtful thoughts thousand thousands threat three threshold threw
+thrive through throughout throw thursday thus ticket tickets tie tied tight till timely
+timeline timelines times tiny tip tips tired title titles today together told tomorrow
+tone tonight too took tool tools tooth top topic topics total totally touch tough tour
+tourism toward towards tower town track tracked tracking tracks trade trading tradition
+traditional traffic train trained trainee trainer training trainings trains transaction
+transactions transfer transferred transform transformation transformed transit
+transition translate translated translation transparency transparent transport
+transportation travel traveled travelling travels treat treated treatment tree trees
+trend trends trial trials trip trouble troubleshoot troubleshooting truck true truly
+trust trusted truth try trying tuesday tune tuned tuning turn turned turning turnover
+turns tutor tutoring twelve twenty twice two type types typical typically ugly ultimate
+ultimately unable uncle under undergraduate underlying understand understanding
+understood undertake undertaken unexpected unfortunately uniform union unique unit
+united units universities university unknown unless unlike unlikely until unusual
+update updated updates updating upgrade upgraded upgrades upon upper upset urban urge
+urgent usage use used useful user users uses using usual usually utilize utilized
+vacation valid validate validated validation valley valuable value valued values
+variable variables variety various vary vast vehicle vehicles vendor vendors venture
+verbal verification verified verify version versions versus very via victim video
+videos view viewed views village violence virtual virtually visible vision visit
+visited visiting visitor visitors visual visualization vital voice volume volunteer
+volunteered volunteering volunteers vote voted wage wages wait waiting wake walk walked
+walking wall walls want wanted wants war warm warn warning warranty was wash waste watch
+watched watching water wave way ways we weak wealth weapon wear weather web website
+websites wedding wednesday week weekend weekly weeks weight welcome welfare well went
+were west western wet what whatever wheel when whenever where whereas wherever whether
+which while white who whole whom whose why wide widely wider wife wild will willing
+willingness win wind window wine wing winner winning winter wire wise wish with within
+without woman women won wonder wonderful wood word words wore worked worker workers
+workflow workflows workforce working workload workplace works workshop workshops world
+worldwide worried worry worse worst worth would write writer writing written wrong
+wrote yard yeah year yearly years yellow yes yesterday yet yield you young younger your
+yours yourself youth zone
+big change cloud computing critical data decision express learning machine making material
+object oriented performance problem project rabbit risk science server shell solving
+spring strategic swift rust team thinking time windows work clouds cloudy flasks seaborne
+""".split())
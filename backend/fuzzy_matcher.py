@@ -0,0 +1,385 @@
+import logging
+import math
+
+from english_words import COMMON_WORDS
+from skill_registry import SkillRegistry
+from tokenizer import STOP_WORDS, split_terms
+
+
+def canonical_key(phrase):
+    """
+    Returns the form fuzzy matching compares: the terms of the phrase joined
+    without separators ("Scikit-learn" and "scikit learn" -> 'scikitlearn').
+    """
+    return "".join(split_terms(phrase))
+
+
+def _deletes(word, depth):
+    # Every string obtained by deleting up to `depth` characters, word included
+    found = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {item[:i] + item[i + 1:] for item in frontier for i in range(len(item))}
+        found |= frontier
+    return found
+
+
+def _numeronym(word):
+    # 'kubernetes' -> 'k8s'
+    return f"{word[0]}{len(word) - 2}{word[-1]}"
+
+
+def edit_distance(a, b, limit):
+    """
+    Optimal string alignment distance (insertions, deletions, substitutions and
+    adjacent transpositions) between a and b, or limit + 1 if it exceeds limit.
+    Only the diagonal band the limit allows is computed.
+    """
+    # Shared prefixes and suffixes never change the distance
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    a, b = a[start:], b[start:]
+    end = 0
+    while end < len(a) and end < len(b) and a[-1 - end] == b[-1 - end]:
+        end += 1
+    if end:
+        a, b = a[:-end], b[:-end]
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) <= 1 and len(b) <= 1:
+        return max(len(a), len(b))
+    if limit == 1:
+        # What is left differs in more than one place, unless it is a swap
+        return 1 if len(a) == len(b) == 2 and a == b[::-1] else 2
+    if not a or not b:
+        return max(len(a), len(b))
+
+    over = limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [over] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        lowest = current[0]
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            cost = a[i - 1] != b[j - 1]
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            lowest = min(lowest, value)
+        if lowest > limit:
+            return over
+        previous2, previous = previous, current
+    return min(previous[len(b)], over)
+
+
+class FuzzySkillMatcher:
+    """
+    Skill matcher that also recognizes variants of the dictionary phrases.
+
+    Documents are split with split_terms(), so "node.js" and "c#" survive, and
+    every run of up to max_phrase_tokens neighbouring terms is joined without
+    separators and looked up as one key. On top of those exact keys it accepts:
+
+    - the key without a 'js' suffix, and the reverse ("react.js" -> react,
+      "node" -> nodejs);
+    - numeronyms of single-word skills ("k8s" -> kubernetes), when unambiguous;
+    - truncations covering at least MIN_PREFIX_COVERAGE of a long skill
+      ("postgres" -> postgresql), when unambiguous;
+    - typos in the terms of a phrase ("kubernets", "machine lerning"), within
+      one edit from MIN_FUZZY_LENGTH characters on and two from TWO_EDIT_LENGTH.
+
+    Typos are corrected term by term against the words the dictionary phrases
+    are made of, using a SymSpell-style index of deletions from the first
+    PREFIX_LENGTH characters of every word, so a lookup touches a few dozen
+    entries however large the vocabulary. Corrections are cached, and runs that
+    start or end with a stop word are only matched exactly.
+
+    Common English words (english_words.COMMON_WORDS) are taken at face value:
+    one is never corrected, so a correction only ever replaces a rarer term
+    ("sprint" stays sprint, "kubernets" becomes kubernetes), a lone common word
+    is not read as a variant ("express" is not expressjs), and a run made only
+    of common words must have the terms of a dictionary phrase ("type script"
+    is not typescript). It returns the same structures as SkillMatcher, so the
+    two are interchangeable.
+    """
+
+    MIN_FUZZY_LENGTH = 6
+    TWO_EDIT_LENGTH = 10
+    PREFIX_LENGTH = 7
+    MIN_PREFIX_COVERAGE = 0.75
+    VARIANT_SUFFIXES = ("js",)
+    # Corrected terms remembered before the cache starts over
+    CACHE_SIZE = 100000
+
+    def __init__(self, categories, aliases, registry=None, max_distance=2):
+        """
+        Builds the keys and the deletion index.
+
+        Args:
+            categories (dict): Mapping of category name to an iterable of skills.
+            aliases (dict): Mapping of alias phrase to the skill it stands for.
+            registry (SkillRegistry): IDs to use for the skills (one covering
+                                      every skill in categories is built if None).
+            max_distance (int): Upper bound on the edit distance of a typo.
+        """
+        self.categories = list(categories)
+        if registry is None:
+            registry = SkillRegistry(skill for skills in categories.values() for skill in skills)
+        self.registry = registry
+        self.tokenize = split_terms
+        self.max_distance = max_distance
+        self._corrections = {}
+
+        # Canonical key -> [(seen key, category index, skill ID), ...], as in SkillMatcher
+        entries = {}
+        words = set()
+        # Term sequences of the dictionary phrases, for runs of common words
+        phrases = set()
+        longest = 0
+        num_categories = len(self.categories)
+        for category_index, skills in enumerate(categories.values()):
+            for skill in skills:
+                terms = split_terms(skill)
+                if not terms:
+                    continue
+                words.update(terms)
+                phrases.add(tuple(terms))
+                longest = max(longest, len(terms))
+                skill_id = registry.ids[skill]
+                pair = (skill_id * num_categories + category_index, category_index, skill_id)
+                bucket = entries.setdefault("".join(terms), [])
+                if pair not in bucket:
+                    bucket.append(pair)
+        outputs = {key: tuple(bucket) for key, bucket in entries.items()}
+        for phrase, target in aliases.items():
+            terms = split_terms(phrase)
+            found = tuple(entries.get(canonical_key(target), ()))
+            if terms and found:
+                words.update(terms)
+                phrases.add(tuple(terms))
+                longest = max(longest, len(terms))
+                outputs["".join(terms)] = found
+        self._keys = {key: found for key, found in outputs.items() if found}
+        self._phrases = frozenset(phrases)
+        # One more term than the longest phrase, for variants split in one more place ("type script")
+        self.max_phrase_tokens = longest + 1
+
+        # Variant -> the skills of the one key it stands for (empty if several)
+        self._variants = {}
+        for key, found in self._keys.items():
+            for suffix in self.VARIANT_SUFFIXES:
+                if key.endswith(suffix):
+                    if len(key) - len(suffix) >= 3:
+                        self._add_unique(key[:-len(suffix)], found)
+                else:
+                    self._add_unique(key + suffix, found)
+            if key.isalpha() and len(key) >= 5:
+                self._add_unique(_numeronym(key), found)
+            shortest = max(self.MIN_FUZZY_LENGTH, math.ceil(self.MIN_PREFIX_COVERAGE * len(key)))
+            for length in range(shortest, len(key)):
+                self._add_unique(key[:length], found)
+
+        # Longer runs are not tried: no key or variant is that long, even with a
+        # couple of letters inserted by typos
+        self._longest_key = max(map(len, list(self._keys) + list(self._variants)), default=0) + 2 * self.max_distance
+        self._words = frozenset(words)
+        index = {}
+        for word in sorted(words):
+            depth = self._index_depth(len(word))
+            if depth:
+                for deleted in _deletes(word[:self.PREFIX_LENGTH], depth):
+                    index.setdefault(deleted, []).append(word)
+        # Most deletions lead to a single word, which is kept without a container
+        self._index = {deleted: found[0] if len(found) == 1 else tuple(found) for deleted, found in index.items()}
+        logging.debug(
+            "FuzzySkillMatcher: %s keys, %s words, %s deletions", len(self._keys), len(words), len(self._index)
+        )
+
+    def _add_unique(self, variant, found):
+        # Variants shared by different skills (or equal to a key) stay unmatched
+        if variant in self._keys:
+            return
+        if variant in self._variants and self._variants[variant] != found:
+            self._variants[variant] = ()
+        else:
+            self._variants.setdefault(variant, found)
+
+    def distance_limit(self, length):
+        """
+        Returns the number of edits allowed for a term of this length.
+        """
+        if length < self.MIN_FUZZY_LENGTH:
+            return 0
+        if length < self.TWO_EDIT_LENGTH:
+            return min(1, self.max_distance)
+        return min(2, self.max_distance)
+
+    def _index_depth(self, length):
+        # Deletions a word needs so that every term allowed to reach it can
+        return max(
+            (self.distance_limit(term_length)
+             for term_length in range(length - self.max_distance, length + self.max_distance + 1)
+             if abs(term_length - length) <= self.distance_limit(term_length)),
+            default=0,
+        )
+
+    def lookup(self, key):
+        """
+        Resolves a canonical key (see canonical_key) or a variant of one.
+
+        Returns:
+            tuple: (seen key, category index, skill ID) entries, empty if none.
+        """
+        return self._keys.get(key) or self._variants.get(key, ())
+
+    def correct(self, term):
+        """
+        Returns the dictionary word closest to a term within the allowed edit
+        distance, or the term itself if it is known, a common English word,
+        too short, or as close to several words.
+        """
+        if (term in self._words or term in COMMON_WORDS
+                or len(term) < self.MIN_FUZZY_LENGTH or term.isdigit()):
+            return term
+        corrected = self._corrections.get(term)
+        if corrected is None:
+            corrected = self._nearest(term) or term
+            if len(self._corrections) >= self.CACHE_SIZE:
+                self._corrections.clear()
+            self._corrections[term] = corrected
+        return corrected
+
+    def _nearest(self, term):
+        limit = self.distance_limit(len(term))
+        best = limit + 1
+        nearest = None
+        checked = set()
+        for deleted in _deletes(term[:self.PREFIX_LENGTH], limit):
+            found = self._index.get(deleted, ())
+            for word in (found,) if isinstance(found, str) else found:
+                if word in checked:
+                    continue
+                checked.add(word)
+                # Typos rarely hit the first letter, and skipping those keeps precision up
+                if word[0] != term[0] or abs(len(word) - len(term)) > limit:
+                    continue
+                distance = edit_distance(term, word, limit)
+                if distance < best:
+                    best = distance
+                    nearest = word
+                elif distance == best:
+                    # As close to another word: too ambiguous to guess
+                    nearest = None
+                    if best == 1:
+                        # No unknown term is closer than one edit to anything
+                        return None
+        return nearest
+
+    def match_ids(self, tokens):
+        """
+        Finds every skill, or variant of one, in a list of terms (from split_terms).
+
+        Returns:
+            dict: Category name -> array of skill IDs, in order of first occurrence.
+        """
+        found_ids = [self.registry.new_array() for _ in self.categories]
+        seen = set()
+        keys = self._keys
+        variants = self._variants
+        window = self.max_phrase_tokens
+        longest = self._longest_key
+        phrases = self._phrases
+        fuzzy = [token not in STOP_WORDS for token in tokens]
+        common = [token in COMMON_WORDS for token in tokens]
+        corrected = [self.correct(token) if ok else token for token, ok in zip(tokens, fuzzy)]
+        n = len(tokens)
+        for i in range(n):
+            joined = fixed = ""
+            changed = False
+            all_common = True
+            for j in range(i, min(n, i + window)):
+                joined += tokens[j]
+                if len(joined) > longest:
+                    break
+                fixed += corrected[j]
+                changed = changed or corrected[j] != tokens[j]
+                all_common = all_common and common[j]
+                if all_common and j > i and tuple(tokens[i:j + 1]) not in phrases:
+                    # Ordinary words next to each other, not a skill split apart
+                    continue
+                found = keys.get(joined)
+                if not found and fuzzy[i] and fuzzy[j] and not (all_common and j == i):
+                    found = variants.get(joined) or (changed and keys.get(fixed))
+                if found:
+                    for seen_key, category_index, skill_id in found:
+                        if seen_key not in seen:
+                            seen.add(seen_key)
+                            found_ids[category_index].append(skill_id)
+        return dict(zip(self.categories, found_ids))
+
+    def match(self, tokens):
+        """
+        Like match_ids, but returns skill names.
+
+        Returns:
+            dict: Category name -> list of skills, in order of first occurrence.
+        """
+        return self.registry.decode_skills(self.match_ids(tokens))
+
+    def stream(self):
+        """
+        Starts an incremental match, for documents read in pieces.
+
+        Returns:
+            FuzzySkillStream: Accepts terms through feed().
+        """
+        return FuzzySkillStream(self)
+
+
+class FuzzySkillStream:
+    """
+    Incremental counterpart of FuzzySkillMatcher.match_ids. It keeps the last
+    max_phrase_tokens - 1 terms, so runs split across pieces are still joined.
+    """
+
+    def __init__(self, matcher):
+        self.matcher = matcher
+        self._found_ids = [matcher.registry.new_array() for _ in matcher.categories]
+        self._seen = set()
+        self._carry = []
+
+    @property
+    def ids(self):
+        """Category name -> array of the skill IDs found so far."""
+        return dict(zip(self.matcher.categories, self._found_ids))
+
+    @property
+    def result(self):
+        """Category name -> list of the skills found so far."""
+        return self.matcher.registry.decode_skills(self.ids)
+
+    def feed(self, tokens):
+        """
+        Consumes the next terms of the document.
+
+        Args:
+            tokens (list): Terms following those already fed.
+        """
+        if not tokens:
+            return
+        tokens = self._carry + list(tokens)
+        found = self.matcher.match_ids(tokens)
+        seen = self._seen
+        num_categories = len(self.matcher.categories)
+        for category_index, category in enumerate(self.matcher.categories):
+            for skill_id in found[category]:
+                seen_key = skill_id * num_categories + category_index
+                if seen_key not in seen:
+                    seen.add(seen_key)
+                    self._found_ids[category_index].append(skill_id)
+        keep = self.matcher.max_phrase_tokens - 1
+        self._carry = tokens[max(0, len(tokens) - keep):] if keep else []
@@ -0,0 +1,183 @@
+import logging
+import sqlite3
+import threading
+
+from skills_extractor import extract_skills
+from skill_matcher import get_match_level
+from skill_store import SKILL_CATEGORIES
+
+
+class JobIndex:
+    """
+    Persistent inverted index from skill to job posting, stored in SQLite.
+
+    Each posting keeps the number of skills it has per category; the index maps
+    every (skill, category) pair to the postings that require it. A query only
+    reads the postings that share at least one skill with the candidate, and is
+    scored and ranked inside SQLite, so its cost depends on how common the
+    candidate's skills are rather than on the number of postings stored.
+    """
+
+    def __init__(self, path):
+        """
+        Opens (or creates) the index.
+
+        Args:
+            path (str): SQLite database file, or ':memory:'.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS postings (
+                posting_id TEXT PRIMARY KEY,
+                title TEXT,
+                programming_skills INTEGER NOT NULL,
+                technical_skills INTEGER NOT NULL,
+                soft_skills INTEGER NOT NULL,
+                management_skills INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS skill_postings (
+                skill TEXT NOT NULL,
+                category TEXT NOT NULL,
+                posting_id TEXT NOT NULL,
+                PRIMARY KEY (skill, category, posting_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS skill_postings_by_posting ON skill_postings (posting_id);
+        """)
+        self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def add_posting(self, posting_id, job_description, title=None):
+        """
+        Extracts skills from a job description and indexes it, replacing any
+        posting already stored under the same ID.
+
+        Args:
+            posting_id (str): Unique posting ID.
+            job_description (str): The job description text.
+            title (str): Optional display title.
+
+        Returns:
+            dict: The extracted, categorized skills.
+        """
+        job_skills = extract_skills(job_description)
+        self.add_skills(posting_id, job_skills, title)
+        return job_skills
+
+    def add_skills(self, posting_id, job_skills, title=None):
+        """
+        Indexes a posting from skills that were already extracted.
+
+        Args:
+            posting_id (str): Unique posting ID.
+            job_skills (dict): Categorized skills, as returned by extract_skills.
+            title (str): Optional display title.
+        """
+        posting_id = str(posting_id)
+        sizes = [len(set(job_skills.get(category, []))) for category in SKILL_CATEGORIES]
+        rows = {
+            (skill, category, posting_id)
+            for category in SKILL_CATEGORIES
+            for skill in job_skills.get(category, [])
+        }
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM skill_postings WHERE posting_id = ?", (posting_id,))
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO postings (posting_id, title, {', '.join(SKILL_CATEGORIES)}) VALUES (?, ?, ?, ?, ?, ?)",
+                (posting_id, title, *sizes),
+            )
+            self._conn.executemany("INSERT INTO skill_postings (skill, category, posting_id) VALUES (?, ?, ?)", rows)
+
+    def remove_posting(self, posting_id):
+        """
+        Removes a posting from the index.
+
+        Args:
+            posting_id (str): The posting ID.
+
+        Returns:
+            bool: True if the posting existed.
+        """
+        posting_id = str(posting_id)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM skill_postings WHERE posting_id = ?", (posting_id,))
+            deleted = self._conn.execute("DELETE FROM postings WHERE posting_id = ?", (posting_id,)).rowcount
+        return deleted > 0
+
+    def query(self, candidate_skills, weights, top_k=10, credits=None):
+        """
+        Ranks the indexed postings against a candidate's skills.
+
+        Scores follow match_skills: each category scores the share of the
+        posting's skills the candidate has (100 if the posting lists none),
+        and the overall score is their weighted average. A skill the candidate
+        lacks but has an explicitly weighted alternative for counts as that
+        fraction of a match, as in analyze_match.
+
+        Args:
+            candidate_skills (dict): Categorized candidate skills.
+            weights (dict): Weights for each skill category.
+            top_k (int): Number of postings to return.
+            credits (dict): Skill -> partial credit, as analyzer.alternative_credits returns.
+
+        Returns:
+            list: Up to top_k dicts with 'id', 'title', 'overallScore',
+                  'matchLevel' and per-category 'scores', best first.
+        """
+        matches = {
+            (skill, category): 1.0
+            for category in SKILL_CATEGORIES
+            for skill in candidate_skills.get(category, [])
+        }
+        for skill, credit in (credits or {}).items():
+            for category in SKILL_CATEGORIES:
+                matches.setdefault((skill, category), credit)
+        total_weight = sum(weights.values())
+        if not matches or total_weight == 0 or top_k <= 0:
+            return []
+
+        values = ", ".join("(?, ?, ?)" for _ in matches)
+        matched = ",\n".join(f"SUM(CASE WHEN s.category = '{c}' THEN v.column3 ELSE 0 END) AS {c}" for c in SKILL_CATEGORIES)
+        scores = ",\n".join(
+            f"CASE WHEN p.{c} = 0 THEN 100.0 ELSE 100.0 * m.{c} / p.{c} END AS {c}" for c in SKILL_CATEGORIES
+        )
+        sql = f"""
+            SELECT posting_id, title, {', '.join(SKILL_CATEGORIES)},
+                   ({' + '.join(f'? * {c}' for c in SKILL_CATEGORIES)}) / ? AS overall
+            FROM (
+                SELECT p.posting_id, p.title, {scores}
+                FROM (
+                    SELECT s.posting_id, {matched}
+                    FROM (VALUES {values}) AS v
+                    JOIN skill_postings AS s ON s.skill = v.column1 AND s.category = v.column2
+                    GROUP BY s.posting_id
+                ) AS m
+                JOIN postings AS p ON p.posting_id = m.posting_id
+            )
+            ORDER BY overall DESC, posting_id
+            LIMIT ?
+        """
+        params = [value for (skill, category), credit in matches.items() for value in (skill, category, credit)]
+        params = [weights.get(c, 0) for c in SKILL_CATEGORIES] + [total_weight] + params + [top_k]
+        with self._lock:
+            best = self._conn.execute(sql, params).fetchall()
+
+        logging.debug("JobIndex.query: returning %s postings", len(best))
+        return [
+            {
+                "id": row[0],
+                "title": row[1],
+                "overallScore": round(row[-1], 2),
+                "matchLevel": get_match_level(row[-1]),
+                "scores": dict(zip(SKILL_CATEGORIES, row[2:-1])),
+            }
+            for row in best
+        ]
@@ -0,0 +1,177 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# Upper bounds of the document size buckets (characters or tokens)
+SIZE_BUCKETS = tuple(4 ** exponent for exponent in range(2, 13))
+
+
+class Histogram:
+    """
+    Cumulative histogram with one label, rendered in the Prometheus text format.
+    """
+
+    def __init__(self, name, help_text, label, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, label_value, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {key: (list(counts), total, count) for key, (counts, total, count) in self._series.items()}
+        for label_value in sorted(series):
+            counts, total, count = series[label_value]
+            label = f'{self.label}="{label_value}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label}}} {total}")
+            lines.append(f"{self.name}_count{{{label}}} {count}")
+        return "\n".join(lines)
+
+
+stage_seconds = Histogram(
+    "analyzer_stage_seconds", "Time spent in each analysis stage.", "stage", LATENCY_BUCKETS
+)
+request_seconds = Histogram(
+    "analyzer_request_seconds", "Time spent handling each HTTP endpoint.", "endpoint", LATENCY_BUCKETS
+)
+document_size = Histogram(
+    "analyzer_document_size", "Size of documents passed to extract_skills.", "unit", SIZE_BUCKETS
+)
+
+_HISTOGRAMS = {"stage": stage_seconds, "size": document_size}
+
+
+class _Collector:
+    # Gathers the samples of one request (for a trace) or one pool task (to
+    # send back to the parent process, which owns the histograms)
+    def __init__(self, local):
+        self.local = local
+        self.samples = []
+
+
+_collector = ContextVar("metrics_collector", default=None)
+
+
+def _record(kind, name, value):
+    collector = _collector.get()
+    if collector is not None:
+        collector.samples.append((kind, name, value))
+        if not collector.local:
+            return
+    _HISTOGRAMS[kind].observe(name, value)
+
+
+def record_size(unit, value):
+    """
+    Records the size of a document, e.g. record_size("tokens", len(tokens)).
+    """
+    _record("size", unit, value)
+
+
+class stage:
+    """
+    Times a block of code as one analysis stage:
+
+        with stage("tokenize"):
+            tokens = ...
+    """
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _record("stage", self.name, time.perf_counter() - self.start)
+        return False
+
+
+def start_trace():
+    """
+    Starts collecting the stages of the current request.
+
+    Returns:
+        object: A token for finish_trace().
+    """
+    return _collector.set(_Collector(local=True))
+
+
+def finish_trace(token):
+    """
+    Stops the trace started with start_trace().
+
+    Returns:
+        list: One {'stage', 'ms'} dict per timed stage, in order.
+    """
+    collector = _collector.get()
+    _collector.reset(token)
+    if collector is None:
+        return []
+    return [
+        {"stage": name, "ms": round(value * 1000, 3)}
+        for kind, name, value in collector.samples
+        if kind == "stage"
+    ]
+
+
+def collect(fn, *args, **kwargs):
+    """
+    Runs fn and returns (result, samples) instead of recording the samples
+    locally. Used by worker processes, whose samples are replayed in the parent.
+    """
+    token = _collector.set(_Collector(local=False))
+    try:
+        result = fn(*args, **kwargs)
+        return result, _collector.get().samples
+    finally:
+        _collector.reset(token)
+
+
+def replay(samples):
+    """
+    Records samples collected in another process.
+    """
+    for kind, name, value in samples:
+        _record(kind, name, value)
+
+
+def render(extra=()):
+    """
+    Renders every metric in the Prometheus text exposition format.
+
+    Args:
+        extra (iterable): (name, type, help, value) tuples for additional
+                          counters or gauges.
+
+    Returns:
+        str: The metrics page.
+    """
+    parts = [stage_seconds.render(), request_seconds.render(), document_size.render()]
+    for name, metric_type, help_text, value in extra:
+        parts.append(f"# HELP {name} {help_text}\n# TYPE {name} {metric_type}\n{name} {value}")
+    return "\n".join(parts) + "\n"
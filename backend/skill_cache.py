@@ -0,0 +1,244 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_for_cache(text):
+    """
+    Normalizes text so that edits extract_skills ignores (case, whitespace)
+    still map to the same cache entry.
+    """
+    return " ".join(text.lower().split())
+
+
+class SkillCache:
+    """
+    Content-addressed cache of extract_skills results.
+
+    Entries are keyed by a hash of the normalized text and a fingerprint of the
+    skill dictionaries, so a dictionary change can never serve stale skills.
+    A bounded in-memory LRU sits in front of an optional SQLite file that
+    survives restarts and is shared by every process using the same path. The
+    file keeps at most max_disk_entries entries, dropping the oldest written.
+
+    Entries are skill ID arrays from the caller's registry, which belongs to
+    the fingerprint in the key; the disk tier stores names, so it does not
+    depend on how IDs are assigned.
+    """
+
+    # Writes between two checks of the disk tier's size
+    PRUNE_INTERVAL = 1000
+
+    def __init__(self, max_entries=1024, path=None, max_disk_entries=100000):
+        """
+        Args:
+            max_entries (int): Size of the in-memory LRU (0 disables it).
+            path (str): SQLite file for the on-disk tier, or None for memory only.
+            max_disk_entries (int): Entries kept in the SQLite file.
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_entries = max_disk_entries
+        self._writes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes use of the SQLite connection, apart from the memory tier
+        self._disk_lock = threading.Lock()
+        self._fingerprint = None
+        self._conn = None
+        self._conn_pid = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(text, fingerprint):
+        """
+        Returns the cache key for a text under a given dictionary fingerprint.
+        """
+        digest = hashlib.sha256(fingerprint.encode())
+        digest.update(b"\0")
+        digest.update(normalize_for_cache(text).encode())
+        return digest.hexdigest()
+
+    def _disk(self):
+        # SQLite connections must not cross a fork, so open one per process.
+        # Callers hold _disk_lock.
+        if self.path is None:
+            return None
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(skill_cache)")]
+            if columns and "created" not in columns:
+                # Written before entries were timestamped; it is only a cache
+                self._conn.execute("DROP TABLE skill_cache")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS skill_cache (
+                    key TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    skills TEXT NOT NULL,
+                    created REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS skill_cache_by_created ON skill_cache (created)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS skill_cache_versions (
+                    fingerprint TEXT PRIMARY KEY,
+                    first_seen REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def set_fingerprint(self, fingerprint):
+        """
+        Switches to new dictionaries. Called whenever the skill dictionaries
+        may have changed; cheap when they have not.
+
+        The memory tier is cleared. On disk, only entries of other
+        fingerprints written before this one was first seen are dropped, so
+        processes still running older dictionaries against the same file keep
+        the entries they write, and one going back to older dictionaries does
+        not wipe the newer ones.
+
+        Args:
+            fingerprint (str): Fingerprint of the current dictionaries.
+        """
+        with self._lock:
+            if fingerprint == self._fingerprint:
+                return
+            self._fingerprint = fingerprint
+            self._entries.clear()
+        with self._disk_lock:
+            try:
+                conn = self._disk()
+                if conn is not None:
+                    with conn:
+                        conn.execute(
+                            "INSERT OR IGNORE INTO skill_cache_versions (fingerprint, first_seen) VALUES (?, ?)",
+                            (fingerprint, time.time()),
+                        )
+                        conn.execute(
+                            """
+                            DELETE FROM skill_cache WHERE fingerprint != ? AND created < (
+                                SELECT first_seen FROM skill_cache_versions WHERE fingerprint = ?
+                            )
+                            """,
+                            (fingerprint, fingerprint),
+                        )
+            except sqlite3.Error as e:
+                logging.error(f"SkillCache: Could not invalidate disk cache: {e}")
+
+    def get(self, key, registry):
+        """
+        Looks up a key in memory, then on disk. The disk lookup runs outside
+        the memory lock, so memory hits never wait on SQLite.
+
+        Args:
+            key (str): The cache key (see key()).
+            registry (SkillRegistry): IDs of the fingerprint in the key; skills
+                                      read from disk are encoded with it.
+
+        Returns:
+            dict: The cached {category: array of skill IDs}, shared with the
+                  cache (do not modify), or None on a miss.
+        """
+        with self._lock:
+            skill_ids = self._entries.get(key)
+            if skill_ids is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return skill_ids
+            fingerprint = self._fingerprint
+        with self._disk_lock:
+            try:
+                conn = self._disk()
+                row = conn.execute("SELECT skills FROM skill_cache WHERE key = ?", (key,)).fetchone() if conn else None
+            except sqlite3.Error as e:
+                logging.error(f"SkillCache: Disk lookup failed: {e}")
+                row = None
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        skill_ids = registry.encode_skills(json.loads(row[0]))
+        with self._lock:
+            self.disk_hits += 1
+            if fingerprint == self._fingerprint:
+                self._remember(key, skill_ids)
+        return skill_ids
+
+    def put(self, key, skill_ids, fingerprint, registry):
+        """
+        Stores extracted skills ({category: array of skill IDs} from registry)
+        in both tiers. The arrays must not be modified afterwards. Skills
+        extracted under a fingerprint that has since been replaced are not
+        stored. The disk write runs outside the memory lock.
+        """
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                return
+            self._remember(key, skill_ids)
+        if self.path is None:
+            return
+        skills = json.dumps(registry.decode_skills(skill_ids))
+        with self._disk_lock:
+            try:
+                conn = self._disk()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO skill_cache (key, fingerprint, skills, created) VALUES (?, ?, ?, ?)",
+                        (key, fingerprint, skills, time.time()),
+                    )
+                self._writes += 1
+                if self._writes % self.PRUNE_INTERVAL == 1:
+                    self._prune(conn)
+            except sqlite3.Error as e:
+                logging.error(f"SkillCache: Disk write failed: {e}")
+
+    def _prune(self, conn):
+        # Drops the oldest entries beyond max_disk_entries. Callers hold _disk_lock.
+        with conn:
+            removed = conn.execute(
+                """
+                DELETE FROM skill_cache WHERE key IN (
+                    SELECT key FROM skill_cache ORDER BY created DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_disk_entries,),
+            ).rowcount
+        if removed:
+            logging.info(f"SkillCache: Pruned {removed} disk entries")
+
+    def _remember(self, key, skill_ids):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = skill_ids
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        """
+        Returns the hit/miss/eviction counters and current size.
+        """
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "diskHits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+                "hitRate": (self.hits + self.disk_hits) / lookups if lookups else 0,
+                "diskPath": self.path,
+            }
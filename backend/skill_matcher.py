@@ -1,25 +1,30 @@
 from skills_extractor import extract_skills
+from alternative_index import AlternativeGroupIndex
 import logging
 
 
 def resolve_alternative_groups(job_skills_set, resume_skills_set, alternative_groups):
-    matched_keywords = set()
-    skipped_keywords = set()
-
-    for group in alternative_groups:
-        group_in_jd = group & job_skills_set
-        if not group_in_jd:
-            continue  # this group isn't in the JD, skip it
-
-        if group & resume_skills_set:
-            # At least one match, pick one to show as matched
-            matched_keywords.add(next(iter(group & resume_skills_set)))
-        else:
-            # No matches, pick one from JD group to show as missing
-            skipped_keywords.add(next(iter(group_in_jd)))
-
-        # Exclude entire group from regular matching
-        job_skills_set -= group_in_jd
+    """
+    Resolves alternative skill groups between a job description and a candidate.
+
+    Args:
+        job_skills_set (set): Skills from the job description. Members of the
+                              groups it mentions are removed from it.
+        resume_skills_set (set): Skills from the candidate.
+        alternative_groups: An AlternativeGroupIndex, or a list of skill sets
+                            (indexed on the fly).
+
+    Returns:
+        tuple: (matched keywords, missing keywords).
+    """
+    if not isinstance(alternative_groups, AlternativeGroupIndex):
+        alternative_groups = AlternativeGroupIndex(alternative_groups)
+
+    matched_keywords, skipped_keywords, _ = alternative_groups.resolve(job_skills_set, resume_skills_set)
+
+    # Exclude entire groups from regular matching
+    for group_id in alternative_groups.groups_of(job_skills_set):
+        job_skills_set -= alternative_groups.groups[group_id]
 
     return matched_keywords, skipped_keywords
 
@@ -0,0 +1,85 @@
+from array import array
+
+
+class SkillRegistry:
+    """
+    Interned skill names: every skill of a snapshot gets a small integer ID.
+
+    IDs are assigned in sorted name order, so comparing IDs gives the same
+    result as comparing the names, and a set of IDs read in ascending order is
+    already the sorted list of names. Extraction returns one array of IDs per
+    category and scoring works on bitsets (Python ints with bit `id` set);
+    names are only looked up again when building a response.
+    """
+
+    def __init__(self, names):
+        """
+        Args:
+            names (iterable): Every skill name, in any order (duplicates allowed).
+        """
+        self.names = tuple(sorted(set(names)))
+        self.ids = {name: skill_id for skill_id, name in enumerate(self.names)}
+        # Two bytes per skill as long as the IDs fit
+        self.typecode = 'H' if len(self.names) <= 1 << 16 else 'I'
+
+    def __len__(self):
+        return len(self.names)
+
+    def new_array(self, ids=()):
+        """
+        Returns a compact array of skill IDs.
+        """
+        return array(self.typecode, ids)
+
+    def encode(self, names):
+        """
+        Converts skill names to an array of IDs. Names that are not in the
+        registry cannot be matched against anything and are dropped.
+        """
+        ids = self.ids
+        return array(self.typecode, [ids[name] for name in names if name in ids])
+
+    def encode_skills(self, skills):
+        """
+        Converts categorized skill names ({category: [names]}) to IDs.
+        """
+        return {category: self.encode(found) for category, found in skills.items()}
+
+    def decode(self, ids):
+        """
+        Converts IDs back to a list of names, keeping their order.
+        """
+        names = self.names
+        return [names[skill_id] for skill_id in ids]
+
+    def decode_skills(self, skill_ids):
+        """
+        Converts categorized IDs ({category: array}) back to names.
+        """
+        return {category: self.decode(found) for category, found in skill_ids.items()}
+
+    def decode_bits(self, bits):
+        """
+        Returns the names in a bitset, sorted.
+        """
+        return self.decode(iter_bits(bits))
+
+
+def to_bits(ids):
+    """
+    Builds a bitset from skill IDs.
+    """
+    bits = 0
+    for skill_id in ids:
+        bits |= 1 << skill_id
+    return bits
+
+
+def iter_bits(bits):
+    """
+    Yields the IDs in a bitset in ascending order.
+    """
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
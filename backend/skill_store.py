@@ -0,0 +1,325 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from types import MappingProxyType
+
+from alias_engine import AliasEngine
+from alternative_index import AlternativeGroupIndex
+from fuzzy_matcher import FuzzySkillMatcher
+from skill_registry import SkillRegistry
+from skill_trie import SkillMatcher
+from tokenizer import tokenize
+
+
+SKILL_CATEGORIES = ("programming_skills", "technical_skills", "soft_skills", "management_skills")
+FEEDBACK_CATEGORIES = SKILL_CATEGORIES + ("alternative_technical_skills_groups", "skill_aliases")
+# Category weights of the analysis endpoints (can be adjusted)
+SKILL_WEIGHTS = {
+    "programming_skills": 0.3,
+    "technical_skills": 0.3,
+    "soft_skills": 0.2,
+    "management_skills": 0.2,
+}
+
+
+class SkillSnapshot:
+    """
+    One immutable version of the skill dictionaries.
+
+    Readers take a snapshot once and use it for the whole request, so they see
+    a consistent set of dictionaries even while feedback is being applied.
+    Structures compiled from the dictionaries (the skill registry and matchers,
+    the content fingerprint) are built lazily and kept on the snapshot they
+    belong to.
+    """
+
+    def __init__(self, version, categories, alternative_groups, aliases, alternative_weights=None):
+        """
+        Args:
+            version (int): ID of the last feedback entry included (0 for the defaults).
+            categories (dict): Category name -> frozenset of skills.
+            alternative_groups (tuple): Frozensets of interchangeable skills.
+            aliases (Mapping): Alias phrase -> skill.
+            alternative_weights (Mapping): (required, offered) -> partial credit
+                                           between members of a group.
+        """
+        self.version = version
+        self.categories = MappingProxyType(dict(categories))
+        self.alternative_groups = tuple(alternative_groups)
+        self.aliases = MappingProxyType(dict(aliases))
+        self.alternative_weights = MappingProxyType(dict(alternative_weights or {}))
+        self._registry = None
+        self._alias_engine = None
+        self._matcher = None
+        self._fuzzy_matcher = None
+        self._alternative_index = None
+        self._fingerprint = None
+
+    @property
+    def registry(self):
+        """
+        The SkillRegistry of every skill, alias target and group member. It
+        depends only on the content hashed by fingerprint, so IDs are stable
+        for as long as the fingerprint is.
+        """
+        # Two threads may both build it on first use; either result is correct
+        if self._registry is None:
+            names = set(self.aliases.values())
+            for skills in self.categories.values():
+                names.update(skills)
+            for group in self.alternative_groups:
+                names.update(group)
+            self._registry = SkillRegistry(names)
+        return self._registry
+
+    @property
+    def alias_engine(self):
+        """
+        The AliasEngine compiled from this snapshot's aliases. Its targets
+        (aliases resolved to the end of their chains) also feed the matchers.
+        """
+        if self._alias_engine is None:
+            self._alias_engine = AliasEngine(self.aliases, tokenize)
+        return self._alias_engine
+
+    @property
+    def matcher(self):
+        """The SkillMatcher compiled from this snapshot."""
+        if self._matcher is None:
+            self._matcher = SkillMatcher(self.categories, self.alias_engine.targets, tokenize, self.registry)
+        return self._matcher
+
+    @property
+    def fuzzy_matcher(self):
+        """The FuzzySkillMatcher compiled from this snapshot."""
+        if self._fuzzy_matcher is None:
+            self._fuzzy_matcher = FuzzySkillMatcher(self.categories, self.alias_engine.targets, self.registry)
+        return self._fuzzy_matcher
+
+    @property
+    def alternative_index(self):
+        """
+        The AlternativeGroupIndex built from this snapshot's groups, over skill
+        IDs. IDs sort like the names, so it resolves exactly as it would on names.
+        """
+        if self._alternative_index is None:
+            ids = self.registry.ids
+            groups = [[ids[skill] for skill in group] for group in self.alternative_groups]
+            weights = {
+                (ids[required], ids[offered]): weight
+                for (required, offered), weight in self.alternative_weights.items()
+                if required in ids and offered in ids
+            }
+            self._alternative_index = AlternativeGroupIndex(groups, weights)
+        return self._alternative_index
+
+    @property
+    def fingerprint(self):
+        """
+        Hash of the categories, aliases and alternative groups (everything the
+        skill IDs are assigned from). Unlike version it does not depend on the
+        feedback history, so it can key caches that outlive the store.
+        """
+        if self._fingerprint is None:
+            content = json.dumps(
+                [sorted(self.categories[c]) for c in SKILL_CATEGORIES]
+                + [sorted(self.aliases.items())]
+                + [sorted(sorted(group) for group in self.alternative_groups)]
+            )
+            self._fingerprint = hashlib.sha256(content.encode()).hexdigest()
+        return self._fingerprint
+
+    def apply(self, version, category, skill, original=None):
+        """
+        Returns a new snapshot with one feedback entry applied. Only the
+        structure that changes is copied; the others are shared.
+        """
+        categories = self.categories
+        groups = self.alternative_groups
+        aliases = self.aliases
+        if category in SKILL_CATEGORIES:
+            categories = dict(categories)
+            categories[category] = categories[category] | {skill}
+        elif category == 'alternative_technical_skills_groups':
+            if not any(skill in group for group in groups):
+                groups = groups + (frozenset([skill]),)
+        elif category == 'skill_aliases':
+            if original:
+                aliases = dict(aliases)
+                aliases[original] = skill
+        else:
+            raise ValueError(f"Invalid skill category: {category}")
+        return SkillSnapshot(version, categories, groups, aliases, self.alternative_weights)
+
+
+class SkillStore:
+    """
+    Versioned skill dictionaries with copy-on-write snapshots.
+
+    Every /feedback change is appended to a SQLite log and applied to a new
+    snapshot, which then replaces the current one in a single reference swap;
+    readers never take a lock. Other processes sharing the log pick up new
+    entries on their next read once the reload interval has passed.
+    """
+
+    def __init__(self, categories, alternative_groups, aliases, path=None, reload_interval=1.0, alternative_weights=None):
+        """
+        Args:
+            categories (dict): Default category name -> skills.
+            alternative_groups (list): Default groups of interchangeable skills.
+            aliases (dict): Default alias phrase -> skill.
+            path (str): SQLite file holding the feedback log, or None to keep
+                        changes in memory only.
+            reload_interval (float): Seconds between checks for entries written
+                                     by other processes.
+            alternative_weights (dict): (required, offered) -> partial credit
+                                        between members of a group.
+        """
+        self.path = path
+        self.reload_interval = reload_interval
+        self._snapshot = SkillSnapshot(
+            0,
+            {c: frozenset(categories[c]) for c in SKILL_CATEGORIES},
+            [frozenset(group) for group in alternative_groups],
+            aliases,
+            alternative_weights,
+        )
+        self._write_lock = threading.Lock()
+        self._next_check = 0
+        self._conn = None
+        self._conn_pid = None
+        if path:
+            with self._write_lock:
+                self._load_new_entries()
+
+    @property
+    def persistent(self):
+        return self.path is not None
+
+    @property
+    def version(self):
+        return self._snapshot.version
+
+    def _db(self):
+        # SQLite connections must not cross a fork, so open one per process
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS feedback_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    category TEXT NOT NULL,
+                    skill TEXT NOT NULL,
+                    original TEXT,
+                    created REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def _load_new_entries(self):
+        # Caller holds the write lock
+        snapshot = self._snapshot
+        rows = self._db().execute(
+            "SELECT id, category, skill, original FROM feedback_log WHERE id > ? ORDER BY id",
+            (snapshot.version,),
+        ).fetchall()
+        for entry_id, category, skill, original in rows:
+            try:
+                snapshot = snapshot.apply(entry_id, category, skill, original)
+            except ValueError as e:
+                logging.error(f"SkillStore: Skipping feedback entry {entry_id}: {e}")
+                snapshot = SkillSnapshot(
+                    entry_id, snapshot.categories, snapshot.alternative_groups, snapshot.aliases, snapshot.alternative_weights
+                )
+        if rows:
+            logging.info(f"SkillStore: loaded {len(rows)} feedback entries, now at version {snapshot.version}")
+        self._snapshot = snapshot
+        self._next_check = time.monotonic() + self.reload_interval
+
+    def snapshot(self):
+        """
+        Returns the current dictionaries, reloading entries written by other
+        processes if the reload interval has passed.
+
+        Returns:
+            SkillSnapshot: An immutable, consistent version of the dictionaries.
+        """
+        if self.path and time.monotonic() >= self._next_check:
+            # Only one thread reloads; the others keep reading the current snapshot
+            if self._write_lock.acquire(blocking=False):
+                try:
+                    self._load_new_entries()
+                except sqlite3.Error as e:
+                    logging.error(f"SkillStore: Reload failed: {e}")
+                    self._next_check = time.monotonic() + self.reload_interval
+                finally:
+                    self._write_lock.release()
+        return self._snapshot
+
+    def export(self):
+        """
+        Returns the current dictionaries as plain, picklable values, for
+        adopt() in another process.
+        """
+        snapshot = self._snapshot
+        return (
+            snapshot.version,
+            {category: sorted(skills) for category, skills in snapshot.categories.items()},
+            [sorted(group) for group in snapshot.alternative_groups],
+            dict(snapshot.aliases),
+            list(snapshot.alternative_weights.items()),
+        )
+
+    def adopt(self, dictionaries):
+        """
+        Replaces the current snapshot with dictionaries exported by another
+        process (see export), e.g. a worker taking its parent's in-memory feedback.
+        """
+        version, categories, groups, aliases, weights = dictionaries
+        with self._write_lock:
+            self._snapshot = SkillSnapshot(
+                version,
+                {category: frozenset(skills) for category, skills in categories.items()},
+                [frozenset(group) for group in groups],
+                aliases,
+                dict((tuple(pair), weight) for pair, weight in weights),
+            )
+
+    def apply_feedback(self, category, skill, original=None):
+        """
+        Records a feedback change and publishes the resulting snapshot.
+
+        Args:
+            category (str): A skill category, 'alternative_technical_skills_groups'
+                            or 'skill_aliases'.
+            skill (str): The skill to add (or the alias target).
+            original (str): The alias phrase, for 'skill_aliases'.
+
+        Raises:
+            ValueError: If the category is unknown.
+
+        Returns:
+            int: The dictionary version after the change.
+        """
+        if category not in FEEDBACK_CATEGORIES:
+            raise ValueError(f"Invalid skill category: {category}")
+        if category == 'skill_aliases' and not original:
+            return self.version
+        with self._write_lock:
+            if self.path:
+                conn = self._db()
+                with conn:
+                    conn.execute(
+                        "INSERT INTO feedback_log (category, skill, original, created) VALUES (?, ?, ?, ?)",
+                        (category, skill, original, time.time()),
+                    )
+                # Replays entries other processes added in the meantime, then ours
+                self._load_new_entries()
+            else:
+                self._snapshot = self._snapshot.apply(self._snapshot.version + 1, category, skill, original)
+            return self._snapshot.version
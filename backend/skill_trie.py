@@ -0,0 +1,199 @@
+import logging
+
+from skill_registry import SkillRegistry
+
+
+# Key used inside a trie node to hold the (category, skill) pairs that end there.
+# Tokens are always non-empty strings, so None can never collide with a child.
+_TERMINAL = None
+
+
+def _loses_meaning(phrase, key):
+    # A phrase the tokenizer cuts down to a single character (e.g. "c#" if '#'
+    # were stripped) would match every stray letter in a document, so it is
+    # left out instead
+    if len(key) == 1 and len(key[0]) == 1 and len(phrase.strip()) > 1:
+        logging.warning(f"SkillMatcher: '{phrase}' tokenizes to '{key[0]}'. Not matching it.")
+        return True
+    return False
+
+
+class SkillMatcher:
+    """
+    Token trie compiled from the skill dictionaries and skill aliases.
+
+    Every skill and alias phrase is tokenized with the same tokenizer used for
+    documents and inserted as a path of whole tokens, so matches always respect
+    word boundaries. A document is scanned once from left to right; at each
+    position the trie is walked only as far as the longest phrase allows, which
+    keeps the cost proportional to the document length rather than to the size
+    of the dictionaries.
+
+    Terminal nodes hold skill IDs from a SkillRegistry, so matches are
+    collected as compact arrays and only turned into names on request.
+    """
+
+    def __init__(self, categories, aliases, tokenize, registry=None):
+        """
+        Builds the trie.
+
+        Args:
+            categories (dict): Mapping of category name to an iterable of skills.
+            aliases (dict): Mapping of alias phrase to the skill it stands for.
+            tokenize (callable): Function turning a phrase into a list of tokens.
+            registry (SkillRegistry): IDs to use for the skills (one covering
+                                      every skill in categories is built if None).
+        """
+        self.categories = list(categories)
+        if registry is None:
+            registry = SkillRegistry(skill for skills in categories.values() for skill in skills)
+        self.registry = registry
+        # Documents must be split the same way before match_ids
+        self.tokenize = tokenize
+        self.root = {}
+        self.size = 0
+        # Tokens in the longest phrase; a match never spans more than this
+        self.max_phrase_tokens = 0
+
+        # Canonical phrase (as a token tuple) -> [(seen key, category index, skill ID), ...]
+        entries = {}
+        num_categories = len(self.categories)
+        for category_index, skills in enumerate(categories.values()):
+            for skill in skills:
+                key = tuple(tokenize(skill))
+                if not key or _loses_meaning(skill, key):
+                    continue
+                skill_id = registry.ids[skill]
+                pair = (skill_id * num_categories + category_index, category_index, skill_id)
+                bucket = entries.setdefault(key, [])
+                if pair not in bucket:
+                    bucket.append(pair)
+
+        outputs = {key: tuple(bucket) for key, bucket in entries.items()}
+
+        # An alias replaces its phrase with whatever its target resolves to.
+        for phrase, target in aliases.items():
+            key = tuple(tokenize(phrase))
+            if not key or _loses_meaning(phrase, key):
+                continue
+            outputs[key] = tuple(entries.get(tuple(tokenize(target)), ()))
+
+        for key, found in outputs.items():
+            if found:
+                self._insert(key, found)
+
+        logging.debug("SkillMatcher: compiled %s phrases", self.size)
+
+    def _insert(self, key, found):
+        node = self.root
+        for token in key:
+            node = node.setdefault(token, {})
+        node[_TERMINAL] = found
+        self.size += 1
+        self.max_phrase_tokens = max(self.max_phrase_tokens, len(key))
+
+    def match_ids(self, tokens):
+        """
+        Finds every skill in a token stream in one pass.
+
+        Args:
+            tokens (list): The document tokens.
+
+        Returns:
+            dict: Category name -> array of skill IDs, in order of first occurrence.
+        """
+        found_ids = [self.registry.new_array() for _ in self.categories]
+        seen = set()
+        root = self.root
+        n = len(tokens)
+        for i in range(n):
+            node = root.get(tokens[i])
+            j = i + 1
+            while node is not None:
+                found = node.get(_TERMINAL)
+                if found:
+                    for seen_key, category_index, skill_id in found:
+                        if seen_key not in seen:
+                            seen.add(seen_key)
+                            found_ids[category_index].append(skill_id)
+                if j >= n:
+                    break
+                node = node.get(tokens[j])
+                j += 1
+        return dict(zip(self.categories, found_ids))
+
+    def match(self, tokens):
+        """
+        Like match_ids, but returns skill names.
+
+        Returns:
+            dict: Category name -> list of skills, in order of first occurrence.
+        """
+        return self.registry.decode_skills(self.match_ids(tokens))
+
+    def stream(self):
+        """
+        Starts an incremental match, for documents read in pieces.
+
+        Returns:
+            SkillStream: Accepts tokens through feed() and keeps only the partial
+            matches still in progress, so phrases split across pieces are found.
+        """
+        return SkillStream(self)
+
+
+class SkillStream:
+    """
+    Incremental counterpart of SkillMatcher.match.
+
+    Instead of walking the trie forward from each position, it keeps the set of
+    trie nodes reached by phrases that are still open. That set never holds
+    more nodes than the longest phrase has tokens, so memory stays bounded no
+    matter how many tokens are fed.
+    """
+
+    def __init__(self, matcher):
+        self.matcher = matcher
+        self._found_ids = [matcher.registry.new_array() for _ in matcher.categories]
+        self._seen = set()
+        self._active = []
+
+    @property
+    def ids(self):
+        """Category name -> array of the skill IDs found so far."""
+        return dict(zip(self.matcher.categories, self._found_ids))
+
+    @property
+    def result(self):
+        """Category name -> list of the skills found so far."""
+        return self.matcher.registry.decode_skills(self.ids)
+
+    def feed(self, tokens):
+        """
+        Consumes the next tokens of the document.
+
+        Args:
+            tokens (list): Tokens following those already fed.
+        """
+        root = self.matcher.root
+        active = self._active
+        seen = self._seen
+        found_ids = self._found_ids
+        for token in tokens:
+            next_active = []
+            node = root.get(token)
+            if node is not None:
+                next_active.append(node)
+            for node in active:
+                child = node.get(token)
+                if child is not None:
+                    next_active.append(child)
+            for node in next_active:
+                found = node.get(_TERMINAL)
+                if found:
+                    for seen_key, category_index, skill_id in found:
+                        if seen_key not in seen:
+                            seen.add(seen_key)
+                            found_ids[category_index].append(skill_id)
+            active = next_active
+        self._active = active
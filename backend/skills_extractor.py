@@ -1,21 +1,14 @@
-import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 import string
 import logging
+import os
 
-# Download required NLTK data (run this once)
-try:
-    # nltk.download('punkt_tab')
-    # nltk.download('stopwords')
-    pass
-except Exception as e:
-    logging.error(f"Error downloading NLTK data: {e}")
-    # Handle the error appropriately, e.g., return an error to the client or exit
+from skill_cache import SkillCache
+from skill_store import SKILL_CATEGORIES, SkillStore
+from metrics import record_size, stage
+from tokenizer import STOP_WORDS, TOKENIZER, normalize, split_terms, split_terms_stream, split_tokens, tokenize, tokenize_stream
 
 # Define stop words and buzzwords (extend as needed)
-stopWords = set(stopwords.words('english'))
+stopWords = STOP_WORDS
 buzzwords = {
     'synergy', 'paradigm', 'innovative', 'world-class', 'cutting-edge',
     'best-of-breed', 'mission-critical', 'value-added', 'proactive',
@@ -65,6 +58,11 @@ alternative_technical_skills_groups = [
     ]
 ]
 
+# Partial equivalence inside a group: (required, offered) -> credit; others count fully
+alternative_skill_weights = {
+    ("java", "kotlin"): 0.8,
+}
+
 # Skill normalization mapping
 skill_aliases = {
     "html5": "html",
@@ -98,78 +96,213 @@ def preprocess_text(text):
         logging.error(f"preprocess_text: Input is not a string. Returning empty list. Input: {text}")
         return []
     try:
-        text = text.lower()
-        text = re.sub(r"[^a-zA-Z0-9\+\s]", '', text)  # Keep '+' for C++
-        tokens = word_tokenize(text)
-        
-        # Join tokens into phrases for aliasing
-        joined_text = " ".join(tokens)
-        for phrase, alias in skill_aliases.items():
-            if phrase in joined_text:
-                tokens.append(alias)
-        
+        # Alias phrases (multi-word ones included) become the skill they stand for, in one pass
+        tokens = skill_store.snapshot().alias_engine.rewrite(tokenize_text(text))
+
         # Then clean as before
-        tokens = [skill_aliases.get(tok, tok) for tok in tokens]
         filtered_tokens = [word for word in tokens if word not in stopWords and word not in buzzwords and not word.isdigit() and word not in string.punctuation]
-        # # Normalize skills using skill_aliases
-        # normalized_tokens = []
-        # for word in filtered_tokens:
-        #     normalized = skill_aliases.get(word, word)  # replace if alias exists
-        #     if normalized not in stopWords and normalized not in buzzwords and not normalized.isdigit():
-        #         normalized_tokens.append(normalized)
-        
-        logging.debug(f"preprocess_text: filtered_tokens: {filtered_tokens}")
+
+        logging.debug("preprocess_text: filtered_tokens: %s", filtered_tokens)
         return filtered_tokens
     except Exception as e:
         logging.error(f"Error in preprocess_text: {e}")
         return []  # Return empty list in case of error
 
-def extract_skills(text):
+def tokenize_text(text):
     """
-    Extracts and categorizes skills from the given text.
+    Lowercases, strips punctuation (keeping '+' for C++) and tokenizes text.
+
+    Args:
+        text (str): The text to tokenize.
+
+    Returns:
+        list: The raw tokens, before alias expansion and stop word filtering.
+    """
+    return tokenize(text)
+
+
+# The dictionaries above are the defaults; /feedback changes are recorded in the
+# store, persisted to SKILL_STORE_PATH (':memory:' keeps them in this process only).
+# The default sits next to this file, so the working directory does not matter.
+DEFAULT_SKILL_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skill_store.sqlite3')
+_store_path = os.environ.get('SKILL_STORE_PATH') or DEFAULT_SKILL_STORE_PATH
+skill_store = SkillStore(
+    {
+        "programming_skills": programming_skills,
+        "technical_skills": technical_skills,
+        "soft_skills": soft_skills,
+        "management_skills": management_skills,
+    },
+    alternative_technical_skills_groups,
+    skill_aliases,
+    path=None if _store_path == ':memory:' else _store_path,
+    reload_interval=float(os.environ.get('SKILL_STORE_RELOAD_INTERVAL', '1.0')),
+    alternative_weights=alternative_skill_weights,
+)
+
+# Cache of extract_skills results; SKILL_CACHE_PATH enables the on-disk tier
+skill_cache = SkillCache(
+    max_entries=int(os.environ.get('SKILL_CACHE_SIZE', '1024')),
+    path=os.environ.get('SKILL_CACHE_PATH') or None,
+    max_disk_entries=int(os.environ.get('SKILL_CACHE_DISK_ENTRIES', '100000')),
+)
+
+
+# 'exact' (default) matches dictionary phrases token by token; 'fuzzy' also
+# accepts spelling and punctuation variants (see fuzzy_matcher.py)
+SKILL_MATCH_MODE = os.environ.get('SKILL_MATCH_MODE', 'exact').strip().lower()
+if SKILL_MATCH_MODE not in ('exact', 'fuzzy'):
+    logging.error(f"skills_extractor: Unknown SKILL_MATCH_MODE {SKILL_MATCH_MODE!r}. Using exact matching.")
+    SKILL_MATCH_MODE = 'exact'
+
+
+def _use_fuzzy(fuzzy):
+    return SKILL_MATCH_MODE == 'fuzzy' if fuzzy is None else fuzzy
+
+
+def current_snapshot():
+    """
+    Returns the current skill dictionaries. Take one snapshot per request and
+    pass it along so every step sees the same version.
+
+    Returns:
+        SkillSnapshot: The current, immutable dictionaries.
+    """
+    return skill_store.snapshot()
+
+
+def get_skill_matcher(snapshot=None, fuzzy=None):
+    """
+    Returns the compiled skill matcher for a snapshot (the current one by default).
+
+    Args:
+        snapshot (SkillSnapshot): Dictionaries to use (the current ones by default).
+        fuzzy (bool): Whether to return the fuzzy matcher (SKILL_MATCH_MODE by default).
+
+    Returns:
+        SkillMatcher or FuzzySkillMatcher: The matcher for the dictionaries.
+    """
+    snapshot = snapshot or skill_store.snapshot()
+    return snapshot.fuzzy_matcher if _use_fuzzy(fuzzy) else snapshot.matcher
+
+
+def extract_skill_ids(text, snapshot=None, fuzzy=None):
+    """
+    Extracts and categorizes skills from the given text as skill IDs.
 
     Args:
         text (str): The text to extract skills from.
+        snapshot (SkillSnapshot): Dictionaries to use (the current ones by default).
+        fuzzy (bool): Also match spelling and punctuation variants of skills
+                      (SKILL_MATCH_MODE by default).
 
     Returns:
-        dict: A dictionary of extracted skills, categorized.
+        dict: Category name -> array of IDs from snapshot.registry, in order of
+              first occurrence. The arrays may be shared with the skill cache
+              and must not be modified.
     """
-    extracted_skills = {
-        "programming_skills": [],
-        "technical_skills": [],
-        "soft_skills": [],
-        "management_skills": [],
-    }
+    snapshot = snapshot or skill_store.snapshot()
+    registry = snapshot.registry
     if not isinstance(text, str):
         logging.error(f"extract_skills: Input is not a string. Returning default skills. Input: {text}")
-        return extracted_skills
-
-    filtered_text = preprocess_text(text)
-    text_tokens_set = set(filtered_text)  # for exact match
-    joined_text = " ".join(filtered_text)
-    logging.debug(f"extract_skills: text_tokens_set----------------------------------------------------------------------------->: {text_tokens_set}")
-    logging.debug(f"extract_skills: joined_text: {joined_text}")
-
-    #filtered_text_set = set(filtered_text)  # Create a set for faster lookup
-   
-
-    for category, skills in [
-        ("programming_skills", programming_skills),
-        ("technical_skills", technical_skills),
-        ("soft_skills", soft_skills),
-        ("management_skills", management_skills),
-    ]:  
-        extracted = []
-        for skill in skills:
-            if skill in text_tokens_set:
-                extracted.append(skill)
-            elif " " in skill and skill in joined_text:  # handle multi-word skills like 'machine learning'
-                extracted.append(skill)
-        # extracted = [skill for skill in skills if skill in joined_text]
-        #extracted = [skill for skill in skills if any(skill == token for token in filtered_text)]
-        extracted_skills[category] = extracted
-        logging.debug(f"extract_skills----********------: {category}: {extracted}")
+        return {category: registry.new_array() for category in SKILL_CATEGORIES}
 
+    fuzzy = _use_fuzzy(fuzzy)
+    fingerprint = snapshot.fingerprint
+    skill_cache.set_fingerprint(fingerprint)
+    # Every mode shares the cache, so results are keyed by how they were extracted
+    cache_key = skill_cache.key(text, f"{fingerprint}:fuzzy" if fuzzy else f"{fingerprint}:{TOKENIZER}")
+    cached = skill_cache.get(cache_key, registry)
+    if cached is not None:
+        return cached
+
+    try:
+        if fuzzy:
+            with stage("tokenize"):
+                tokens = split_terms(text)
+        else:
+            with stage("preprocess"):
+                normalized = normalize(text)
+            with stage("tokenize"):
+                tokens = split_tokens(normalized)
+    except Exception as e:
+        logging.error(f"Error in extract_skills: {e}")
+        return {category: registry.new_array() for category in SKILL_CATEGORIES}
+    record_size("chars", len(text))
+    record_size("tokens", len(tokens))
+
+    # Alias expansion and every category are resolved in this single pass
+    with stage("skill_match"):
+        skill_ids = get_skill_matcher(snapshot, fuzzy).match_ids(tokens)
+    skill_cache.put(cache_key, skill_ids, fingerprint, registry)
+    return skill_ids
+
+
+def extract_skills(text, snapshot=None, fuzzy=None):
+    """
+    Extracts and categorizes skills from the given text.
+
+    Args:
+        text (str): The text to extract skills from.
+        snapshot (SkillSnapshot): Dictionaries to use (the current ones by default).
+        fuzzy (bool): Also match variants of skills (SKILL_MATCH_MODE by default).
+
+    Returns:
+        dict: A dictionary of extracted skills, categorized.
+    """
+    snapshot = snapshot or skill_store.snapshot()
+    extracted_skills = snapshot.registry.decode_skills(extract_skill_ids(text, snapshot, fuzzy))
+    logging.debug("extract_skills: %s", extracted_skills)
     return extracted_skills
 
 
+def extract_skills_for(text, fingerprint):
+    """
+    Like extract_skills, for worker processes that keep their own copy of the
+    dictionaries: extracts only if that copy matches the caller's snapshot.
+
+    Args:
+        text (str): The text to extract skills from.
+        fingerprint (str): Fingerprint of the caller's snapshot.
+
+    Returns:
+        dict: The categorized skills, or None if this process has other dictionaries.
+    """
+    snapshot = skill_store.snapshot()
+    if snapshot.fingerprint != fingerprint:
+        return None
+    return extract_skills(text, snapshot)
+
+
+def extract_skill_ids_stream(chunks, snapshot=None, fuzzy=None):
+    """
+    Extracts and categorizes skills from text that arrives in pieces, such as
+    an uploaded file read in chunks. Skills split across pieces are still found
+    and memory use does not grow with the document size.
+
+    Args:
+        chunks (iterable): Consecutive pieces of the text (str).
+        snapshot (SkillSnapshot): Dictionaries to use (the current ones by default).
+        fuzzy (bool): Also match variants of skills (SKILL_MATCH_MODE by default).
+
+    Returns:
+        dict: Category name -> array of skill IDs, as extract_skill_ids returns.
+    """
+    fuzzy = _use_fuzzy(fuzzy)
+    stream = get_skill_matcher(snapshot, fuzzy).stream()
+    for tokens in (split_terms_stream if fuzzy else tokenize_stream)(chunks):
+        stream.feed(tokens)
+    return stream.ids
+
+
+def extract_skills_stream(chunks, snapshot=None, fuzzy=None):
+    """
+    Like extract_skill_ids_stream, but returns skill names.
+
+    Returns:
+        dict: A dictionary of extracted skills, categorized.
+    """
+    snapshot = snapshot or skill_store.snapshot()
+    extracted_skills = snapshot.registry.decode_skills(extract_skill_ids_stream(chunks, snapshot, fuzzy))
+    logging.debug("extract_skills_stream: %s", extracted_skills)
+    return extracted_skills
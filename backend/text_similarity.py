@@ -0,0 +1,333 @@
+import argparse
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+from collections import Counter
+
+from tokenizer import STOP_WORDS, cut_partial_word, normalize, split_tokens, tokenize
+
+
+# Terms and term pairs are hashed into this many buckets (a power of two)
+DIMENSION = 1 << 18
+
+
+def _configured_weight():
+    """
+    Reads SIMILARITY_WEIGHT: a number between 0 (off) and 1. Values outside that
+    range are clamped to it and anything else turns similarity off, so blended
+    scores always stay between 0 and 100.
+    """
+    value = os.environ.get('SIMILARITY_WEIGHT', '').strip() or '0'
+    try:
+        weight = float(value)
+    except ValueError:
+        weight = math.nan
+    if math.isnan(weight):
+        logging.error(f"text_similarity: Invalid SIMILARITY_WEIGHT value {value!r}. Similarity is off.")
+        return 0.0
+    if not 0 <= weight <= 1:
+        clamped = min(1.0, max(0.0, weight))
+        logging.warning(f"text_similarity: SIMILARITY_WEIGHT {weight} is outside 0-1. Using {clamped}.")
+        return clamped
+    return weight
+
+
+# Share of the blended score that comes from text similarity; 0 turns it off
+SIMILARITY_WEIGHT = _configured_weight()
+# IDF table written by `python text_similarity.py CORPUS...`
+SIMILARITY_IDF_PATH = os.environ.get('SIMILARITY_IDF_PATH', 'idf_table.bin')
+
+# File layout: magic, dimension, documents counted, then one little-endian float32 per bucket
+_HEADER = struct.Struct('<8sII')
+_MAGIC = b'JDAIDF01'
+
+
+# 1 + log(count) for small counts
+_SUBLINEAR = [0.0] + [1.0 + math.log(count) for count in range(1, 256)]
+# Token -> (CRC32 of the token, the token's bytes after a space), for the most common tokens
+_term_hashes = {}
+_TERM_HASHES_SIZE = 100000
+
+
+def _crc(token):
+    term = _term_hashes.get(token)
+    if term is None:
+        encoded = token.encode()
+        term = (zlib.crc32(encoded), b" " + encoded)
+        if len(_term_hashes) < _TERM_HASHES_SIZE:
+            _term_hashes[token] = term
+    return term
+
+
+class TermCounter:
+    """
+    Counts the hashed terms of a document: every word that is not a stop word,
+    and every pair of such consecutive words. Terms are hashed with CRC32,
+    which unlike hash() is the same in every process, so tables built offline
+    stay valid. Text can be added whole or in pieces (feed), e.g. while it is
+    being streamed to the skill extractor.
+    """
+
+    def __init__(self, dimension=DIMENSION):
+        self.dimension = dimension
+        self.counts = {}
+        self._previous = None
+        self._carry = ''
+
+    def add_tokens(self, tokens):
+        tokens = [token for token in tokens if token not in STOP_WORDS]
+        if not tokens:
+            return
+        counts = self.counts
+        mask = self.dimension - 1
+        # Count distinct terms first, so each one is hashed once per call
+        hashes = {}
+        for token, count in Counter(tokens).items():
+            hashes[token] = term = _crc(token)
+            index = term[0] & mask
+            counts[index] = counts.get(index, 0) + count
+        if self._previous is None:
+            firsts = tokens[:-1]
+        else:
+            firsts = [self._previous] + tokens[:-1]
+            hashes[self._previous] = _crc(self._previous)
+        for (first, second), count in Counter(zip(firsts, tokens[len(tokens) - len(firsts):])).items():
+            # CRC32 of "first second", continued from the CRC of "first"
+            index = zlib.crc32(hashes[second][1], hashes[first][0]) & mask
+            counts[index] = counts.get(index, 0) + count
+        self._previous = tokens[-1]
+
+    def add_text(self, text):
+        if isinstance(text, str):
+            self.add_tokens(tokenize(text))
+        self.end_document()
+
+    def feed(self, chunk):
+        """
+        Adds the next piece of a document; call end_document() after the last one.
+        """
+        complete, self._carry = cut_partial_word(self._carry + normalize(chunk))
+        if complete:
+            self.add_tokens(split_tokens(complete))
+
+    def end_document(self):
+        """
+        Flushes the partial word left by feed() and stops term pairs from
+        spanning into the next document added to this counter.
+        """
+        if self._carry:
+            self.add_tokens(split_tokens(self._carry))
+            self._carry = ''
+        self._previous = None
+
+    def tap(self, chunks):
+        """
+        Yields chunks unchanged while feeding them to this counter.
+        """
+        for chunk in chunks:
+            self.feed(chunk)
+            yield chunk
+        self.end_document()
+
+    def vector(self, idf=None):
+        """
+        Returns the L2-normalized TF-IDF vector, {bucket: weight}, with
+        sublinear term frequencies.
+
+        Args:
+            idf (IdfTable): Weights per bucket (get_idf_table() by default).
+        """
+        weights = (idf or get_idf_table()).weights
+        vector = {
+            index: (_SUBLINEAR[count] if count < len(_SUBLINEAR) else 1.0 + math.log(count)) * weights[index]
+            for index, count in self.counts.items()
+        }
+        norm = math.hypot(*vector.values())
+        if norm:
+            scale = 1.0 / norm
+            vector = {index: value * scale for index, value in vector.items()}
+        return vector
+
+
+class IdfTable:
+    """
+    Inverse document frequency per bucket, memory-mapped read-only from a
+    file written by build_idf_table(). Pages are shared with every other
+    process mapping the same file, so worker processes hold no copy of it.
+    """
+
+    def __init__(self, path):
+        """
+        Raises:
+            ValueError: If the file is not an IDF table.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{path} is not an IDF table")
+        magic, self.dimension, self.documents = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC or len(self._mmap) != _HEADER.size + 4 * self.dimension:
+            raise ValueError(f"{path} is not an IDF table")
+        self.weights = memoryview(self._mmap)[_HEADER.size:].cast('f')
+        if sys.byteorder != 'little':
+            # The file is little-endian; big-endian hosts need their own (unshared) copy
+            self.weights = array('f', self.weights)
+            self.weights.byteswap()
+
+    @classmethod
+    def uniform(cls, dimension=DIMENSION):
+        """
+        Returns a table weighting every bucket 1.0 (plain term frequencies),
+        for when no IDF table has been built.
+        """
+        table = cls.__new__(cls)
+        table.path = None
+        table.dimension = dimension
+        table.documents = 0
+        table.weights = array('f', [1.0]) * dimension
+        return table
+
+
+_idf_table = None
+
+
+def get_idf_table():
+    """
+    Returns the IDF table from SIMILARITY_IDF_PATH, mapping it on first use.
+    Falls back to uniform weights if the file is missing or invalid.
+    """
+    global _idf_table
+    if _idf_table is None:
+        try:
+            _idf_table = IdfTable(SIMILARITY_IDF_PATH)
+            logging.info(f"text_similarity: mapped IDF table of {_idf_table.documents} documents from {SIMILARITY_IDF_PATH}")
+        except (OSError, ValueError) as e:
+            logging.warning(f"text_similarity: No IDF table ({e}). Using term frequencies only.")
+            _idf_table = IdfTable.uniform()
+    return _idf_table
+
+
+def enabled():
+    """Whether results carry a similarity score (SIMILARITY_WEIGHT > 0)."""
+    return SIMILARITY_WEIGHT > 0
+
+
+def text_vector(*texts):
+    """
+    Returns the TF-IDF vector of one or more texts taken as one document.
+    Texts that are not strings are ignored.
+    """
+    counter = TermCounter(get_idf_table().dimension)
+    for text in texts:
+        counter.add_text(text)
+    return counter.vector()
+
+
+def cosine(a, b):
+    """
+    Returns the cosine similarity of two normalized vectors (0 to 1).
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(value * b.get(index, 0.0) for index, value in a.items())
+
+
+def blend(result, similarity):
+    """
+    Adds 'similarityPercentage' and 'blendedPercentage' (the skill match
+    percentage and the similarity, mixed by SIMILARITY_WEIGHT) to an analysis result.
+    """
+    result["similarityPercentage"] = round(similarity * 100)
+    result["blendedPercentage"] = round(
+        (1 - SIMILARITY_WEIGHT) * result["matchPercentage"] + SIMILARITY_WEIGHT * similarity * 100
+    )
+    return result
+
+
+def build_idf_table(documents, path, dimension=DIMENSION):
+    """
+    Computes smoothed IDF weights, log((1 + N) / (1 + df)) + 1, over a corpus
+    and writes them to path. The file is replaced atomically, so processes
+    that mapped the previous table keep reading a consistent one.
+
+    Args:
+        documents (iterable): The corpus, one str per document.
+        path (str): Where to write the table.
+        dimension (int): Number of buckets (a power of two).
+
+    Returns:
+        int: The number of documents counted.
+    """
+    if dimension & (dimension - 1):
+        raise ValueError("dimension must be a power of two")
+    frequencies = array('I', [0]) * dimension
+    count = 0
+    for text in documents:
+        counter = TermCounter(dimension)
+        counter.add_text(text)
+        for index in counter.counts:
+            frequencies[index] += 1
+        count += 1
+    weights = array('f', (math.log((1 + count) / (1 + df)) + 1 for df in frequencies))
+    if sys.byteorder != 'little':
+        weights.byteswap()
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, dimension, count))
+        f.write(weights.tobytes())
+    os.replace(temporary, path)
+    return count
+
+
+def iter_corpus(paths):
+    """
+    Yields the documents under the given files and directories: every .txt,
+    .md, .docx or .pdf file is one document, and every line of a .jsonl file
+    is one (its string values joined).
+    """
+    from document_reader import UnsupportedDocument, iter_document_text
+
+    for root in paths:
+        if os.path.isdir(root):
+            files = sorted(os.path.join(folder, name) for folder, _, names in os.walk(root) for name in names)
+        else:
+            files = [root]
+        for file_path in files:
+            extension = os.path.splitext(file_path)[1].lower()
+            if extension == '.jsonl':
+                with open(file_path, encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            values = record.values() if isinstance(record, dict) else [record]
+                            yield "\n".join(value for value in values if isinstance(value, str))
+            elif extension in ('.txt', '.md', '.docx', '.pdf'):
+                try:
+                    with open(file_path, 'rb') as f:
+                        yield "".join(iter_document_text(file_path, f))
+                except UnsupportedDocument as e:
+                    logging.error(f"text_similarity: Skipping {file_path}: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Builds the IDF table used for text similarity.")
+    parser.add_argument('corpus', nargs='+', help='files or directories of job descriptions and resumes')
+    parser.add_argument('--output', default=SIMILARITY_IDF_PATH, help='where to write the table')
+    parser.add_argument('--dimension', type=int, default=DIMENSION, help='number of hash buckets (power of two)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = build_idf_table(iter_corpus(args.corpus), args.output, args.dimension)
+    print(f"wrote {args.output}: {count} documents, {args.dimension} buckets in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
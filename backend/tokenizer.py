@@ -0,0 +1,198 @@
+import logging
+import os
+import re
+
+
+# NLTK's English stop word list (nltk 3.8.1), bundled so startup needs no corpus download
+STOP_WORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours yourself
+yourselves he him his himself she she's her hers herself it it's its itself they them their
+theirs themselves what which who whom this that that'll these those am is are was were be
+been being have has had having do does did doing a an the and but if or because as until
+while of at by for with about against between into through during before after above below
+to from up down in out on off over under again further then once here there when where why
+how all any both each few more most other some such no nor not only own same so than too
+very s t can will just don don't should should've now d ll m o re ve y ain aren aren't
+couldn couldn't didn didn't doesn doesn't hadn hadn't hasn hasn't haven haven't isn isn't ma
+mightn mightn't mustn mustn't needn needn't shan shan't shouldn shouldn't wasn wasn't weren
+weren't won won't wouldn wouldn't
+""".split())
+
+# Everything except letters, digits, '+' (for C++), '#' (for C#), '-' and whitespace
+# is dropped; split_tokens trims the '#' and '-' that are not inside a word
+_STRIP_PATTERN = re.compile(r"[^a-zA-Z0-9\+#\-\s]")
+
+# Runs of letters, digits, '+' and '#' (for C++ and C#), joined by inner dots
+# ("node.js"); everything else separates terms
+_TERM_PATTERN = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+_TERM_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#.")
+
+# 'builtin' (default) splits on whitespace; 'nltk' uses nltk.word_tokenize
+TOKENIZER = os.environ.get('SKILLS_TOKENIZER', 'builtin').strip().lower()
+
+_word_tokenize = None
+# word_tokenize splits '#' off a word, so "c#" is disguised as one word for it
+_SHARP_PATTERN = re.compile(r"(?<=[a-z0-9+])#")
+_SHARP_PLACEHOLDER = "zqsharpzq"
+
+
+def _nltk_word_tokenize():
+    global _word_tokenize
+    if _word_tokenize is None:
+        from nltk.tokenize import word_tokenize
+        _word_tokenize = word_tokenize
+    return _word_tokenize
+
+
+def tokenize(text, use_nltk=None):
+    """
+    Lowercases, strips punctuation and tokenizes text.
+
+    Only letters, digits, '+' and whitespace remain, plus '#' after a word
+    ("c#") and '-' inside one ("object-oriented"), so a symbol that is part
+    of a skill never disappears and leaves a different word behind ("c#" is
+    not "c"). Other punctuation is deleted, so "Node.js" is 'nodejs' and
+    "CI/CD" is 'cicd'. NLTK is only imported when SKILLS_TOKENIZER=nltk or
+    use_nltk=True, and is kept from splitting '#' off a word.
+
+    Args:
+        text (str): The text to tokenize.
+        use_nltk (bool): Overrides SKILLS_TOKENIZER for this call.
+
+    Returns:
+        list: The tokens.
+    """
+    return split_tokens(normalize(text), use_nltk)
+
+
+def normalize(text):
+    """
+    Lowercases text and strips everything but letters, digits, '+', '#', '-'
+    and whitespace.
+    """
+    return _STRIP_PATTERN.sub('', text.lower())
+
+
+def split_tokens(text, use_nltk=None):
+    """
+    Splits already normalized text into tokens, dropping '#' at the start of
+    a token and '-' at either end.
+    """
+    if use_nltk is None:
+        use_nltk = TOKENIZER == 'nltk'
+    if use_nltk:
+        tokens = [
+            token.replace(_SHARP_PLACEHOLDER, '#')
+            for token in _nltk_word_tokenize()(_SHARP_PATTERN.sub(_SHARP_PLACEHOLDER, text))
+        ]
+    else:
+        tokens = text.split()
+    if '#' not in text and '-' not in text:
+        return tokens
+    trimmed = []
+    for token in tokens:
+        token = token.lstrip('#').strip('-')
+        if token:
+            trimmed.append(token)
+    return trimmed
+
+
+# Longest run of non-space characters carried from one chunk to the next
+MAX_WORD_LENGTH = 1000
+
+
+def tokenize_stream(chunks, use_nltk=None):
+    """
+    Tokenizes text that arrives in pieces, like tokenize() on the joined text.
+
+    A word cut by a chunk boundary is held back and completed with the start
+    of the next chunk, so only one chunk and one partial word are in memory.
+
+    Args:
+        chunks (iterable): Consecutive pieces of the text (str).
+        use_nltk (bool): Overrides SKILLS_TOKENIZER for this call.
+
+    Yields:
+        list: The tokens completed by each chunk.
+    """
+    carry = ''
+    for chunk in chunks:
+        complete, carry = cut_partial_word(carry + normalize(chunk))
+        if complete:
+            yield split_tokens(complete, use_nltk)
+    if carry:
+        yield split_tokens(carry, use_nltk)
+
+
+def cut_partial_word(text):
+    """
+    Splits normalized text at its last whitespace, into the part that ends
+    with complete words and the (possibly partial) word after it, capped at
+    MAX_WORD_LENGTH characters.
+
+    Returns:
+        tuple: (complete text, partial word).
+    """
+    cut = len(text)
+    while cut and not text[cut - 1].isspace():
+        cut -= 1
+    return text[:cut], text[cut:][-MAX_WORD_LENGTH:]
+
+
+def split_terms(text):
+    """
+    Lowercases text and splits it into terms for fuzzy matching.
+
+    Unlike tokenize(), punctuation such as '-' and '/' separates terms instead
+    of being deleted and '#' is kept, so "C#" stays 'c#'. Dots inside a word are
+    dropped ("Node.js" -> 'nodejs'). The fuzzy matcher joins neighbouring terms
+    again, so "scikit-learn", "scikit learn" and "scikitlearn" all reach the
+    same skill.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        list: The terms.
+    """
+    terms = []
+    for term in _TERM_PATTERN.findall(text.lower()):
+        term = term.replace('.', '').lstrip('+#')
+        if term:
+            terms.append(term)
+    return terms
+
+
+def split_terms_stream(chunks):
+    """
+    Like split_terms() on the joined text, for text that arrives in pieces
+    (see tokenize_stream).
+
+    Yields:
+        list: The terms completed by each chunk.
+    """
+    carry = ''
+    for chunk in chunks:
+        text = carry + chunk.lower()
+        cut = len(text)
+        while cut and text[cut - 1] in _TERM_CHARS:
+            cut -= 1
+        carry = text[cut:][-MAX_WORD_LENGTH:]
+        if cut:
+            yield split_terms(text[:cut])
+    if carry:
+        yield split_terms(carry)
+
+
+if TOKENIZER not in ('builtin', 'nltk'):
+    logging.error(f"tokenizer: Unknown SKILLS_TOKENIZER {TOKENIZER!r}. Using the builtin tokenizer.")
+    TOKENIZER = 'builtin'
+elif TOKENIZER == 'nltk':
+    # Opting in without NLTK (or its punkt data) would make every extraction fail
+    try:
+        _nltk_word_tokenize()("probe")
+    except (ImportError, LookupError) as e:
+        raise RuntimeError(
+            "tokenizer: SKILLS_TOKENIZER=nltk needs the nltk package and its 'punkt' data "
+            "(pip install nltk && python -m nltk.downloader punkt)"
+        ) from e
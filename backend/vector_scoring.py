@@ -0,0 +1,226 @@
+# Vectorized match_skills scoring for bulk screening (needs numpy and scipy, see
+# requirements-optional.txt).
+# Candidates are rows of a sparse binary matrix over (category, skill) columns and
+# job descriptions are columns of a second sparse matrix holding how often each job
+# lists a skill, so a sparse product yields the matched-skill counts of every
+# candidate x job pair (duplicates in a job counted like match_skills counts them).
+# The arithmetic after that follows match_skills operation by operation, including
+# a category the job lacks (or that is not a list) scoring 0, so scores equal the
+# scalar path exactly. Candidates may also carry the partial credit of
+# explicitly weighted alternatives (see encode_candidates), as /analyze does.
+import numpy as np
+from scipy import sparse
+
+from skill_store import SKILL_CATEGORIES
+
+
+MATCH_LEVELS = ("Poor", "Fair", "Good", "Perfect")
+
+
+class SkillVocabulary:
+    """
+    Assigns a column to every (category, skill) pair seen.
+    """
+
+    def __init__(self):
+        self.columns = {}
+
+    def __len__(self):
+        return len(self.columns)
+
+    def column(self, category, skill):
+        key = (category, skill)
+        index = self.columns.get(key)
+        if index is None:
+            index = self.columns[key] = len(self.columns)
+        return index
+
+
+def encode_candidates(candidate_skills_list, vocabulary, credits_list=None):
+    """
+    Encodes candidates as rows of a sparse matrix: 1 for every skill they
+    have, and the partial credit of every skill they only have an explicitly
+    weighted alternative for (in every category, as analyze_match credits it).
+
+    Args:
+        candidate_skills_list (list): Categorized skills per candidate.
+        vocabulary (SkillVocabulary): Shared column assignment.
+        credits_list (list): Skill -> partial credit per candidate, as
+                             analyzer.alternative_credits returns (none by default).
+
+    Returns:
+        scipy.sparse.csr_matrix: n_candidates x len(vocabulary) (may grow later;
+        use fit_columns before multiplying).
+    """
+    indptr = [0]
+    indices = []
+    data = []
+    for candidate_index, skills in enumerate(candidate_skills_list):
+        row = {vocabulary.column(c, skill): 1.0 for c in SKILL_CATEGORIES for skill in skills.get(c, [])}
+        if credits_list is not None:
+            for skill, credit in credits_list[candidate_index].items():
+                for c in SKILL_CATEGORIES:
+                    row.setdefault(vocabulary.column(c, skill), credit)
+        indices.extend(row)
+        data.extend(row.values())
+        indptr.append(len(indices))
+    data = np.array(data, dtype=np.float64)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(candidate_skills_list), len(vocabulary)))
+
+
+class JobMatrix:
+    """
+    Job descriptions as per-category skill columns plus the skill counts that
+    match_skills divides by, and which jobs list each category at all.
+    """
+
+    def __init__(self, job_skills_list, vocabulary):
+        self.count = len(job_skills_list)
+        self.sizes = {}
+        self.listed = {}
+        self._entries = {}
+        for category in SKILL_CATEGORIES:
+            rows, cols, counts, sizes, listed = [], [], [], [], []
+            for job_index, skills in enumerate(job_skills_list):
+                found = skills.get(category)
+                # match_skills scores a missing (or non-list) category 0
+                listed.append(isinstance(found, list))
+                found = found if isinstance(found, list) else []
+                sizes.append(len(found))
+                occurrences = {}
+                for skill in found:
+                    occurrences[skill] = occurrences.get(skill, 0) + 1
+                for skill, count in occurrences.items():
+                    rows.append(vocabulary.column(category, skill))
+                    cols.append(job_index)
+                    counts.append(count)
+            self.sizes[category] = np.array(sizes, dtype=np.float64)
+            self.listed[category] = np.array(listed, dtype=bool)
+            self._entries[category] = (rows, cols, counts)
+        self.vocabulary = vocabulary
+
+    def category_matrix(self, category):
+        rows, cols, counts = self._entries[category]
+        data = np.array(counts, dtype=np.float64)
+        return sparse.csc_matrix((data, (rows, cols)), shape=(len(self.vocabulary), self.count))
+
+
+def fit_columns(matrix, width):
+    """
+    Pads a candidate matrix with empty columns up to the vocabulary width.
+    """
+    if matrix.shape[1] == width:
+        return matrix
+    matrix = matrix.tocsr(copy=True)
+    matrix.resize((matrix.shape[0], width))
+    return matrix
+
+
+def match_levels(scores):
+    """
+    Vectorized get_match_level.
+
+    Returns:
+        numpy.ndarray: Indices into MATCH_LEVELS.
+    """
+    return (scores >= 50).astype(np.int8) + (scores >= 70) + (scores >= 90)
+
+
+def iter_score_blocks(job_skills_list, candidate_skills_list, weights, block_size=256, credits_list=None):
+    """
+    Scores every candidate against every job, a block of jobs at a time.
+
+    Args:
+        job_skills_list (list): Categorized skills per job description.
+        candidate_skills_list (list): Categorized skills per candidate.
+        weights (dict): Weights for each skill category.
+        block_size (int): Jobs per block; bounds memory at
+                          n_candidates x block_size per category.
+        credits_list (list): Alternative credits per candidate (see
+                             encode_candidates); without them scores equal
+                             match_skills exactly.
+
+    Yields:
+        tuple: (slice of jobs, {category: scores}, overall scores), where each
+               array is n_candidates x jobs-in-block, equal to the scores
+               match_skills returns for the same pair.
+    """
+    vocabulary = SkillVocabulary()
+    jobs = JobMatrix(job_skills_list, vocabulary)
+    candidates = encode_candidates(candidate_skills_list, vocabulary, credits_list)
+    candidates = fit_columns(candidates, len(vocabulary))
+    category_matrices = {category: jobs.category_matrix(category) for category in SKILL_CATEGORIES}
+    total_weight = sum(weights.values())
+
+    for start in range(0, jobs.count, block_size):
+        block = slice(start, min(start + block_size, jobs.count))
+        scores = {}
+        overall = None
+        for category in SKILL_CATEGORIES:
+            matched = (candidates @ category_matrices[category][:, block]).toarray()
+            sizes = jobs.sizes[category][block]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                score = (matched / sizes) * 100
+            score[:, sizes == 0] = 100
+            score[:, ~jobs.listed[category][block]] = 0
+            scores[category] = score
+            # Same accumulation order as match_skills, starting from 0
+            weighted = score * weights.get(category, 0)
+            overall = weighted if overall is None else overall + weighted
+        if total_weight == 0:
+            # match_skills returns all-zero results in this case
+            scores = {category: np.zeros_like(overall) for category in SKILL_CATEGORIES}
+            overall = np.zeros_like(overall)
+        else:
+            overall = overall / total_weight
+        yield block, scores, overall
+
+
+def score_matrix(job_skills_list, candidate_skills_list, weights, credits_list=None):
+    """
+    Scores every candidate against every job in one go (for small inputs).
+
+    Returns:
+        dict: 'scores' {category: n_candidates x n_jobs}, 'overall_score' and
+              'matchLevel' (indices into MATCH_LEVELS), all n_candidates x n_jobs.
+    """
+    n_candidates = len(candidate_skills_list)
+    n_jobs = len(job_skills_list)
+    scores = {category: np.zeros((n_candidates, n_jobs)) for category in SKILL_CATEGORIES}
+    overall = np.zeros((n_candidates, n_jobs))
+    for block, block_scores, block_overall in iter_score_blocks(
+        job_skills_list, candidate_skills_list, weights, credits_list=credits_list
+    ):
+        for category in SKILL_CATEGORIES:
+            scores[category][:, block] = block_scores[category]
+        overall[:, block] = block_overall
+    return {"scores": scores, "overall_score": overall, "matchLevel": match_levels(overall)}
+
+
+def top_candidates(job_skills_list, candidate_skills_list, weights, k=10, block_size=256, credits_list=None):
+    """
+    Finds the k best candidates for each job by overall score.
+
+    Returns:
+        list: One list per job of (candidate index, overall score, match level)
+              tuples, best first.
+    """
+    results = []
+    for block, _, overall in iter_score_blocks(
+        job_skills_list, candidate_skills_list, weights, block_size, credits_list
+    ):
+        k_eff = min(k, overall.shape[0])
+        if k_eff == 0:
+            results.extend([] for _ in range(overall.shape[1]))
+            continue
+        best = np.argpartition(-overall, k_eff - 1, axis=0)[:k_eff]
+        for column in range(overall.shape[1]):
+            rows = best[:, column]
+            rows = rows[np.lexsort((rows, -overall[rows, column]))]
+            scores = overall[rows, column]
+            levels = match_levels(scores)
+            results.append([
+                (int(row), float(score), MATCH_LEVELS[level])
+                for row, score, level in zip(rows, scores, levels)
+            ])
+    return results
@@ -0,0 +1,182 @@
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import metrics
+
+
+def _configured_workers():
+    """
+    Reads ANALYZER_WORKERS: unset or 0 runs analysis in the request thread,
+    'auto' uses one worker per CPU core, any other number is used as is.
+    """
+    value = os.environ.get('ANALYZER_WORKERS', '0').strip().lower()
+    if value == 'auto':
+        return os.cpu_count() or 1
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logging.error(f"worker_pool: Invalid ANALYZER_WORKERS value {value!r}. Running in-process.")
+        return 0
+
+
+def _init_worker(dictionaries=None):
+    """
+    Runs once in every worker process: compiles the skill matcher and exercises
+    the tokenizer so the first real request is not slowed down by lazy
+    initialization.
+
+    Args:
+        dictionaries (tuple): The parent's in-memory dictionaries (see
+                              SkillStore.export), for workers that were not
+                              forked from it and so did not inherit them.
+    """
+    import text_similarity
+    from skills_extractor import extract_skills, get_skill_matcher, skill_store
+
+    if dictionaries is not None and not skill_store.persistent:
+        skill_store.adopt(dictionaries)
+    get_skill_matcher()
+    extract_skills("python warm up")
+    if text_similarity.enabled():
+        text_similarity.get_idf_table()
+
+
+def _ping():
+    return os.getpid()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+num_workers = _configured_workers()
+
+
+def _start_method():
+    # Fork so workers inherit the parent's state cheaply, but only from the main
+    # thread: forking while request threads hold locks can deadlock the child
+    methods = multiprocessing.get_all_start_methods()
+    if 'fork' in methods and threading.current_thread() is threading.main_thread():
+        return 'fork'
+    return 'forkserver' if 'forkserver' in methods else 'spawn'
+
+
+def create_pool(workers, initializer=_init_worker, initargs=()):
+    """
+    Starts a process pool of its own, e.g. for a batch job, with every worker
+    already running.
+
+    Args:
+        workers (int): Number of worker processes.
+        initializer (callable): Run once in every worker (warms up the matcher by default).
+        initargs (tuple): Arguments for the initializer.
+
+    Returns:
+        ProcessPoolExecutor: The pool.
+    """
+    context = multiprocessing.get_context(_start_method())
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=initializer, initargs=initargs)
+    # Make every worker start (and run its initializer) before taking traffic
+    for future in [pool.submit(_ping) for _ in range(workers)]:
+        future.result()
+    return pool
+
+
+def _start_pool():
+    from skills_extractor import skill_store
+
+    # Workers that are not forked get the in-memory dictionaries (feedback included) passed in
+    pool = create_pool(num_workers, _init_worker, (skill_store.export(),))
+    logging.info(f"worker_pool: started {num_workers} worker processes")
+    return pool
+
+
+def get_pool():
+    """
+    Returns the shared process pool, starting it on first use.
+
+    Returns:
+        ProcessPoolExecutor: The pool, or None when running in-process.
+    """
+    global _pool
+    if num_workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = _start_pool()
+        return _pool
+
+
+def restart_pool():
+    """
+    Replaces the workers so they pick up skill dictionaries changed in memory
+    (a persistent skill store is reloaded by the workers themselves). In-flight
+    tasks on the old pool are allowed to finish; the new pool starts on the
+    next submit, without fork when that comes from a request thread.
+    """
+    global _pool
+    with _pool_lock:
+        old, _pool = _pool, None
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def submit(fn, *args, **kwargs):
+    """
+    Submits a call to the worker pool and returns its Future. If /feedback
+    replaced the pool between fetching and submitting, the call goes to the
+    new pool instead.
+
+    Returns:
+        Future: The call's future, or None when running in-process.
+    """
+    pool = get_pool()
+    if pool is None:
+        return None
+    try:
+        return pool.submit(fn, *args, **kwargs)
+    except RuntimeError:
+        # "cannot schedule new futures after shutdown": restart_pool() retired it
+        pool = get_pool()
+        if pool is None:
+            raise
+        return pool.submit(fn, *args, **kwargs)
+
+
+def run_in_pool(fn, *args, **kwargs):
+    """
+    Runs a module-level function in the worker pool, or directly when the pool
+    is disabled, and returns its result. Stage timings recorded in the worker
+    are sent back and recorded in this process.
+    """
+    future = submit(metrics.collect, fn, *args, **kwargs)
+    if future is None:
+        return fn(*args, **kwargs)
+    result, samples = future.result()
+    metrics.replay(samples)
+    return result
+
+
+def map_in_pool(fn, calls):
+    """
+    Runs a module-level function once per argument tuple, spread over the
+    worker pool (or in this process when the pool is disabled), and returns
+    the results in order. Stage timings are recorded as in run_in_pool.
+
+    Args:
+        fn (callable): The function.
+        calls (list): Argument tuples, one per call.
+
+    Returns:
+        list: The results of the calls.
+    """
+    futures = [submit(metrics.collect, fn, *args) for args in calls]
+    if futures and futures[0] is None:
+        return [fn(*args) for args in calls]
+    results = []
+    for future in futures:
+        result, samples = future.result()
+        metrics.replay(samples)
+        results.append(result)
+    return results